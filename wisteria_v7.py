@@ -15,6 +15,9 @@ Where:
     - --model: The shortname of the model to use from model_servers.yaml
     - --num-hypotheses: Number of initial hypotheses to generate (default: 1)
     - --output: Output JSON file for the hypotheses (default: hypotheses_<timestamp>.json)
+    - --no-cache / --cache-nondeterministic: Skip the model response cache, or extend it to sampled responses
+      (generation and improvement requests are sampled, so they are only cached with --cache-nondeterministic)
+    - --batch: Generate the initial hypotheses through the provider Batch API and save them, without the interface
 
 Examples:
     python curses_wisteria_v6.py research_goal.txt --model gpt41
@@ -75,15 +78,19 @@ Current strategy status is shown in the status bar.
 
 import sys
 import os
+import io
 import json
+import hashlib
+import importlib.util
+import sqlite3
 import argparse
 import yaml
 import time
 import openai
-import random
 from datetime import datetime
 import backoff
 import difflib
+import functools
 import re
 import curses
 import textwrap
@@ -92,23 +99,28 @@ import urllib.request
 import urllib.parse
 import urllib.error
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-import queue
+import heapq
+import itertools
 import uuid
 from enum import Enum
-from dataclasses import dataclass
 from typing import Callable, Any, Optional, Dict
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from xml.sax.saxutils import escape as xml_escape
 
-# PDF generation imports
+# PDF generation uses ReportLab, which is only imported when a PDF is made;
+# checking for it here doesn't import it
+PDF_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+# Optional fast JSON encoder for the session journal
 try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib.colors import HexColor
-    PDF_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PDF_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # ---------------------------------------------------------------------
 # Asynchronous Task Queue System
@@ -127,35 +139,54 @@ class TaskPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
-@dataclass
 class Task:
-    id: str
-    name: str
-    priority: TaskPriority
-    func: Callable
-    args: tuple
-    kwargs: dict
-    status: TaskStatus = TaskStatus.PENDING
-    result: Any = None
-    error: Optional[Exception] = None
-    progress: float = 0.0
-    created_at: float = None
-    started_at: Optional[float] = None
-    completed_at: Optional[float] = None
-    
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = time.time()
+    """A queued unit of work.
+    
+    Uses __slots__ to avoid a per-instance __dict__. Timestamps are
+    time.monotonic_ns() values, so durations are immune to wall-clock changes.
+    """
+    __slots__ = ("id", "name", "priority", "func", "args", "kwargs", "status",
+                 "result", "error", "progress", "created_at", "started_at", "completed_at")
+    
+    def __init__(self, id: str, name: str, priority: TaskPriority, func: Callable,
+                 args: tuple, kwargs: dict, status: TaskStatus = TaskStatus.PENDING,
+                 result: Any = None, error: Optional[Exception] = None, progress: float = 0.0,
+                 created_at: Optional[int] = None, started_at: Optional[int] = None,
+                 completed_at: Optional[int] = None):
+        self.id = id
+        self.name = name
+        self.priority = priority
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.status = status
+        self.result = result
+        self.error = error
+        self.progress = progress
+        self.created_at = time.monotonic_ns() if created_at is None else created_at
+        self.started_at = started_at
+        self.completed_at = completed_at
 
 class TaskQueue:
-    def __init__(self, max_workers=3):
-        self.task_queue = queue.PriorityQueue()
+    def __init__(self, max_workers=3, max_io_workers=4, on_state_change=None):
+        # Pending (priority, sequence, task_id) entries; the sequence keeps FIFO order within a priority
+        self._heap = []
+        self._counter = itertools.count()
         self.tasks: Dict[str, Task] = {}
         self.max_workers = max_workers
         self.workers = []
         self.running = False
+        # A single lock guards the heap, tasks and callbacks; workers wait on the condition
         self.lock = threading.Lock()
+        self._cv = threading.Condition(self.lock)
         self.callbacks = {}  # Task completion callbacks
+        # Called with no arguments whenever a task starts or finishes
+        self.on_state_change = on_state_change
+        
+        # Separate bounded pool for I/O-bound tasks, so a long fetch never
+        # holds one of the workers that scoring and generation use
+        self.max_io_workers = max_io_workers
+        self._io_executor = None
         
     def start(self):
         """Start the worker threads"""
@@ -163,6 +194,7 @@ class TaskQueue:
             return
         
         self.running = True
+        self._io_executor = ThreadPoolExecutor(max_workers=self.max_io_workers, thread_name_prefix="TaskIO")
         for i in range(self.max_workers):
             worker = threading.Thread(target=self._worker, name=f"TaskWorker-{i}")
             worker.daemon = True
@@ -171,57 +203,80 @@ class TaskQueue:
     
     def stop(self):
         """Stop all workers"""
-        self.running = False
-        for _ in range(self.max_workers):
-            self.task_queue.put((0, None))  # Poison pill
+        with self._cv:
+            self.running = False
+            self._cv.notify_all()
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _notify_state_change(self):
+        if self.on_state_change:
+            try:
+                self.on_state_change()
+            except Exception:
+                pass
+    
+    def _run_callback(self, task):
+        """Run the completion callback for a task, if one was registered"""
+        callback = self.callbacks.get(task.id)
+        if callback:
+            try:
+                callback(task)
+            except Exception:
+                pass  # Don't let callback errors break the worker
+    
+    def _execute(self, task):
+        """Run a task, record its outcome and fire its callback"""
+        if task.status == TaskStatus.CANCELLED:
+            return
+        
+        task.status = TaskStatus.RUNNING
+        task.started_at = time.monotonic_ns()
+        self._notify_state_change()
+        
+        try:
+            result = task.func(*task.args, **task.kwargs)
+            task.result = result
+            task.status = TaskStatus.COMPLETED
+            task.progress = 1.0
+        except Exception as e:
+            task.error = e
+            task.status = TaskStatus.FAILED
+        finally:
+            task.completed_at = time.monotonic_ns()
+        
+        self._notify_state_change()
+            
+        # Run callback if exists
+        self._run_callback(task)
     
     def _worker(self):
         """Worker thread that processes tasks"""
-        while self.running:
+        while True:
             try:
-                priority, task_id = self.task_queue.get(timeout=1)
-                if task_id is None:  # Poison pill
-                    break
-                    
-                with self.lock:
-                    if task_id not in self.tasks:
-                        continue
-                    task = self.tasks[task_id]
-                    
-                if task.status == TaskStatus.CANCELLED:
-                    continue
-                
-                # Execute task
-                task.status = TaskStatus.RUNNING
-                task.started_at = time.time()
+                with self._cv:
+                    while not self._heap and self.running:
+                        self._cv.wait(timeout=1)
+                    if not self.running:
+                        break
+                    _, _, task_id = heapq.heappop(self._heap)
+                    task = self.tasks.get(task_id)
                 
-                try:
-                    result = task.func(*task.args, **task.kwargs)
-                    task.result = result
-                    task.status = TaskStatus.COMPLETED
-                    task.progress = 1.0
-                except Exception as e:
-                    task.error = e
-                    task.status = TaskStatus.FAILED
-                finally:
-                    task.completed_at = time.time()
-                    
-                # Run callback if exists
-                if task_id in self.callbacks:
-                    try:
-                        self.callbacks[task_id](task)
-                    except Exception:
-                        pass  # Don't let callback errors break the worker
+                if task is not None:
+                    self._execute(task)
                         
-            except queue.Empty:
-                continue
             except Exception:
                 continue
     
     def submit_task(self, name: str, func: Callable, *args, 
                    priority: TaskPriority = TaskPriority.MEDIUM,
-                   callback: Optional[Callable] = None, **kwargs) -> str:
-        """Submit a task to the queue"""
+                   callback: Optional[Callable] = None, io_bound: bool = False, **kwargs) -> str:
+        """Submit a task to the queue.
+        
+        Tasks are executed by the worker threads in priority order. io_bound
+        tasks (network fetches) run on the queue's separate I/O pool instead,
+        at most max_io_workers at a time.
+        """
         task_id = str(uuid.uuid4())
         task = Task(
             id=task_id,
@@ -232,14 +287,18 @@ class TaskQueue:
             kwargs=kwargs
         )
         
-        with self.lock:
+        with self._cv:
             self.tasks[task_id] = task
             if callback:
                 self.callbacks[task_id] = callback
+            if not io_bound:
+                # Higher priority = lower number for queue ordering
+                queue_priority = 5 - priority.value
+                heapq.heappush(self._heap, (queue_priority, next(self._counter), task_id))
+                self._cv.notify()
         
-        # Higher priority = lower number for queue ordering
-        queue_priority = 5 - priority.value
-        self.task_queue.put((queue_priority, task_id))
+        if io_bound:
+            self._io_executor.submit(self._execute, task)
         
         return task_id
     
@@ -271,12 +330,13 @@ class TaskQueue:
     
     def cleanup_completed_tasks(self, max_age_seconds: int = 3600):
         """Clean up old completed tasks"""
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
+        max_age_ns = max_age_seconds * 1_000_000_000
         with self.lock:
             to_remove = []
             for task_id, task in self.tasks.items():
                 if (task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED] and
-                    task.completed_at and current_time - task.completed_at > max_age_seconds):
+                    task.completed_at and now_ns - task.completed_at > max_age_ns):
                     to_remove.append(task_id)
             
             for task_id in to_remove:
@@ -290,9 +350,10 @@ class TaskQueue:
 
 class HypothesisStrategy:
     """Individual hypothesis generation strategy"""
-    def __init__(self, name, key, description, prompt_addition):
+    def __init__(self, name, key, description, prompt_addition, index):
         self.name = name
         self.key = key
+        self.index = index  # Bit position in HypothesisStrategyManager.active_strategies
         self.description = description
         self.prompt_addition = prompt_addition
 
@@ -302,113 +363,145 @@ HYPOTHESIS_STRATEGIES = {
         name="Boundary-Pushing",
         key="1",
         description="Challenge assumptions and push boundaries",
-        prompt_addition="Formulate hypotheses that explicitly challenge conventional understanding or integrate concepts from distinct and unexpected scientific domains."
+        prompt_addition="Formulate hypotheses that explicitly challenge conventional understanding or integrate concepts from distinct and unexpected scientific domains.",
+        index=0
     ),
     "human_curiosity": HypothesisStrategy(
         name="Human Curiosity",
         key="2", 
         description="Emphasize surprising and intriguing outcomes",
-        prompt_addition="Suggest hypotheses that, if confirmed, would be surprising, intriguing, or counterintuitive to scientists in this field, sparking further curiosity and exploration."
+        prompt_addition="Suggest hypotheses that, if confirmed, would be surprising, intriguing, or counterintuitive to scientists in this field, sparking further curiosity and exploration.",
+        index=1
     ),
     "real_world_impact": HypothesisStrategy(
         name="Real-World Impact",
         key="3",
         description="Focus on practical implications and societal benefits",
-        prompt_addition="Each hypothesis should clearly articulate its potential impact on society, medicine, technology, or fundamental understanding, highlighting why confirmation would be significant."
+        prompt_addition="Each hypothesis should clearly articulate its potential impact on society, medicine, technology, or fundamental understanding, highlighting why confirmation would be significant.",
+        index=2
     ),
     "analogical_thinking": HypothesisStrategy(
         name="Analogical Thinking",
         key="4",
         description="Use creative analogies and metaphors",
-        prompt_addition="Use creative analogies, metaphors, or comparisons from everyday life or unrelated fields to generate novel and intriguing scientific hypotheses."
+        prompt_addition="Use creative analogies, metaphors, or comparisons from everyday life or unrelated fields to generate novel and intriguing scientific hypotheses.",
+        index=3
     ),
     "interdisciplinary": HypothesisStrategy(
         name="Interdisciplinary",
         key="5",
         description="Leverage multiple disciplines",
-        prompt_addition="Generate hypotheses that explicitly draw insights from multiple disciplines, combining perspectives in ways rarely or never previously explored."
+        prompt_addition="Generate hypotheses that explicitly draw insights from multiple disciplines, combining perspectives in ways rarely or never previously explored.",
+        index=4
     ),
     "what_if_scenarios": HypothesisStrategy(
         name="What-If Scenarios",
         key="6",
         description="Explore provocative thought experiments",
-        prompt_addition="Formulate hypotheses around imaginative 'what if?' scenarios or thought experiments that expand conventional scientific thinking."
+        prompt_addition="Formulate hypotheses around imaginative 'what if?' scenarios or thought experiments that expand conventional scientific thinking.",
+        index=5
     ),
     "provocative_reactions": HypothesisStrategy(
         name="Provocative Reactions",
         key="7",
         description="Provoke curiosity and debate",
-        prompt_addition="Hypotheses should provoke reactions such as curiosity, excitement, debate, or even mild controversy among scientists upon reading them."
+        prompt_addition="Hypotheses should provoke reactions such as curiosity, excitement, debate, or even mild controversy among scientists upon reading them.",
+        index=6
     ),
     "narrative_context": HypothesisStrategy(
         name="Narrative Context",
         key="8",
         description="Frame within compelling stories",
-        prompt_addition="Frame each hypothesis within a brief narrative or scenario that illustrates why exploring it would be scientifically exciting or culturally significant."
+        prompt_addition="Frame each hypothesis within a brief narrative or scenario that illustrates why exploring it would be scientifically exciting or culturally significant.",
+        index=7
     ),
     "risk_taking": HypothesisStrategy(
         name="Risk-Taking",
         key="9",
         description="Encourage bold, high-risk ideas",
-        prompt_addition="Prioritize bold, risky hypotheses—those with lower probability of confirmation but extremely high potential impact if validated."
+        prompt_addition="Prioritize bold, risky hypotheses—those with lower probability of confirmation but extremely high potential impact if validated.",
+        index=8
     ),
     "visionary_thinking": HypothesisStrategy(
         name="Visionary Thinking",
         key="0",
         description="Future-oriented and forward-looking",
-        prompt_addition="Generate visionary hypotheses that anticipate future discoveries or technological breakthroughs, proposing directions science may move in 5-10 years ahead of current thinking."
+        prompt_addition="Generate visionary hypotheses that anticipate future discoveries or technological breakthroughs, proposing directions science may move in 5-10 years ahead of current thinking.",
+        index=9
     )
 }
 
+# Strategies in bit order, and a lookup from selection key to bit position
+_STRATEGIES_BY_INDEX = tuple(sorted(HYPOTHESIS_STRATEGIES.values(), key=lambda s: s.index))
+_STRATEGY_INDEX_BY_KEY = {strategy.key: strategy.index for strategy in _STRATEGIES_BY_INDEX}
+
+# Rows of the strategy selection screen, and a lookup from selection key to row
+_STRATEGY_ITEMS = tuple(HYPOTHESIS_STRATEGIES.items())
+_STRATEGY_ROW_BY_KEY = {strategy.key: i for i, (_, strategy) in enumerate(_STRATEGY_ITEMS)}
+
 class HypothesisStrategyManager:
-    """Manages active hypothesis generation strategies"""
+    """Manages active hypothesis generation strategies.
+    
+    The active set is a bitmask where bit i selects _STRATEGIES_BY_INDEX[i].
+    """
     def __init__(self):
-        self.active_strategies = set()
+        self.active_strategies = 0
         self.default_mode = True  # Start with default mode
+        # Composed prompt/status strings keyed by bitmask
+        self._prompt_cache = {}
+        self._status_cache = {}
+        # Bumped on every selection change so displays can skip rebuilding their text
+        self.status_version = 0
     
     def toggle_strategy(self, strategy_key):
         """Toggle a strategy on/off"""
-        strategy_name = None
-        for name, strategy in HYPOTHESIS_STRATEGIES.items():
-            if strategy.key == strategy_key:
-                strategy_name = name
-                break
+        index = _STRATEGY_INDEX_BY_KEY.get(strategy_key)
+        if index is None:
+            return False
         
-        if strategy_name:
-            if strategy_name in self.active_strategies:
-                self.active_strategies.remove(strategy_name)
-            else:
-                self.active_strategies.add(strategy_name)
-                self.default_mode = False
-            return True
-        return False
+        self.active_strategies ^= 1 << index
+        if self.active_strategies & (1 << index):
+            self.default_mode = False
+        self.status_version += 1
+        return True
     
     def set_default_mode(self, enabled=True):
         """Enable/disable default mode"""
         self.default_mode = enabled
         if enabled:
-            self.active_strategies.clear()
+            self.active_strategies = 0
+        self.status_version += 1
+    
+    def is_active(self, strategy_name):
+        """Check whether the named strategy is selected"""
+        return bool(self.active_strategies & (1 << HYPOTHESIS_STRATEGIES[strategy_name].index))
+    
+    def active_count(self):
+        """Number of selected strategies"""
+        return bin(self.active_strategies).count("1")
+    
+    def _iter_active(self):
+        mask = self.active_strategies
+        for index, strategy in enumerate(_STRATEGIES_BY_INDEX):
+            if mask & (1 << index):
+                yield strategy
     
     def get_active_strategies(self):
         """Get list of active strategies"""
         if self.default_mode:
             return []
-        return [HYPOTHESIS_STRATEGIES[name] for name in self.active_strategies]
+        return list(self._iter_active())
     
     def get_strategy_prompt_additions(self):
         """Get combined prompt additions for active strategies"""
-        if self.default_mode:
+        if self.default_mode or not self.active_strategies:
             return ""
         
-        if not self.active_strategies:
-            return ""
-        
-        additions = []
-        for strategy_name in self.active_strategies:
-            strategy = HYPOTHESIS_STRATEGIES[strategy_name]
-            additions.append(f"• {strategy.prompt_addition}")
-        
-        return "\n\nADDITIONAL GENERATION STRATEGIES:\n" + "\n".join(additions)
+        mask = self.active_strategies
+        if mask not in self._prompt_cache:
+            additions = [f"• {strategy.prompt_addition}" for strategy in self._iter_active()]
+            self._prompt_cache[mask] = "\n\nADDITIONAL GENERATION STRATEGIES:\n" + "\n".join(additions)
+        return self._prompt_cache[mask]
     
     def get_status_text(self):
         """Get status text for display"""
@@ -416,31 +509,274 @@ class HypothesisStrategyManager:
             return "Default"
         elif not self.active_strategies:
             return "None"
-        else:
-            active_names = [HYPOTHESIS_STRATEGIES[name].name for name in self.active_strategies]
-            return f"{len(active_names)} active: " + ", ".join(active_names[:2]) + ("..." if len(active_names) > 2 else "")
+        
+        mask = self.active_strategies
+        if mask not in self._status_cache:
+            active_names = [strategy.name for strategy in self._iter_active()]
+            self._status_cache[mask] = f"{len(active_names)} active: " + ", ".join(active_names[:2]) + ("..." if len(active_names) > 2 else "")
+        return self._status_cache[mask]
 
 # ---------------------------------------------------------------------
 # Helper functions (from argonium_score_parallel_v9.py)
 # ---------------------------------------------------------------------
 
+# ASCII control characters (0x00-0x1F and 0x7F) except for whitespace
+# Keep: \t (0x09), \n (0x0A), \r (0x0D)
+_CTRL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+# Publication year in parentheses, e.g. "(2021)"
+_CITATION_YEAR_RE = re.compile(r'\((\d{4})\)')
+
 def clean_json_string(text):
     """Clean control characters from JSON string to prevent parsing errors."""
     if not text:
         return text
-    # Remove ASCII control characters (0x00-0x1F and 0x7F) except for whitespace
-    # Keep: \t (0x09), \n (0x0A), \r (0x0D)
+    # str.translate removes the characters in a single C-level pass
+    return text.translate(_CTRL_CHARS_TABLE)
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def parse_llm_json(text):
+    """Parse JSON from model output, stripping control characters only if the first attempt fails.
+    
+    Raises json.JSONDecodeError (orjson's error type subclasses it) if the text is not valid JSON.
+    """
     try:
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-        return text
-    except Exception:
-        # Return original text if regex fails
-        return text
+        return _json_loads(text)
+    except json.JSONDecodeError:
+        return _json_loads(clean_json_string(text))
+
+class JsonObjectScanner:
+    """Finds the first balanced {...} object in text that arrives in pieces.
+    
+    Tracks brace depth in a single forward pass and skips braces inside string
+    literals, so no piece is scanned twice and trailing prose costs nothing.
+    """
+    def __init__(self):
+        self.parts = []  # text from the opening brace onward
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk):
+        """Scan the next piece of text; returns the object text once its closing brace arrives, else None"""
+        return self._scan(chunk, 0)[0]
+    
+    def feed_all(self, chunk):
+        """Scan the next piece of text; returns every object completed in it, e.g. the items of a streamed array"""
+        objects = []
+        pos = 0
+        while pos < len(chunk):
+            json_text, pos = self._scan(chunk, pos)
+            if json_text is None:
+                break
+            objects.append(json_text)
+        return objects
+    
+    def _scan(self, chunk, pos):
+        """Scan chunk from pos; returns (object text or None, index just past where scanning stopped)"""
+        start = pos
+        if self.depth == 0:
+            start = chunk.find('{', pos)
+            if start == -1:
+                return None, len(chunk)
+        
+        for i in range(start, len(chunk)):
+            ch = chunk[i]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '{':
+                self.depth += 1
+            elif ch == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.parts.append(chunk[start:i + 1])
+                    json_text = "".join(self.parts)
+                    self.parts = []
+                    return json_text, i + 1
+        self.parts.append(chunk[start:])
+        return None, len(chunk)
+
+def parse_llm_json_object(text):
+    """Parse model output that should hold a JSON object, possibly surrounded by prose.
+    
+    The whole text is tried first (JSON mode responses are exactly the object)
+    and kept only if it decodes to an object; otherwise each balanced {...}
+    from a single forward scan is tried in turn, so an array-wrapped reply still
+    yields its object and braces inside strings or trailing prose can't cut a bad slice.
+    
+    Raises json.JSONDecodeError if no object in the text parses.
+    """
+    error = None
+    try:
+        data = parse_llm_json(text)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError as e:
+        error = e
+    
+    for json_text in JsonObjectScanner().feed_all(text):
+        try:
+            return parse_llm_json(json_text)
+        except json.JSONDecodeError:
+            continue
+    if error is None:
+        error = json.JSONDecodeError("No JSON object found", text, 0)
+    raise error
+
+_VERSION_KEY_CACHE = {}
+
+def version_key(hypothesis):
+    """Sort key for a hypothesis's version, so that "1.10" sorts after "1.9"
+
+    Version strings are compared as tuples of ints (non-numeric parts count as 0).
+    Parsed keys are cached per string since a session only uses a handful.
+    """
+    version = hypothesis.get("version", "1.0")
+    key = _VERSION_KEY_CACHE.get(version)
+    if key is None:
+        parts = []
+        for part in str(version).split('.'):
+            try:
+                parts.append(int(part))
+            except ValueError:
+                parts.append(0)
+        key = _VERSION_KEY_CACHE[version] = tuple(parts)
+    return key
 
 # ---------------------------------------------------------------------
 # Paper and Abstract Fetching Functions
 # ---------------------------------------------------------------------
 
+def _create_http_session(pool_connections=16, pool_maxsize=16, backoff_factor=0.5):
+    """Create a pooled HTTP session that retries rate limits and transient 5xx errors"""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Wisteria/7"})
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False  # Return the final response so callers can report the status
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter"""
+    def __init__(self, rate, capacity=1):
+        self.rate = rate  # Tokens added per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class AIMDLimiter:
+    """Concurrency limit with additive increase / multiplicative decrease.
+    
+    Each request holds a ticket from acquire() and hands it back to release()
+    with its outcome. The limit is halved when a request is throttled (timeout,
+    429) or its latency exceeds the target: either target_latency, or
+    latency_tolerance times the median of the last window latencies. Only one
+    halving happens per congestion event, since requests that started before
+    the last decrease were sent under the old limit. The limit grows by one
+    after increase_after consecutive good requests, but only once the limit
+    has actually been reached since the last change.
+    """
+    def __init__(self, initial=2, maximum=12, increase_after=4,
+                 target_latency=None, latency_tolerance=3.0, window=20):
+        self.limit = initial
+        self.maximum = maximum
+        self.increase_after = increase_after
+        self.target_latency = target_latency
+        self.latency_tolerance = latency_tolerance  # None: latency never counts as congestion
+        self.latencies = deque(maxlen=window)
+        self.in_flight = 0
+        self.successes = 0
+        self.saturated = False  # in_flight reached the limit since it last changed
+        self.epoch = 0  # bumped on every decrease
+        self.cv = threading.Condition()
+    
+    def acquire(self):
+        """Block until a slot is free under the current limit; returns the ticket for release()"""
+        with self.cv:
+            while self.in_flight >= self.limit:
+                self.cv.wait()
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self.saturated = True
+            return (time.monotonic(), self.epoch)
+    
+    def _latency_target(self):
+        """Latency above which a request counts as congested, or None if there isn't one yet"""
+        if self.target_latency is not None:
+            return self.target_latency
+        if self.latency_tolerance is None or len(self.latencies) < self.latencies.maxlen // 2:
+            return None
+        return self.latency_tolerance * sorted(self.latencies)[len(self.latencies) // 2]
+    
+    def release(self, ticket, throttled=False):
+        """Free a slot and adjust the limit based on the outcome"""
+        started, epoch = ticket
+        latency = time.monotonic() - started
+        with self.cv:
+            self.in_flight -= 1
+            target = self._latency_target()
+            if not throttled:
+                self.latencies.append(latency)
+            if throttled or (target is not None and latency > target):
+                self.successes = 0
+                if epoch == self.epoch:
+                    self.limit = max(1, self.limit // 2)
+                    self.epoch += 1
+                    self.saturated = False
+            else:
+                self.successes += 1
+                if (self.successes >= self.increase_after and self.saturated
+                        and self.limit < self.maximum):
+                    self.limit += 1
+                    self.successes = 0
+                    self.saturated = self.in_flight >= self.limit
+            self.cv.notify_all()
+
+# Shared session so downloads reuse TCP/TLS connections (keep-alive)
+_http_session = _create_http_session()
+
+# Background PDF downloads start at 2 in flight and adapt to how the servers respond;
+# download time mostly tracks file size, so only failures count as congestion
+_pdf_download_limiter = AIMDLimiter(initial=2, maximum=12, latency_tolerance=None)
+
+# Semantic Scholar gets its own session with longer backoff, and unauthenticated
+# requests are held to the public limit of 1 request/second so parallel
+# searches do not trigger 429s
+_s2_session = _create_http_session(pool_connections=8, pool_maxsize=16, backoff_factor=1)
+_s2_rate_limiter = TokenBucket(rate=1.0)
+
 def create_papers_directory(session_name):
     """Create directory structure for storing papers and abstracts for a session"""
     papers_dir = Path("papers") / session_name
@@ -458,7 +794,7 @@ def extract_paper_info_from_citation(citation):
     
     try:
         # Try to extract year (4 digits in parentheses)
-        year_match = re.search(r'\((\d{4})\)', citation)
+        year_match = _CITATION_YEAR_RE.search(citation)
         if year_match:
             info["year"] = year_match.group(1)
         
@@ -488,6 +824,36 @@ def extract_paper_info_from_citation(citation):
     
     return info
 
+def run_parallel(jobs, max_workers=16, on_complete=None, return_exceptions=False):
+    """Run (fn, args, kwargs) jobs on a thread pool and return results in job order.
+    
+    on_complete, if given, is called as on_complete(done_count, total) as each
+    job finishes. With return_exceptions, a job that raised is returned as its
+    exception instead of being re-raised.
+    
+    Every job is submitted before any result is collected. Do not call
+    future.result() inside the submit loop, e.g.
+    
+        for fn, args, kwargs in jobs:
+            results.append(executor.submit(fn, *args, **kwargs).result())
+    
+    which waits for each job before submitting the next and runs the whole
+    batch sequentially. Likewise collect each result once instead of calling
+    result() in both a condition and an append.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(len(jobs), max_workers)) as executor:
+        futures = [executor.submit(fn, *args, **kwargs) for fn, args, kwargs in jobs]
+        if on_complete:
+            for done_count, _ in enumerate(as_completed(futures), 1):
+                on_complete(done_count, len(futures))
+        if return_exceptions:
+            return [future.exception() or future.result() for future in futures]
+        return [future.result() for future in futures]
+
 def search_semantic_scholar(query, max_results=5, api_key=None):
     """Search Semantic Scholar for papers matching the query"""
     try:
@@ -502,9 +868,11 @@ def search_semantic_scholar(query, max_results=5, api_key=None):
         headers = {}
         if api_key:
             headers['x-api-key'] = api_key
+        else:
+            _s2_rate_limiter.acquire()
         
         # Make request
-        response = requests.get(base_url, params=params, headers=headers, timeout=30)
+        response = _s2_session.get(base_url, params=params, headers=headers, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
@@ -563,26 +931,38 @@ def save_abstract_to_file(paper, papers_dir, citation_index):
         filename = f"abstract_{citation_index:02d}_{paper_id}.txt"
         filepath = papers_dir / "abstracts" / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"Title: {paper.get('title', 'Unknown')}\n")
-            f.write(f"Authors: {', '.join(paper.get('authors', []))}\n")
-            f.write(f"Published: {paper.get('published', 'Unknown')}\n")
-            f.write(f"Venue: {paper.get('venue', 'Unknown venue')}\n")
-            f.write(f"Semantic Scholar ID: {paper.get('paper_id', 'N/A')}\n")
-            f.write(f"DOI: {paper.get('doi', 'N/A')}\n")
-            f.write(f"arXiv ID: {paper.get('arxiv_id', 'N/A')}\n")
-            f.write(f"PDF URL: {paper.get('pdf_url', 'N/A')}\n")
-            f.write("\nAbstract:\n")
-            f.write(paper.get('abstract', 'No abstract available'))
+        content = (
+            f"Title: {paper.get('title', 'Unknown')}\n"
+            f"Authors: {', '.join(paper.get('authors', []))}\n"
+            f"Published: {paper.get('published', 'Unknown')}\n"
+            f"Venue: {paper.get('venue', 'Unknown venue')}\n"
+            f"Semantic Scholar ID: {paper.get('paper_id', 'N/A')}\n"
+            f"DOI: {paper.get('doi', 'N/A')}\n"
+            f"arXiv ID: {paper.get('arxiv_id', 'N/A')}\n"
+            f"PDF URL: {paper.get('pdf_url', 'N/A')}\n"
+            f"\nAbstract:\n"
+            f"{paper.get('abstract', 'No abstract available')}"
+        )
+        
+        # Build the file in memory and write it in one binary call (no text-layer newline translation)
+        with open(filepath, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        
+        index_abstract(papers_dir.name, filename, paper.get('title', 'Unknown'), str(filepath))
         
+        # New files inside a session directory do not change the mtime of papers/
+        invalidate_abstract_cache()
         return str(filepath)
     
     except Exception as e:
         print(f"Error saving abstract: {e}")
         return None
 
-def download_paper_pdf(paper, papers_dir, citation_index):
+def download_paper_pdf(paper, papers_dir, citation_index, session=None):
     """Download paper PDF if available"""
+    if session is None:
+        session = _http_session
+    
     try:
         pdf_url = paper.get('pdf_url')
         if not pdf_url:
@@ -592,13 +972,23 @@ def download_paper_pdf(paper, papers_dir, citation_index):
         filename = f"paper_{citation_index:02d}_{paper_id}.pdf"
         filepath = papers_dir / "papers" / filename
         
-        # Download PDF using requests for better error handling
-        response = requests.get(pdf_url, stream=True, timeout=60)
-        response.raise_for_status()
-        
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # Download PDF using requests for better error handling; timeouts and
+        # 429s shrink the number of concurrent downloads
+        ticket = _pdf_download_limiter.acquire()
+        throttled = False
+        try:
+            with session.get(pdf_url, stream=True, timeout=60) as response:
+                throttled = response.status_code == 429
+                response.raise_for_status()
+                
+                with open(filepath, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            throttled = True
+            raise
+        finally:
+            _pdf_download_limiter.release(ticket, throttled)
         
         return str(filepath)
     
@@ -606,40 +996,217 @@ def download_paper_pdf(paper, papers_dir, citation_index):
         print(f"Error downloading PDF: {e}")
         return None
 
+# Abstract listings keyed by the mtime of the papers/ directory. The generation
+# moves on every invalidation, so a listing built while a background save was
+# invalidating the cache is returned but not stored
+_abstract_cache = {}
+_abstract_cache_lock = threading.Lock()
+_abstract_cache_generation = 0
+
+def invalidate_abstract_cache():
+    """Drop cached abstract listings so newly saved files are picked up"""
+    global _abstract_cache_generation
+    with _abstract_cache_lock:
+        _abstract_cache_generation += 1
+        _abstract_cache.clear()
+
+def _cached_abstract_listing(name, build):
+    """Return a cached listing, rebuilding it if papers/ has changed"""
+    try:
+        mtime = os.stat("papers").st_mtime_ns
+    except OSError:
+        return build()
+    
+    with _abstract_cache_lock:
+        cached = _abstract_cache.get(name)
+        generation = _abstract_cache_generation
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, build())
+        with _abstract_cache_lock:
+            if generation == _abstract_cache_generation:
+                _abstract_cache[name] = cached
+    return list(cached[1])
+
+# ---------------------------------------------------------------------
+# Abstract index (SQLite FTS5)
+# ---------------------------------------------------------------------
+
+ABSTRACT_INDEX_PATH = os.path.join("papers", ".index.sqlite")
+
+_abstract_index = None
+_abstract_index_lock = threading.Lock()
+
+def _get_abstract_index():
+    """Open the abstract index, creating it on first use and reconciling it with the files on disk.
+    
+    Returns None if papers/ does not exist or SQLite lacks FTS5, in which
+    case callers fall back to scanning the abstract files.
+    """
+    global _abstract_index
+    if _abstract_index is not None:
+        return _abstract_index
+    if not os.path.isdir("papers"):
+        return None
+    
+    try:
+        conn = sqlite3.connect(ABSTRACT_INDEX_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        is_new = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='abstracts'"
+        ).fetchone() is None
+        if is_new:
+            conn.execute("CREATE VIRTUAL TABLE abstracts USING fts5(session, filename, title, path UNINDEXED)")
+        # Index abstracts saved before the index existed, by other runs, or while it was unavailable
+        _reconcile_abstract_index(conn)
+        _abstract_index = conn
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        print(f"Abstract index unavailable, scanning files instead: {e}")
+        return None
+
+def _reconcile_abstract_index(conn):
+    """Add abstract files missing from the index and drop rows whose files are gone.
+    
+    Only directory listings are compared; just the headers of new files are read.
+    Returns True if the index changed.
+    """
+    indexed = {path for (path,) in conn.execute("SELECT path FROM abstracts")}
+    on_disk = {}
+    for papers_dir in _scan_papers_dirs():
+        abstracts_dir = os.path.join(papers_dir.path, "abstracts")
+        if not os.path.isdir(abstracts_dir):
+            continue
+        for abstract_file in _scan_abstract_files(abstracts_dir):
+            on_disk[abstract_file.path] = (papers_dir.name, abstract_file.name)
+    
+    added = []
+    for path in on_disk.keys() - indexed:
+        session, filename = on_disk[path]
+        try:
+            added.append((session, filename, _read_abstract_title(path), path))
+        except OSError as e:
+            print(f"Error reading abstract file {path}: {e}")
+    removed = [(path,) for path in indexed - on_disk.keys()]
+    
+    if added:
+        conn.executemany("INSERT INTO abstracts (session, filename, title, path) VALUES (?, ?, ?, ?)", added)
+    if removed:
+        conn.executemany("DELETE FROM abstracts WHERE path = ?", removed)
+    if added or removed:
+        conn.commit()
+    return bool(added or removed)
+
+def index_abstract(session, filename, title, path):
+    """Add or replace an abstract in the index"""
+    with _abstract_index_lock:
+        conn = _get_abstract_index()
+        if conn is None:
+            return
+        try:
+            conn.execute("DELETE FROM abstracts WHERE path = ?", (path,))
+            conn.execute(
+                "INSERT INTO abstracts (session, filename, title, path) VALUES (?, ?, ?, ?)",
+                (session, filename, title, path)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error indexing abstract {path}: {e}")
+
+def _query_abstract_index(title_query=None):
+    """Return indexed abstracts (most recent session first), optionally filtered by title.
+    
+    Returns None if the index is unavailable.
+    """
+    sql = "SELECT session, filename, title, path FROM abstracts"
+    params = ()
+    if title_query:
+        # Prefix-match every word of the query against the title column
+        terms = " ".join('"' + term.replace('"', '""') + '"*' for term in title_query.split())
+        sql += " WHERE abstracts MATCH ?"
+        params = (f"title : ({terms})",)
+    sql += " ORDER BY session DESC, filename"
+    
+    with _abstract_index_lock:
+        conn = _get_abstract_index()
+        if conn is None:
+            return None
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error querying abstract index: {e}")
+            return None
+        
+        # Drop entries whose files have been deleted
+        missing = [path for _, _, _, path in rows if not os.path.exists(path)]
+        if missing:
+            conn.executemany("DELETE FROM abstracts WHERE path = ?", [(path,) for path in missing])
+            conn.commit()
+    
+    return [
+        {"filename": filename, "title": title, "content": None, "session": session, "full_path": path}
+        for session, filename, title, path in rows
+        if path not in missing
+    ]
+
+def search_abstracts(title_query):
+    """Find abstracts whose titles match every word of title_query (prefix match)"""
+    results = _query_abstract_index(title_query)
+    if results is None:
+        # No index: filter a file scan by substring instead
+        words = title_query.lower().split()
+        results = [a for a in find_all_available_abstracts()
+                   if all(word in a["title"].lower() for word in words)]
+    return results
+
 def find_abstracts_for_hypothesis(hypothesis):
     """Find and read abstracts for a hypothesis from papers directory"""
+    return _cached_abstract_listing("latest", _scan_latest_abstracts)
+
+def _scan_papers_dirs():
+    """Return session directory entries under papers/, most recent first (timestamp in name)"""
+    with os.scandir("papers") as entries:
+        return sorted(
+            (entry for entry in entries
+             if entry.is_dir(follow_symlinks=False) and entry.name.startswith("papers_")),
+            key=lambda entry: entry.name, reverse=True
+        )
+
+def _scan_abstract_files(abstracts_dir):
+    """Return abstract file entries in a session's abstracts directory, sorted by name"""
+    with os.scandir(abstracts_dir) as entries:
+        return sorted(
+            (entry for entry in entries
+             if entry.name.startswith("abstract_") and entry.name.endswith(".txt")),
+            key=lambda entry: entry.name
+        )
+
+def _scan_latest_abstracts():
     abstracts = []
     
     try:
         # Look for papers directories that might contain abstracts for this hypothesis
-        papers_base_dir = Path("papers")
-        if not papers_base_dir.exists():
+        if not os.path.isdir("papers"):
             return abstracts
         
         # Find the most recent papers directory (by timestamp)
-        papers_dirs = [d for d in papers_base_dir.iterdir() if d.is_dir() and d.name.startswith("papers_")]
+        papers_dirs = _scan_papers_dirs()
         if not papers_dirs:
             return abstracts
         
-        # Sort by timestamp in directory name and get the most recent
-        papers_dirs.sort(key=lambda x: x.name, reverse=True)
-        latest_papers_dir = papers_dirs[0]
-        
-        abstracts_dir = latest_papers_dir / "abstracts"
-        if not abstracts_dir.exists():
+        abstracts_dir = os.path.join(papers_dirs[0].path, "abstracts")
+        if not os.path.isdir(abstracts_dir):
             return abstracts
         
         # Read all abstract files
-        for abstract_file in abstracts_dir.glob("abstract_*.txt"):
+        for abstract_file in _scan_abstract_files(abstracts_dir):
             try:
-                with open(abstract_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                with open(abstract_file.path, 'r', encoding='utf-8') as f:
                     abstracts.append({
                         "filename": abstract_file.name,
-                        "content": content
+                        "content": f.read()
                     })
             except Exception as e:
-                print(f"Error reading abstract file {abstract_file}: {e}")
+                print(f"Error reading abstract file {abstract_file.path}: {e}")
         
         return abstracts
     
@@ -647,54 +1214,83 @@ def find_abstracts_for_hypothesis(hypothesis):
         print(f"Error finding abstracts: {e}")
         return abstracts
 
+# Abstract files start with their metadata header, so the title is always
+# within the first couple of kilobytes
+ABSTRACT_HEADER_BYTES = 2048
+
+def _read_abstract_title(path):
+    """Read only the header of an abstract file and extract its title"""
+    with open(path, 'rb') as f:
+        header = f.read(ABSTRACT_HEADER_BYTES).decode('utf-8', errors='replace')
+    
+    for line in header.split('\n'):
+        if line.startswith("1|Title:"):
+            return line.replace("1|Title:", "").strip()
+        elif line.startswith("Title:"):
+            return line.replace("Title:", "").strip()
+    return "Unknown Title"
+
+def load_abstract_content(abstract):
+    """Return the full text of an abstract, reading it from disk on first use"""
+    if abstract.get("content") is None:
+        try:
+            with open(abstract["full_path"], 'r', encoding='utf-8') as f:
+                abstract["content"] = f.read()
+        except Exception as e:
+            abstract["content"] = f"Error reading abstract file: {e}"
+    return abstract["content"]
+
 def find_all_available_abstracts():
-    """Find all available abstracts from all papers directories"""
+    """Find all available abstracts from all papers directories.
+    
+    Titles come from the SQLite index when available (otherwise only the
+    header of each file is read); the full text is loaded lazily with
+    load_abstract_content() when an abstract is displayed.
+    """
+    # Files may have been added since the index was opened (e.g. by another run
+    # sharing papers/). Adding to an existing session directory doesn't change
+    # the papers/ mtime, so this runs on every call rather than only on a cache miss
+    with _abstract_index_lock:
+        conn = _get_abstract_index()
+        if conn is not None:
+            try:
+                if _reconcile_abstract_index(conn):
+                    invalidate_abstract_cache()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Error refreshing abstract index: {e}")
+    return _cached_abstract_listing("all", _list_all_abstracts)
+
+def _list_all_abstracts():
+    abstracts = _query_abstract_index()
+    if abstracts is None:
+        abstracts = _scan_all_abstracts()
+    return abstracts
+
+def _scan_all_abstracts():
     all_abstracts = []
     
     try:
-        papers_base_dir = Path("papers")
-        if not papers_base_dir.exists():
-            return all_abstracts
-        
-        # Find all papers directories
-        papers_dirs = [d for d in papers_base_dir.iterdir() if d.is_dir() and d.name.startswith("papers_")]
-        if not papers_dirs:
+        if not os.path.isdir("papers"):
             return all_abstracts
         
-        # Sort by timestamp in directory name (most recent first)
-        papers_dirs.sort(key=lambda x: x.name, reverse=True)
-        
-        for papers_dir in papers_dirs:
-            abstracts_dir = papers_dir / "abstracts"
-            if abstracts_dir.exists():
-                session_name = papers_dir.name
-                
-                # Read all abstract files from this session
-                for abstract_file in abstracts_dir.glob("abstract_*.txt"):
-                    try:
-                        with open(abstract_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                        # Parse title from content
-                        title = "Unknown Title"
-                        lines = content.split('\n')
-                        for line in lines:
-                            if line.startswith("1|Title:"):
-                                title = line.replace("1|Title:", "").strip()
-                                break
-                            elif line.startswith("Title:"):
-                                title = line.replace("Title:", "").strip()
-                                break
-                        
-                        all_abstracts.append({
-                            "filename": abstract_file.name,
-                            "title": title,
-                            "content": content,
-                            "session": session_name,
-                            "full_path": str(abstract_file)
-                        })
-                    except Exception as e:
-                        print(f"Error reading abstract file {abstract_file}: {e}")
+        # Find all papers directories, most recent first
+        for papers_dir in _scan_papers_dirs():
+            abstracts_dir = os.path.join(papers_dir.path, "abstracts")
+            if not os.path.isdir(abstracts_dir):
+                continue
+            
+            session_name = papers_dir.name
+            for abstract_file in _scan_abstract_files(abstracts_dir):
+                try:
+                    all_abstracts.append({
+                        "filename": abstract_file.name,
+                        "title": _read_abstract_title(abstract_file.path),
+                        "content": None,
+                        "session": session_name,
+                        "full_path": abstract_file.path
+                    })
+                except Exception as e:
+                    print(f"Error reading abstract file {abstract_file.path}: {e}")
         
         return all_abstracts
     
@@ -702,6 +1298,41 @@ def find_all_available_abstracts():
         print(f"Error finding abstracts: {e}")
         return all_abstracts
 
+def wrap_monospace(line, width):
+    """Wrap a line for a fixed-width curses pane, breaking at spaces.
+    
+    A faster stand-in for textwrap.wrap when every character is one cell:
+    no regex splitting or hyphenation rules. Words longer than width are
+    hard-split. Returns [""] for a blank line.
+    """
+    line = line.expandtabs().rstrip()
+    if width <= 0:
+        return [line]
+    
+    rows = []
+    i = 0
+    n = len(line)
+    while i < n:
+        if n - i <= width:
+            rows.append(line[i:])
+            break
+        # Leading indent stays on the row with the first word, never a row of its own
+        word_start = i
+        while line[word_start] == ' ':
+            word_start += 1
+        j = line.rfind(' ', word_start, i + width + 1)
+        if j <= word_start:
+            # No space to break at: hard-split the word
+            j = i + width
+            rows.append(line[i:j])
+        else:
+            rows.append(line[i:j].rstrip())
+        # Spaces at a break are not carried onto the next row
+        i = j
+        while i < n and line[i] == ' ':
+            i += 1
+    return rows or [""]
+
 def browse_abstracts_interface(stdscr, interface):
     """Browse abstracts using a two-panel interface"""
     # Find all available abstracts
@@ -721,51 +1352,29 @@ def browse_abstracts_interface(stdscr, interface):
     original_show_hallmarks = interface.show_hallmarks
     original_show_references = interface.show_references
     
-    # Set browse mode
-    browse_mode = True
-    
-    while browse_mode:
-        try:
-            # Clear and redraw interface for abstract browsing
-            stdscr.clear()
-            
-            # Draw header
-            header_text = f" ABSTRACT BROWSER - {len(all_abstracts)} abstracts available "
-            if len(header_text) > interface.width:
-                header_text = f" ABSTRACT BROWSER - {len(all_abstracts)} abstracts "
-            
-            stdscr.addstr(0, 0, header_text, curses.A_BOLD | curses.A_REVERSE)
-            if len(header_text) < interface.width:
-                stdscr.addstr(0, len(header_text), " " * (interface.width - len(header_text)), curses.A_REVERSE)
-            
-            # Draw separator line
-            stdscr.addstr(1, 0, "─" * interface.width)
-            
-            # Calculate panel dimensions (similar to main interface)
-            content_height = interface.height - 4  # Leave room for header and commands
-            list_width = int(interface.width * 0.4)  # 40% for abstract list
-            detail_width = interface.width - list_width - 1  # Rest for abstract content
-            
-            # Draw abstract list (left panel)
-            list_y_start = 2
-            list_y_end = list_y_start + content_height
-            
-            # List header
-            list_header = " Abstract List "
-            stdscr.addstr(list_y_start, 0, list_header, curses.A_BOLD)
-            if len(list_header) < list_width:
-                stdscr.addstr(list_y_start, len(list_header), "─" * (list_width - len(list_header)))
-            
-            # Draw abstract list items
-            for i, abstract in enumerate(all_abstracts):
-                line_y = list_y_start + 2 + i - list_scroll_offset
-                
-                if line_y < list_y_start + 2:
-                    continue
-                if line_y >= list_y_end - 1:
-                    break
-                
-                # Prepare display text
+    # Calculate panel dimensions (similar to main interface)
+    content_height = interface.height - 4  # Leave room for header and commands
+    list_width = int(interface.width * 0.4)  # 40% for abstract list
+    detail_width = interface.width - list_width - 1  # Rest for abstract content
+    list_y_start = 2
+    cmd_y = interface.height - 2
+    visible_lines = content_height - 3  # Rows per pane below its header
+    
+    # Each pane is its own window so it can be redrawn without touching the other
+    list_win = curses.newwin(content_height, list_width, list_y_start, 0)
+    detail_win = curses.newwin(content_height, detail_width, list_y_start, list_width + 1)
+    
+    def build_list_lines(abstracts):
+        """Format list entries once per listing; only the highlight changes while browsing.
+        
+        The truncated "title [session]" label is stored on each abstract dict with
+        the width it was built for, so re-opening the browser or clearing a filter
+        reuses it; only the position number is added here.
+        """
+        lines = []
+        for i, abstract in enumerate(abstracts):
+            cached = abstract.get("_list_label")
+            if cached is None or cached[0] != list_width:
                 title = abstract["title"]
                 session_short = abstract["session"].replace("papers_", "")[:15]
                 
@@ -774,76 +1383,143 @@ def browse_abstracts_interface(stdscr, interface):
                 if len(title) > max_title_len:
                     title = title[:max_title_len-3] + "..."
                 
-                display_text = f"{i+1:2d}. {title} [{session_short}]"
-                
-                # Highlight current selection
-                attr = curses.A_REVERSE if i == current_abstract_idx else 0
-                
-                interface.safe_addstr(stdscr, line_y, 2, display_text, attr)
+                cached = (list_width, f"{title} [{session_short}]")
+                abstract["_list_label"] = cached
             
-            # Draw vertical separator
-            for y in range(list_y_start, list_y_end):
-                interface.safe_addstr(stdscr, y, list_width, "│")
-            
-            # Draw abstract content (right panel)
-            detail_x_start = list_width + 1
-            current_abstract = all_abstracts[current_abstract_idx] if all_abstracts else None
+            lines.append(f"{i+1:2d}. {cached[1]}")
+        return lines
+    
+    def draw_header(title_filter=""):
+        header_text = f" ABSTRACT BROWSER - {len(all_abstracts)} abstracts available "
+        if title_filter:
+            header_text = f" ABSTRACT BROWSER - {len(all_abstracts)} abstracts matching '{title_filter}' "
+        if len(header_text) > interface.width:
+            header_text = f" ABSTRACT BROWSER - {len(all_abstracts)} abstracts "
+        try:
+            stdscr.addstr(0, 0, header_text, curses.A_BOLD | curses.A_REVERSE)
+            if len(header_text) < interface.width:
+                stdscr.hline(0, len(header_text), ord(' ') | curses.A_REVERSE, interface.width - len(header_text))
+        except curses.error:
+            pass
+    
+    list_lines = build_list_lines(all_abstracts)
+    
+    # Draw the static frame once
+    stdscr.erase()
+    draw_header()
+    # Draw separator lines, each in a single curses call
+    try:
+        stdscr.hline(1, 0, curses.ACS_HLINE, interface.width)
+        stdscr.vline(list_y_start, list_width, curses.ACS_VLINE, content_height)
+    except curses.error:
+        pass
+    
+    # Draw command bar at bottom
+    commands = " ↑↓=Navigate j/k=Scroll abstract d/u=Fast scroll /=Filter titles ESC/q=Exit "
+    try:
+        interface.safe_addstr(stdscr, cmd_y, 0, commands, curses.A_REVERSE)
+        if len(commands) < interface.width:
+            stdscr.hline(cmd_y, len(commands), ord(' ') | curses.A_REVERSE, interface.width - len(commands))
+    except curses.error:
+        pass
+    
+    def scroll_content(delta):
+        """Scroll the abstract text, clamped to its length; returns True if the offset changed"""
+        nonlocal abstract_scroll_offset
+        new_offset = max(0, abstract_scroll_offset + delta)
+        if delta > 0:
+            rows = wrapped_rows_for(all_abstracts[current_abstract_idx], new_offset + visible_lines)
+            new_offset = min(new_offset, max(0, len(rows) - visible_lines))
+        if new_offset == abstract_scroll_offset:
+            return False
+        abstract_scroll_offset = new_offset
+        return True
+    
+    # Only panes whose dirty flag is set are redrawn on each pass
+    dirty_list = True
+    dirty_detail = True
+    status_message = None  # Shown once in place of the file/session line
+    wrapped_cache = {}  # (abstract path, width) -> partially wrapped abstract
+    
+    def wrapped_rows_for(abstract, needed):
+        """Return the abstract's wrapped rows, wrapping source lines only until `needed` rows exist.
+        
+        Lines below the viewport are never wrapped, and rows already wrapped are
+        reused on every scroll, so a redraw only slices the visible rows.
+        """
+        key = (abstract["full_path"], detail_width)
+        entry = wrapped_cache.get(key)
+        if entry is None:
+            entry = {"lines": load_abstract_content(abstract).split('\n'), "next_line": 0, "rows": []}
+            wrapped_cache[key] = entry
+        
+        lines = entry["lines"]
+        rows = entry["rows"]
+        while len(rows) < needed and entry["next_line"] < len(lines):
+            rows.extend(wrap_monospace(lines[entry["next_line"]], detail_width - 2))
+            entry["next_line"] += 1
+        return rows
+    
+    # Bind names used in the row loops to locals once
+    safe_addstr = interface.safe_addstr
+    A_REVERSE = curses.A_REVERSE
+    
+    # Set browse mode
+    browse_mode = True
+    
+    while browse_mode:
+        try:
+            current_abstract = all_abstracts[current_abstract_idx]
             
-            if current_abstract:
-                # Content header
-                content_header = f" Abstract {current_abstract_idx + 1} of {len(all_abstracts)} "
+            if dirty_list:
+                # Draw abstract list (left panel)
+                list_win.erase()
+                list_header = " Abstract List "
                 try:
-                    stdscr.addstr(list_y_start, detail_x_start, content_header, curses.A_BOLD)
-                    if len(content_header) < detail_width:
-                        stdscr.addstr(list_y_start, detail_x_start + len(content_header), 
-                                    "─" * (detail_width - len(content_header)))
+                    list_win.addstr(0, 0, list_header, curses.A_BOLD)
+                    if len(list_header) < list_width:
+                        list_win.hline(0, len(list_header), curses.ACS_HLINE, list_width - len(list_header))
                 except curses.error:
                     pass
                 
-                # Display abstract content with scrolling
-                content_lines = current_abstract["content"].split('\n')
-                content_y_start = list_y_start + 2
+                for i in range(list_scroll_offset, min(len(list_lines), list_scroll_offset + visible_lines)):
+                    # Highlight current selection
+                    attr = A_REVERSE if i == current_abstract_idx else 0
+                    safe_addstr(list_win, 2 + i - list_scroll_offset, 2, list_lines[i], attr)
                 
-                for i, line in enumerate(content_lines):
-                    display_y = content_y_start + i - abstract_scroll_offset
-                    
-                    if display_y < content_y_start:
-                        continue
-                    if display_y >= list_y_end - 1:
-                        break
-                    
-                    # Wrap long lines
-                    wrapped_lines = textwrap.wrap(line, detail_width - 2) if line.strip() else [""]
-                    
-                    for j, wrapped_line in enumerate(wrapped_lines):
-                        wrapped_y = display_y + j
-                        if wrapped_y >= list_y_end - 1:
-                            break
-                        
-                        try:
-                            interface.safe_addstr(stdscr, wrapped_y, detail_x_start + 1, wrapped_line)
-                        except curses.error:
-                            pass
-            
-            # Draw command bar at bottom
-            cmd_y = interface.height - 2
-            commands = " ↑↓=Navigate j/k=Scroll abstract d/u=Fast scroll ESC/q=Exit "
-            try:
-                interface.safe_addstr(stdscr, cmd_y, 0, commands, curses.A_REVERSE)
-                if len(commands) < interface.width:
-                    stdscr.addstr(cmd_y, len(commands), " " * (interface.width - len(commands)), curses.A_REVERSE)
-            except curses.error:
-                pass
+                # Status line follows the selection
+                stdscr.move(cmd_y + 1, 0)
+                stdscr.clrtoeol()
+                status_text = status_message or f" File: {current_abstract['filename']} | Session: {current_abstract['session']} "
+                interface.safe_addstr(stdscr, cmd_y + 1, 0, status_text)
+                status_message = None
             
-            # Status line
-            if current_abstract:
-                status_text = f" File: {current_abstract['filename']} | Session: {current_abstract['session']} "
+            if dirty_detail:
+                # Draw abstract content (right panel)
+                detail_win.erase()
+                content_header = f" Abstract {current_abstract_idx + 1} of {len(all_abstracts)} "
                 try:
-                    interface.safe_addstr(stdscr, cmd_y + 1, 0, status_text)
+                    detail_win.addstr(0, 0, content_header, curses.A_BOLD)
+                    if len(content_header) < detail_width:
+                        detail_win.hline(0, len(content_header), curses.ACS_HLINE, detail_width - len(content_header))
                 except curses.error:
                     pass
+                
+                # Display abstract content with scrolling
+                content_y_start = 2
+                wrapped_rows = wrapped_rows_for(current_abstract, abstract_scroll_offset + visible_lines)
+                
+                for row, wrapped_line in enumerate(wrapped_rows[abstract_scroll_offset:abstract_scroll_offset + visible_lines]):
+                    safe_addstr(detail_win, content_y_start + row, 1, wrapped_line)
             
-            stdscr.refresh()
+            # Push all changes to the terminal in one update
+            if dirty_list or dirty_detail:
+                stdscr.noutrefresh()
+                list_win.noutrefresh()
+                detail_win.noutrefresh()
+                curses.doupdate()
+                dirty_list = False
+                dirty_detail = False
             
             # Handle input
             key = stdscr.getch()
@@ -857,6 +1533,7 @@ def browse_abstracts_interface(stdscr, interface):
                 if current_abstract_idx > 0:
                     current_abstract_idx -= 1
                     abstract_scroll_offset = 0  # Reset content scroll when changing abstract
+                    dirty_list = dirty_detail = True
                     
                     # Auto-scroll list if needed
                     if current_abstract_idx < list_scroll_offset:
@@ -866,29 +1543,69 @@ def browse_abstracts_interface(stdscr, interface):
                 if current_abstract_idx < len(all_abstracts) - 1:
                     current_abstract_idx += 1
                     abstract_scroll_offset = 0  # Reset content scroll when changing abstract
+                    dirty_list = dirty_detail = True
                     
                     # Auto-scroll list if needed
-                    visible_lines = content_height - 3  # Account for headers
                     if current_abstract_idx >= list_scroll_offset + visible_lines:
                         list_scroll_offset = current_abstract_idx - visible_lines + 1
                         
             elif key == ord('j') or key == ord('J'):  # Scroll abstract content down
-                abstract_scroll_offset += 1
+                if scroll_content(1):
+                    dirty_detail = True
                 
             elif key == ord('k') or key == ord('K'):  # Scroll abstract content up
-                abstract_scroll_offset = max(0, abstract_scroll_offset - 1)
+                if scroll_content(-1):
+                    dirty_detail = True
                 
             elif key == ord('d') or key == ord('D'):  # Fast scroll abstract content down
-                abstract_scroll_offset += 5
+                if scroll_content(5):
+                    dirty_detail = True
                 
             elif key == ord('u') or key == ord('U'):  # Fast scroll abstract content up
-                abstract_scroll_offset = max(0, abstract_scroll_offset - 5)
+                if scroll_content(-5):
+                    dirty_detail = True
                 
             elif key == curses.KEY_PPAGE:  # Page Up - scroll abstract up
-                abstract_scroll_offset = max(0, abstract_scroll_offset - 10)
+                if scroll_content(-10):
+                    dirty_detail = True
                 
             elif key == curses.KEY_NPAGE:  # Page Down - scroll abstract down
-                abstract_scroll_offset += 10
+                if scroll_content(10):
+                    dirty_detail = True
+                
+            elif key == ord('/'):  # Filter the list by title (empty filter shows all)
+                filter_input = ""
+                filtering = True
+                
+                while filtering:
+                    stdscr.move(cmd_y + 1, 0)
+                    stdscr.clrtoeol()
+                    interface.safe_addstr(stdscr, cmd_y + 1, 0, f" Filter titles (Enter to apply, ESC to cancel): {filter_input}")
+                    stdscr.refresh()
+                    
+                    key_filter = stdscr.getch()
+                    if key_filter == 27:  # ESC
+                        filtering = False
+                    elif key_filter == ord('\n') or key_filter == curses.KEY_ENTER or key_filter == 10:
+                        title_filter = filter_input.strip()
+                        matches = search_abstracts(title_filter) if title_filter else find_all_available_abstracts()
+                        if matches:
+                            all_abstracts = matches
+                            list_lines = build_list_lines(all_abstracts)
+                            current_abstract_idx = 0
+                            abstract_scroll_offset = 0
+                            list_scroll_offset = 0
+                            draw_header(title_filter)
+                        else:
+                            status_message = f" No abstracts match '{title_filter}' "
+                        filtering = False
+                    elif key_filter == curses.KEY_BACKSPACE or key_filter == 127 or key_filter == 8:
+                        filter_input = filter_input[:-1]
+                    elif 32 <= key_filter <= 126:  # Printable characters
+                        filter_input += chr(key_filter)
+                
+                # Status line is redrawn with the list
+                dirty_list = dirty_detail = True
                 
         except curses.error:
             pass  # Ignore display errors
@@ -919,35 +1636,64 @@ def strategy_selection_interface(stdscr, interface):
     current_selection = 0
     scroll_offset = 0
     
-    # Get all strategies as a list for navigation
-    strategy_items = list(HYPOTHESIS_STRATEGIES.items())
+    # All strategies in display order for navigation (built once at import)
+    strategy_items = _STRATEGY_ITEMS
+    
+    # Rows are rewritten only when what they show changes; the whole screen is
+    # erased only on entry, on resize and when the list scrolls
+    full_redraw = True
+    rendered_rows = {}  # y position -> (text, attrs) last written there
+    rendered_status_version = None  # strategy_manager.status_version behind status_text/footer_text
+    
+    def draw_row(y, row_state, draw):
+        if rendered_rows.get(y) != row_state:
+            draw()
+            rendered_rows[y] = row_state
     
     while selection_mode:
         try:
-            # Clear and prepare screen
-            stdscr.clear()
-            
-            # Header
-            header_text = "HYPOTHESIS GENERATION STRATEGIES"
-            stdscr.addstr(1, (width - len(header_text)) // 2, header_text, curses.A_BOLD)
-            
-            current_status = interface.strategy_manager.get_status_text()
-            status_text = f"Current: {current_status}"
-            stdscr.addstr(2, (width - len(status_text)) // 2, status_text)
-            
-            # Instructions
-            instructions = [
-                "Press number keys (0-9) to toggle strategies | d=Default | ENTER=Apply | ESC/q=Cancel"
-            ]
-            for i, instruction in enumerate(instructions):
+            if full_redraw:
+                stdscr.erase()
+                rendered_rows.clear()
+                rendered_status_version = None
+                full_redraw = False
+                
+                # Header
+                header_text = "HYPOTHESIS GENERATION STRATEGIES"
+                try:
+                    stdscr.addstr(1, 0, header_text.center(width)[:width], curses.A_BOLD)
+                except curses.error:
+                    pass
+                
+                # Instructions
+                instructions = [
+                    "Press number keys (0-9) to toggle strategies | d=Default | ENTER=Apply | ESC/q=Cancel"
+                ]
+                for i, instruction in enumerate(instructions):
+                    try:
+                        stdscr.addstr(4 + i, 0, instruction.center(width)[:width])
+                    except curses.error:
+                        pass
+            
+            # Status and footer text only change when the selection does
+            footer_y = height - 2
+            if rendered_status_version != interface.strategy_manager.status_version:
+                rendered_status_version = interface.strategy_manager.status_version
+                status_text = f"Current: {interface.strategy_manager.get_status_text()}"
+                footer_text = f"Strategies: {interface.strategy_manager.active_count()} active"
                 try:
-                    stdscr.addstr(4 + i, (width - len(instruction)) // 2, instruction)
+                    # The centered text is padded to the full width, so it also clears the old status
+                    stdscr.addstr(2, 0, status_text.center(width)[:width])
+                    stdscr.move(footer_y, 0)
+                    stdscr.clrtoeol()
+                    stdscr.addstr(footer_y, 2, footer_text)
                 except curses.error:
                     pass
             
             # Strategy list
             list_start_y = 6
             visible_height = height - list_start_y - 3
+            is_default = interface.strategy_manager.default_mode
             
             # Display strategies
             for i, (strategy_name, strategy) in enumerate(strategy_items):
@@ -959,18 +1705,17 @@ def strategy_selection_interface(stdscr, interface):
                 y_pos = list_start_y + (i - scroll_offset)
                 
                 # Check if strategy is active
-                is_active = strategy_name in interface.strategy_manager.active_strategies
-                is_default = interface.strategy_manager.default_mode
+                is_active = interface.strategy_manager.is_active(strategy_name)
                 
-                # Status indicator
+                # Status indicator (padded so a shorter label overwrites a longer one)
                 if is_default:
                     status = " [DEFAULT] "
                     status_attr = curses.A_BOLD
                 elif is_active:
-                    status = " [ACTIVE] "
+                    status = " [ACTIVE]  "
                     status_attr = curses.color_pair(3)  # Green
                 else:
-                    status = " [OFF] "
+                    status = " [OFF]     "
                     status_attr = curses.A_DIM
                 
                 # Highlight current selection
@@ -984,20 +1729,16 @@ def strategy_selection_interface(stdscr, interface):
                 if len(strategy_line) > width - 20:
                     strategy_line = strategy_line[:width-23] + "..."
                 
-                try:
-                    stdscr.addstr(y_pos, 2, strategy_line, line_attr)
-                    stdscr.addstr(y_pos, width - 12, status, status_attr)
-                except curses.error:
-                    pass
-            
-            # Footer
-            footer_y = height - 2
-            try:
-                stdscr.addstr(footer_y, 2, f"Strategies: {len(interface.strategy_manager.active_strategies)} active")
-            except curses.error:
-                pass
+                def draw_strategy():
+                    try:
+                        stdscr.addstr(y_pos, 2, strategy_line, line_attr)
+                        stdscr.addstr(y_pos, width - 12, status, status_attr)
+                    except curses.error:
+                        pass
+                draw_row(y_pos, (strategy_line, line_attr, status, status_attr), draw_strategy)
             
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
             # Handle input
             key = stdscr.getch()
@@ -1018,21 +1759,24 @@ def strategy_selection_interface(stdscr, interface):
                     current_selection -= 1
                     if current_selection < scroll_offset:
                         scroll_offset = current_selection
+                        full_redraw = True
                         
             elif key == curses.KEY_DOWN:
                 if current_selection < len(strategy_items) - 1:
                     current_selection += 1
                     if current_selection >= scroll_offset + visible_height:
                         scroll_offset = current_selection - visible_height + 1
+                        full_redraw = True
+            
+            elif key == curses.KEY_RESIZE:
+                height, width = stdscr.getmaxyx()
+                full_redraw = True
                         
             elif ord('0') <= key <= ord('9'):  # Number keys to toggle strategies
                 strategy_key = chr(key)
                 if interface.strategy_manager.toggle_strategy(strategy_key):
-                    # Find and update current selection to the toggled strategy
-                    for i, (_, strategy) in enumerate(strategy_items):
-                        if strategy.key == strategy_key:
-                            current_selection = i
-                            break
+                    # Move the selection to the toggled strategy
+                    current_selection = _STRATEGY_ROW_BY_KEY.get(strategy_key, current_selection)
                 
         except curses.error:
             pass  # Ignore display errors
@@ -1048,7 +1792,316 @@ def strategy_selection_interface(stdscr, interface):
     stdscr.clear()
     interface.mark_dirty("all")
 
-def score_hypothesis_hallmarks(hypothesis, model_config):
+# OpenAI clients shared per (endpoint, key, timeout). Each client keeps a pool of
+# keep-alive connections, so later calls skip the TCP and TLS handshakes.
+_openai_clients = {}
+_openai_clients_lock = threading.Lock()
+
+def _get_openai_client(config, timeout=None):
+    """Return the shared OpenAI client for config's endpoint, creating it on first use"""
+    key = (config['api_base'], config['api_key'], timeout)
+    with _openai_clients_lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            options = {} if timeout is None else {"timeout": timeout}
+            client = _openai_clients[key] = openai.OpenAI(
+                api_key=config['api_key'],
+                base_url=config['api_base'],
+                **options
+            )
+    return client
+
+_RATE_LIMIT_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_RATE_LIMIT_UNIT_SECONDS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+def _parse_rate_limit_seconds(value):
+    """Seconds in a rate-limit header value such as "20", "1.5s", "6m0s" or "250ms", or None"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _RATE_LIMIT_DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _RATE_LIMIT_UNIT_SECONDS[unit] for amount, unit in parts)
+
+class RateLimitTracker:
+    """Holds calls to one model back only while its endpoint says the limit is used up.
+    
+    record() reads retry-after and the x-ratelimit-*-requests / -tokens headers
+    from each response (or 429 error); wait() sleeps until the reported reset
+    time when nothing is left, and returns at once otherwise.
+    """
+    def __init__(self):
+        self.resume_at = 0.0  # time.monotonic() before which calls should wait
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the endpoint's reported limit has reset"""
+        with self.lock:
+            delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def record(self, headers):
+        """Update the resume time from a response's headers"""
+        delay = _parse_rate_limit_seconds(headers.get('retry-after'))
+        for kind in ('requests', 'tokens'):
+            if headers.get(f'x-ratelimit-remaining-{kind}') == '0':
+                reset = _parse_rate_limit_seconds(headers.get(f'x-ratelimit-reset-{kind}'))
+                if reset is not None:
+                    delay = max(delay or 0, reset)
+        if delay:
+            with self.lock:
+                self.resume_at = max(self.resume_at, time.monotonic() + delay)
+
+# Per (endpoint, model): a RateLimitTracker, and an AIMDLimiter on concurrent calls that
+# starts at 8 in flight and adapts to how the endpoint copes, up to the maximum
+_model_call_limits = {}
+MODEL_CALL_INITIAL_CONCURRENCY = 8
+MODEL_CALL_MAX_CONCURRENCY = 32
+
+# Errors that mean the endpoint is overloaded, so concurrency should back off
+_OVERLOAD_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.InternalServerError)
+
+class _LimitedStream:
+    """A streamed chat completion that holds its concurrency slot until it is closed"""
+    def __init__(self, stream, concurrency, ticket):
+        self.stream = stream
+        self.concurrency = concurrency
+        self.ticket = ticket
+        self.throttled = False
+        self.released = False
+    
+    def __iter__(self):
+        try:
+            yield from self.stream
+        except _OVERLOAD_ERRORS:
+            self.throttled = True
+            raise
+    
+    def close(self):
+        try:
+            self.stream.close()
+        finally:
+            if not self.released:
+                self.released = True
+                self.concurrency.release(self.ticket, throttled=self.throttled)
+
+def _rate_limited_chat_completion(client, config, **params):
+    """Create a chat completion, waiting first if the model's endpoint reported no capacity left.
+    
+    With stream=True the slot stays taken until the returned stream is closed,
+    so callers must close it (in a finally) once they stop reading.
+    """
+    key = (config['api_base'], config['model_name'])
+    with _openai_clients_lock:
+        limits = _model_call_limits.get(key)
+        if limits is None:
+            limits = _model_call_limits[key] = (
+                RateLimitTracker(),
+                AIMDLimiter(initial=MODEL_CALL_INITIAL_CONCURRENCY, maximum=MODEL_CALL_MAX_CONCURRENCY)
+            )
+    tracker, concurrency = limits
+    
+    tracker.wait()
+    ticket = concurrency.acquire()
+    throttled = False
+    held = False
+    try:
+        raw_response = client.chat.completions.with_raw_response.create(**params)
+        tracker.record(raw_response.headers)
+        response = raw_response.parse()
+        if params.get('stream'):
+            # The request is still running while the stream is read
+            response = _LimitedStream(response, concurrency, ticket)
+            held = True
+        return response
+    except openai.APIStatusError as e:
+        # A 429 says how long to back off; the caller's retry then waits that long
+        tracker.record(e.response.headers)
+        throttled = isinstance(e, _OVERLOAD_ERRORS)
+        raise
+    except _OVERLOAD_ERRORS:
+        throttled = True
+        raise
+    finally:
+        if not held:
+            concurrency.release(ticket, throttled=throttled)
+
+# ---------------------------------------------------------------------
+# Response cache (SQLite)
+# ---------------------------------------------------------------------
+
+LLM_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".wisteria", "llm_cache.sqlite")
+LLM_CACHE_TTL = 30 * 24 * 3600  # seconds
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+_llm_cache_enabled = True
+_llm_cache_nondeterministic = False
+# How many times each request has been made in this run; the count is part of the
+# cache key so identical requests (e.g. the initial fan-out) get distinct entries
+_llm_cache_occurrences = {}
+
+def configure_llm_cache(enabled=True, nondeterministic=False):
+    """Set whether completions are cached, and whether sampled (temperature > 0) ones are too"""
+    global _llm_cache_enabled, _llm_cache_nondeterministic
+    _llm_cache_enabled = enabled
+    _llm_cache_nondeterministic = nondeterministic
+
+def _get_llm_cache():
+    """Open the response cache, creating it on first use; None if it cannot be opened"""
+    global _llm_cache, _llm_cache_enabled
+    if _llm_cache is not None:
+        return _llm_cache
+    
+    try:
+        os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT, created REAL)")
+        conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - LLM_CACHE_TTL,))
+        conn.commit()
+        _llm_cache = conn
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        print(f"Response cache unavailable: {e}")
+        # Don't retry opening it for every call
+        _llm_cache_enabled = False
+        return None
+
+def chat_completion_text(client, config, **params):
+    """Return the stripped message text of a chat completion, from the response cache when possible.
+    
+    Requests are keyed by a hash of the endpoint, the full parameters and how
+    many identical requests came before it in this run: the N identical
+    single-hypothesis calls of the initial fan-out, or feedback repeated on the
+    same hypothesis, each get their own entry, and a re-run of the same session
+    replays them in order.
+    
+    Only deterministic requests (temperature 0) are cached unless sampled ones
+    were enabled with configure_llm_cache; a request without a temperature uses
+    the API default of 1. Hypothesis generation, improvement, revision and new
+    hypotheses are all sampled, so in practice the cache only takes effect for
+    them with --cache-nondeterministic. Scoring and abstract updates stream
+    their responses and are never cached.
+    """
+    cacheable = _llm_cache_enabled and (_llm_cache_nondeterministic or params.get("temperature", 1) == 0)
+    if cacheable:
+        request_key = json.dumps({"api_base": config['api_base'], **params}, sort_keys=True)
+        with _llm_cache_lock:
+            occurrence = _llm_cache_occurrences.get(request_key, 0)
+            _llm_cache_occurrences[request_key] = occurrence + 1
+            key = hashlib.sha256(f"{request_key}#{occurrence}".encode("utf-8")).hexdigest()
+            conn = _get_llm_cache()
+            row = None
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT text FROM responses WHERE key = ? AND created >= ?",
+                        (key, time.time() - LLM_CACHE_TTL)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Error reading response cache: {e}")
+        if row is not None:
+            return row[0]
+    
+    response = _rate_limited_chat_completion(client, config, **params)
+    
+    # Handle the response based on the OpenAI client version
+    if hasattr(response, 'choices'):
+        # New OpenAI client
+        generated_text = response.choices[0].message.content.strip()
+    else:
+        # Legacy dict-style response
+        generated_text = response["choices"][0]["message"]["content"].strip()
+    
+    if cacheable and generated_text:
+        with _llm_cache_lock:
+            conn = _get_llm_cache()
+            if conn is not None:
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, text, created) VALUES (?, ?, ?)",
+                        (key, generated_text, time.time())
+                    )
+                    conn.commit()
+                except sqlite3.Error as e:
+                    print(f"Error writing response cache: {e}")
+    
+    return generated_text
+
+def batch_chat_completions(calls, max_concurrency=MODEL_CALL_MAX_CONCURRENCY, on_complete=None):
+    """Issue several model calls concurrently and return their results in order.
+    
+    Hosted APIs handle concurrent requests well and local vLLM servers batch
+    them continuously, so N calls finish in roughly the time of the slowest
+    one instead of the sum. The pool matches the per-model concurrency
+    ceiling; how many requests are actually in flight is left to the model's
+    AIMDLimiter in _rate_limited_chat_completion.
+    
+    Args:
+        calls (list): (fn, args, kwargs) tuples, each making one chat completion
+        max_concurrency (int): Maximum number of calls running at once
+        on_complete (callable, optional): Called as on_complete(done_count, total)
+            each time a call finishes
+        
+    Returns:
+        list: One entry per call; a call that raised is returned as its exception
+    """
+    return run_parallel(calls, max_workers=max_concurrency, on_complete=on_complete, return_exceptions=True)
+
+def stream_chat_json(client, config, on_progress=None, **request):
+    """Stream a chat completion and return the first complete JSON object in it as text.
+    
+    The response is scanned as it arrives and the stream is closed as soon as
+    the object's closing brace is seen, so trailing prose is never waited for.
+    
+    Args:
+        client: OpenAI client
+        config (dict): Configuration for the model API, for its rate limits
+        on_progress (callable, optional): Called as on_progress(chunks_received)
+        **request: Arguments for chat.completions.create
+        
+    Returns:
+        str or None: The JSON object text, or None if the response held no complete object
+    """
+    scanner = JsonObjectScanner()
+    received = 0
+    stream = _rate_limited_chat_completion(client, config, stream=True, **request)
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            received += 1
+            if on_progress:
+                on_progress(received)
+            json_text = scanner.feed(delta)
+            if json_text is not None:
+                return json_text
+    finally:
+        stream.close()
+    return None
+
+# The five hallmarks in display order, with their titles
+HALLMARK_TITLES = (
+    ('testability', 'Testability (Falsifiability)'),
+    ('specificity', 'Specificity and Clarity'),
+    ('grounded_knowledge', 'Grounded in Prior Knowledge'),
+    ('predictive_power', 'Predictive Power & Novel Insight'),
+    ('parsimony', 'Parsimony (Principle of Simplicity)'),
+)
+
+# Hallmarks every scoring response must include
+_REQUIRED_HALLMARKS = frozenset(key for key, _ in HALLMARK_TITLES)
+
+def score_hypothesis_hallmarks(hypothesis, model_config, on_progress=None):
     """Score hypothesis hallmarks on a 1-5 scale using AI evaluation"""
     try:
         # Get the hallmarks for scoring
@@ -1110,12 +2163,13 @@ Provide your scoring in this exact JSON format:
 }}"""
         
         # Call the model
-        client = openai.OpenAI(
-            api_key=model_config['api_key'],
-            base_url=model_config['api_base']
-        )
+        client = _get_openai_client(model_config)
         
-        response = client.chat.completions.create(
+        # Stream the response and stop reading once the JSON object is complete
+        json_text = stream_chat_json(
+            client,
+            model_config,
+            on_progress=on_progress,
             model=model_config['model_name'],
             messages=[
                 {"role": "system", "content": "You are a rigorous scientific evaluator who scores hypothesis hallmarks objectively and uses the full 1-5 scale aggressively. Always respond with valid JSON."},
@@ -1124,17 +2178,11 @@ Provide your scoring in this exact JSON format:
             temperature=0.3,  # Lower temperature for consistent scoring
             max_tokens=1000
         )
-        
-        response_text = response.choices[0].message.content.strip()
-        response_text = clean_json_string(response_text)
-        
-        # Extract JSON from response
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if not json_match:
+        if json_text is None:
             return {"error": "Could not extract JSON from model response"}
         
         try:
-            scoring_data = json.loads(json_match.group())
+            scoring_data = parse_llm_json(json_text)
         except json.JSONDecodeError as e:
             return {"error": f"JSON parsing error: {str(e)}"}
         
@@ -1145,15 +2193,15 @@ Provide your scoring in this exact JSON format:
         scores = scoring_data['scores']
         
         # Validate that all required hallmarks are scored
-        required_hallmarks = ['testability', 'specificity', 'grounded_knowledge', 'predictive_power', 'parsimony']
-        for hallmark in required_hallmarks:
-            if hallmark not in scores:
-                return {"error": f"Missing score for {hallmark}"}
-            
-            # Validate score range
-            score = scores[hallmark]
-            if not isinstance(score, int) or score < 1 or score > 5:
-                return {"error": f"Invalid score for {hallmark}: {score} (must be 1-5)"}
+        missing = _REQUIRED_HALLMARKS - scores.keys()
+        if missing:
+            return {"error": f"Missing score for {', '.join(sorted(missing))}"}
+        
+        # Validate score range (bool is an int subclass, so compare types exactly)
+        if not all(type(score) is int and 1 <= score <= 5 for score in scores.values()):
+            invalid = next(f"{hallmark}: {score}" for hallmark, score in scores.items()
+                           if not (type(score) is int and 1 <= score <= 5))
+            return {"error": f"Invalid score for {invalid} (must be 1-5)"}
         
         # Calculate total score
         total_score = sum(scores.values())
@@ -1169,7 +2217,7 @@ Provide your scoring in this exact JSON format:
     except Exception as e:
         return {"error": f"Error scoring hypothesis: {str(e)}"}
 
-def update_hypothesis_with_abstracts(hypothesis, model_config):
+def update_hypothesis_with_abstracts(hypothesis, model_config, on_progress=None):
     """Update hypothesis using information from downloaded abstracts"""
     try:
         # Find abstracts for this hypothesis
@@ -1178,8 +2226,15 @@ def update_hypothesis_with_abstracts(hypothesis, model_config):
         if not abstracts:
             return {"error": "No abstracts found. Use 'a' command to fetch abstracts first."}
         
-        # Prepare abstracts text for the prompt
-        abstracts_text = "\n\n".join([f"Abstract {i+1}:\n{abstract['content']}" for i, abstract in enumerate(abstracts)])
+        # Prepare abstracts text for the prompt, writing each abstract straight
+        # into one buffer rather than formatting a copy of each first
+        buf = io.StringIO()
+        for i, abstract in enumerate(abstracts):
+            if i:
+                buf.write("\n\n")
+            buf.write(f"Abstract {i+1}:\n")
+            buf.write(abstract['content'])
+        abstracts_text = buf.getvalue()
         
         # Create the update prompt
         update_prompt = f"""You are a research scientist updating a hypothesis based on new information from scientific abstracts.
@@ -1220,12 +2275,13 @@ Provide the response in this exact JSON format:
 }}"""
         
         # Call the model
-        client = openai.OpenAI(
-            api_key=model_config['api_key'],
-            base_url=model_config['api_base']
-        )
+        client = _get_openai_client(model_config)
         
-        response = client.chat.completions.create(
+        # Stream the response and stop reading once the JSON object is complete
+        json_text = stream_chat_json(
+            client,
+            model_config,
+            on_progress=on_progress,
             model=model_config['model_name'],
             messages=[
                 {"role": "system", "content": "You are a helpful research scientist assistant that updates hypotheses based on new scientific information. Always respond with valid JSON."},
@@ -1234,17 +2290,11 @@ Provide the response in this exact JSON format:
             temperature=0.7,
             max_tokens=2000
         )
-        
-        response_text = response.choices[0].message.content.strip()
-        response_text = clean_json_string(response_text)
-        
-        # Extract JSON from response
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if not json_match:
+        if json_text is None:
             return {"error": "Could not extract JSON from model response"}
         
         try:
-            updated_data = json.loads(json_match.group())
+            updated_data = parse_llm_json(json_text)
         except json.JSONDecodeError as e:
             return {"error": f"JSON parsing error: {str(e)}"}
         
@@ -1304,9 +2354,6 @@ def fetch_papers_for_hypothesis(hypothesis, session_name, interface=None):
     
     # Get Semantic Scholar API key from environment
     ss_api_key = os.environ.get('SS_API_KEY') or os.environ.get('SEMANTIC_SCHOLAR_API_KEY')
-    if not ss_api_key and interface:
-        interface.draw_status_bar("Warning: No SS API key found. Using public rate limits...")
-        time.sleep(2)
     
     results = {
         "status": "success",
@@ -1316,93 +2363,98 @@ def fetch_papers_for_hypothesis(hypothesis, session_name, interface=None):
     }
     
     total_refs = len(references)
+    hyp_id = hypothesis.get('hypothesis_number', 0)
     
     # Initialize all references as pending
     if interface:
-        hyp_id = hypothesis.get('hypothesis_number', 0)
         for i in range(total_refs):
-            interface.update_reference_status(hyp_id, i+1, 'pending')
+            interface.update_reference_status(hyp_id, i+1, REF_PENDING)
     
+    # Build a search query for every citation up front
+    citations = []
+    queries = []
     for i, ref in enumerate(references):
-        if interface:
-            hyp_id = hypothesis.get('hypothesis_number', 0)
-            status_msg = f"Fetching papers... ({i+1}/{total_refs})"
-            interface.draw_status_bar(status_msg)
-            interface.update_reference_status(hyp_id, i+1, 'fetching')
-            interface.stdscr.refresh()
+        if isinstance(ref, dict):
+            citation = ref.get('citation', '')
+        else:
+            citation = str(ref)
         
+        if not citation:
+            results["failed"].append({"index": i+1, "reason": "Empty citation"})
+            if interface:
+                interface.update_reference_status(hyp_id, i+1, REF_FAILED)
+            continue
+        
+        # Extract paper information from citation
+        paper_info = extract_paper_info_from_citation(citation)
+        
+        # Search for papers using title or author+year
+        query = paper_info.get('title', '') or f"{paper_info.get('author', '')} {paper_info.get('year', '')}"
+        if not query.strip():
+            query = citation[:50]  # Use first 50 chars as fallback
+        
+        citations.append((i, citation))
+        queries.append(query.strip())
+        if interface:
+            interface.update_reference_status(hyp_id, i+1, REF_FETCHING)
+    
+    # Each reference runs search -> save abstract -> download PDF on its own
+    # worker, so one slow lookup or download never holds up the others.
+    # Progress goes through set_status and update_reference_status, which the
+    # main loop draws; workers never touch curses directly.
+    progress_lock = threading.Lock()
+    completed = [0]
+    
+    def fetch_one(i, citation, query):
+        fetched = False
         try:
-            if isinstance(ref, dict):
-                citation = ref.get('citation', '')
-            else:
-                citation = str(ref)
-            
-            if not citation:
-                results["failed"].append({"index": i+1, "reason": "Empty citation"})
-                if interface:
-                    interface.update_reference_status(hyp_id, i+1, 'failed')
-                continue
+            papers = search_semantic_scholar(query, max_results=3, api_key=ss_api_key)
+            if not papers:
+                return None, {"index": i+1, "citation": citation, "reason": "No papers found"}
             
-            # Extract paper information from citation
-            paper_info = extract_paper_info_from_citation(citation)
-            
-            # Search for papers using title or author+year
-            query = paper_info.get('title', '') or f"{paper_info.get('author', '')} {paper_info.get('year', '')}"
-            if not query.strip():
-                query = citation[:50]  # Use first 50 chars as fallback
-            
-            papers = search_semantic_scholar(query.strip(), max_results=3, api_key=ss_api_key)
-            
-            if papers:
-                # Use the most relevant paper (first one)
-                best_paper = papers[0]
-                
-                # Save abstract
-                abstract_path = save_abstract_to_file(best_paper, papers_dir, i+1)
-                
-                # Try to download PDF
-                pdf_path = download_paper_pdf(best_paper, papers_dir, i+1)
-                
-                results["fetched"].append({
-                    "index": i+1,
-                    "citation": citation,
-                    "title": best_paper.get('title'),
-                    "abstract_path": abstract_path,
-                    "pdf_path": pdf_path,
-                    "paper_id": best_paper.get('paper_id'),
-                    "doi": best_paper.get('doi'),
-                    "venue": best_paper.get('venue')
-                })
-                
-                # Update status to success
-                if interface:
-                    interface.update_reference_status(hyp_id, i+1, 'success')
-            else:
-                results["failed"].append({
-                    "index": i+1, 
-                    "citation": citation,
-                    "reason": "No papers found"
-                })
-                
-                # Update status to failed
-                if interface:
-                    interface.update_reference_status(hyp_id, i+1, 'failed')
-        
-        except Exception as e:
-            results["failed"].append({
+            # Use the most relevant paper (first one)
+            best_paper = papers[0]
+            abstract_path = save_abstract_to_file(best_paper, papers_dir, i+1)
+            pdf_path = download_paper_pdf(best_paper, papers_dir, i+1, _http_session)
+            fetched = True
+            return {
                 "index": i+1,
-                "citation": citation if 'citation' in locals() else "Unknown",
-                "reason": str(e)
-            })
-            
-            # Update status to failed
+                "citation": citation,
+                "title": best_paper.get('title'),
+                "abstract_path": abstract_path,
+                "pdf_path": pdf_path,
+                "paper_id": best_paper.get('paper_id'),
+                "doi": best_paper.get('doi'),
+                "venue": best_paper.get('venue')
+            }, None
+        except Exception as e:
+            return None, {"index": i+1, "citation": citation, "reason": str(e)}
+        finally:
             if interface:
-                interface.update_reference_status(hyp_id, i+1, 'failed')
-        
-        # Add delay between requests to be respectful to the API
-        # Use longer delay if no API key (public rate limits are stricter)
-        delay = 3 if not ss_api_key else 1
-        time.sleep(delay)
+                # Each reference's indicator flips as soon as its own fetch finishes
+                interface.update_reference_status(hyp_id, i+1, REF_SUCCESS if fetched else REF_FAILED)
+                with progress_lock:
+                    completed[0] += 1
+                    done = completed[0]
+                interface.set_status(f"Fetching papers... ({done}/{len(citations)})")
+    
+    if interface:
+        if ss_api_key:
+            interface.set_status(f"Fetching papers for {len(citations)} references...")
+        else:
+            interface.set_status(f"Fetching papers for {len(citations)} references (no SS API key, using public rate limits)...")
+    
+    # Public rate limits are stricter without an API key
+    outcomes = run_parallel(
+        [(fetch_one, (i, citation, query), {}) for (i, citation), query in zip(citations, queries)],
+        max_workers=10 if ss_api_key else 3
+    )
+    
+    for fetched, failed in outcomes:
+        if fetched:
+            results["fetched"].append(fetched)
+        else:
+            results["failed"].append(failed)
     
     return results
 
@@ -1410,6 +2462,33 @@ def fetch_papers_for_hypothesis(hypothesis, session_name, interface=None):
 # Curses Interface Classes and Pane Management
 # ---------------------------------------------------------------------
 
+# Wrapped text blocks kept by CursesInterface.safe_wrap_lines; one details
+# render wraps roughly 20-40 blocks, so this holds a dozen or so hypotheses
+WRAP_CACHE_SIZE = 512
+
+# Initial height of the details content pad
+DETAIL_PAD_ROWS = 256
+
+# Status bar text for CursesInterface.pending_operations counts:
+# (operation type, message, singular suffix, plural suffix)
+_PENDING_STATUS_FORMATS = (
+    ('generating_new', "Generating {count} new hypothes", "is", "es"),
+    ('fetching_papers', "Fetching papers ({count} active)", "", ""),
+    ('improving', "Improving {count} hypothes", "is", "es"),
+    ('saving', "Saving {count} file", "", "s"),
+    ('loading', "Loading {count} file", "", "s"),
+)
+
+# Command hints on the status bar; the short form replaces both lines on narrow terminals
+_STATUS_COMMANDS = " f=Feedback n=New l=Load x=Save t=Notes s=Select v=View h=Toggle r=Refs a=Papers u=Update b=Browse c=Score w=Strategy p=PDF q=Quit "
+_STATUS_COMMANDS_NAV = " Up/Down=Navigate j/k=Scroll d/u=FastScroll g=Home "
+_STATUS_COMMANDS_SHORT = " f=Feedback n=New a=Papers u=Update b=Browse c=Score w=Strategy p=PDF q=Quit j/k=Scroll "
+
+# Reference fetch states, and the indicator drawn for each. The details pane
+# is written through safe_addstr, which drops non-ASCII, so the glyphs are ASCII.
+REF_PENDING, REF_FETCHING, REF_SUCCESS, REF_FAILED = range(4)
+_REF_STATUS_INDICATORS = (" ", "~", "+", "X")
+
 class CursesInterface:
     """Main curses interface manager for multi-pane layout"""
     
@@ -1423,6 +2502,13 @@ class CursesInterface:
         self.LIST_WIDTH = int(self.width * 0.35)  # 35% for hypothesis list
         self.DETAIL_WIDTH = self.width - self.LIST_WIDTH - 1  # Rest for details
         
+        # LRU cache of wrapped text keyed by (text, width), so redraws skip textwrap
+        self._wrap_cache = OrderedDict()
+        self._wrap_cache_lock = threading.Lock()
+        # Per width, for cache misses: a TextWrapper (textwrap.wrap builds a new one
+        # per call) and a pattern matching words too long to fit on a line
+        self._wrappers = {}
+        
         # Initialize color pairs
         self.init_colors()
         
@@ -1438,10 +2524,14 @@ class CursesInterface:
         
         # Status message management
         self.current_status = "Ready"
-        self.status_timestamp = time.time()
-        self.status_timeout = 3.0  # Status messages auto-clear after 3 seconds
+        # Monotonic time when the status message auto-clears (after 3 seconds by
+        # default), so wall-clock changes can't expire or pin it
+        self.status_deadline = time.monotonic() + 3.0
         self.persistent_status = False  # Some statuses should persist until user action
         
+        # Set whenever the status bar may need redrawing; wakes the status refresh thread
+        self.status_event = threading.Event()
+        
         # Progress tracking for operations
         self.progress_operations = {}
         # Format: {operation_id: {'type': 'generating', 'current': 2, 'total': 5, 'message': 'Generating hypotheses', 'start_time': time.time()}}
@@ -1450,6 +2540,15 @@ class CursesInterface:
         self.dirty_header = True
         self.dirty_list = True
         self.dirty_details = True
+        self.dirty_detail_scroll = False  # Details pad only needs its viewport moved
+        self.detail_content_rows = 0
+        # What the details pane was last rendered from; cleared whenever the
+        # rendered content may be stale even though the inputs look the same
+        self._last_detail_fingerprint = None
+        # Pad row of each displayed reference's status indicator, and the references
+        # whose status changed since, so they can be patched without a re-render
+        self._ref_indicator_rows = {}
+        self._stale_ref_indicators = set()
         self.dirty_status = True
         self.last_hypothesis_count = 0
         self.last_current_idx = -1
@@ -1461,9 +2560,18 @@ class CursesInterface:
         
         # Sorting management
         self.sort_mode = "numerical"  # Can be "numerical" or "score"
+        # Versions and latest version per hypothesis number, maintained as
+        # hypotheses are added (see index_hypothesis)
+        self._hyp_by_num = {}  # hypothesis number -> [versions in insert order]
+        self._latest_by_num = {}  # hypothesis number -> latest version
+        # Both sort orders, rebuilt only when list_data_version moves (see invalidate_list_index)
+        self.list_data_version = 0
+        self._list_index_version = -1
+        self._list_index = None
+        self._list_line_cache = {}  # hypothesis number -> formatted list row
         
         # Reference fetching status tracking
-        self.reference_status = {}  # {hypothesis_id: {ref_index: 'pending'|'fetching'|'success'|'failed'}}
+        self.reference_status = {}  # {(hypothesis_id, ref_index): REF_PENDING|REF_FETCHING|REF_SUCCESS|REF_FAILED}
         
         # Pending operations tracking
         self.pending_operations = {
@@ -1473,16 +2581,24 @@ class CursesInterface:
             'saving': 0,              # Count of pending save operations
             'loading': 0              # Count of pending load operations
         }
+        # Guards only the counter updates, so callbacks never wait on the status refresh
+        self.pending_lock = threading.Lock()
         
-        # Status refresh thread management
+        # Status refresh thread management; status_lock guards progress_operations
+        # and is only held for dict updates and snapshots, never while drawing or
+        # signalling status_event. It is never re-acquired while held, so a plain
+        # Lock (already the bare C lock in CPython) is enough.
         self.status_refresh_active = True
         self.status_refresh_thread = None
         self.status_lock = threading.Lock()
-        self.start_status_refresh_thread()
         
-        # Initialize TaskQueue for background operations
-        self.task_queue = TaskQueue(max_workers=3)
+        # Initialize TaskQueue for background operations; the running-task snapshot
+        # is re-read only after a task starts or finishes
+        self._running_tasks = {}
+        self._running_tasks_dirty = True
+        self.task_queue = TaskQueue(max_workers=3, on_state_change=self._on_task_state_change)
         self.task_queue.start()
+        self.start_status_refresh_thread()
         
         # Initialize Hypothesis Strategy Manager
         self.strategy_manager = HypothesisStrategyManager()
@@ -1490,38 +2606,77 @@ class CursesInterface:
     def start_status_refresh_thread(self):
         """Start background thread to refresh status display"""
         def refresh_status_loop():
-            import time
             while self.status_refresh_active:
                 try:
-                    with self.status_lock:
-                        # Update any progress operations
-                        self.update_progress_display()
-                        
-                        # Refresh status if needed
-                        if self.dirty_status:
-                            self.draw_status_bar()
-                            try:
-                                self.status_win.refresh()
-                            except:
-                                pass  # Ignore refresh errors during shutdown
-                            self.dirty_status = False
+                    # Sleep until something changes or the status message times out;
+                    # while work is in flight, also wake once a second so elapsed
+                    # times and ETAs keep advancing
+                    wait_timeout = self.status_expires_in()
+                    if self.progress_operations or self.get_running_tasks():
+                        wait_timeout = 1.0 if wait_timeout is None else min(1.0, wait_timeout)
+                    self.status_event.wait(timeout=wait_timeout)
+                    if not self.status_refresh_active:
+                        break
+                    
+                    # A timed-out message is replaced by "Ready" when the bar is drawn
+                    if self.status_expires_in() == 0:
+                        self.mark_dirty("status")
+                    
+                    # Update any progress operations
+                    self.update_progress_display()
+                    # Clear after our own set_status above so it doesn't wake us straight
+                    # back up; changes made meanwhile are still drawn below
+                    self.status_event.clear()
                     
-                    time.sleep(0.5)  # Update every 500ms
+                    # Refresh status if needed
+                    if self.dirty_status:
+                        self.draw_status_bar()
+                        try:
+                            self.status_win.refresh()
+                        except:
+                            pass  # Ignore refresh errors during shutdown
+                        self.dirty_status = False
                 except Exception:
                     pass  # Ignore errors during shutdown
         
         self.status_refresh_thread = threading.Thread(target=refresh_status_loop, daemon=True)
         self.status_refresh_thread.start()
         
+    def _on_task_state_change(self):
+        self._running_tasks_dirty = True
+        self.status_event.set()
+    
+    def get_running_tasks(self):
+        """Running tasks, taken from the TaskQueue only when a task has changed state since the last call"""
+        if self._running_tasks_dirty:
+            # Clear first so a change during the read is picked up next time
+            self._running_tasks_dirty = False
+            self._running_tasks = self.task_queue.get_running_tasks()
+        return self._running_tasks
+    
     def stop_status_refresh_thread(self):
         """Stop the status refresh thread"""
         self.status_refresh_active = False
+        self.status_event.set()
         if self.status_refresh_thread:
             try:
                 self.status_refresh_thread.join(timeout=1.0)
             except:
                 pass
     
+    # Typed submit helpers so interactive work is never queued behind background fetches
+    def submit_scoring(self, name, func, callback=None):
+        """Submit a UI-blocking scoring task (HIGH priority)"""
+        return self.task_queue.submit_task(name, func, priority=TaskPriority.HIGH, callback=callback)
+    
+    def submit_generation(self, name, func, callback=None):
+        """Submit a hypothesis generation/refinement task (MEDIUM priority)"""
+        return self.task_queue.submit_task(name, func, priority=TaskPriority.MEDIUM, callback=callback)
+    
+    def submit_background_fetch(self, name, func, callback=None):
+        """Submit a paper/abstract/PDF fetch task (LOW priority, on the I/O pool)"""
+        return self.task_queue.submit_task(name, func, priority=TaskPriority.LOW, callback=callback, io_bound=True)
+    
     def cleanup(self):
         """Clean up resources including TaskQueue and threads"""
         self.stop_status_refresh_thread()
@@ -1538,43 +2693,50 @@ class CursesInterface:
                 'message': message,
                 'start_time': time.time()
             }
-            self.mark_dirty("status")
+        self.mark_dirty("status")
             
     def update_progress_operation(self, operation_id, current_item, message=None):
         """Update progress for an operation"""
         with self.status_lock:
-            if operation_id in self.progress_operations:
-                self.progress_operations[operation_id]['current'] = current_item
+            op_data = self.progress_operations.get(operation_id)
+            if op_data is not None:
+                op_data['current'] = current_item
                 if message:
-                    self.progress_operations[operation_id]['message'] = message
-                self.mark_dirty("status")
+                    op_data['message'] = message
+        if op_data is not None:
+            self.mark_dirty("status")
                 
     def remove_progress_operation(self, operation_id):
         """Remove a completed progress operation"""
         with self.status_lock:
-            if operation_id in self.progress_operations:
-                del self.progress_operations[operation_id]
-                self.mark_dirty("status")
+            removed = self.progress_operations.pop(operation_id, None)
+        if removed is not None:
+            self.mark_dirty("status")
                 
     def update_progress_display(self):
         """Update the progress display in status bar"""
         # Check for running tasks in TaskQueue
-        running_tasks = self.task_queue.get_running_tasks()
+        running_tasks = self.get_running_tasks()
+        
+        # Copy the operations so the lock is not held while formatting
+        with self.status_lock:
+            operations = [dict(op_data) for op_data in self.progress_operations.values()]
         
-        if not self.progress_operations and not running_tasks:
+        if not operations and not running_tasks:
             return
             
         # Build progress message
         progress_messages = []
         current_time = time.time()
         
-        # Add TaskQueue running tasks
+        # Add TaskQueue running tasks (timestamps are monotonic nanoseconds)
+        now_ns = time.monotonic_ns()
         for task_id, task in running_tasks.items():
-            elapsed = current_time - task.started_at if task.started_at else 0
+            elapsed = (now_ns - task.started_at) / 1e9 if task.started_at else 0
             progress_messages.append(f"{task.name} ({elapsed:.0f}s)")
         
         # Add legacy progress operations (for backward compatibility)
-        for op_id, op_data in self.progress_operations.items():
+        for op_data in operations:
             current = op_data['current']
             total = op_data['total']
             message = op_data['message']
@@ -1605,87 +2767,60 @@ class CursesInterface:
         # Update status with progress info
         if progress_messages:
             combined_message = " | ".join(progress_messages)
-            self.set_status(combined_message, persistent=True)
+            # Nothing to redraw if the status bar already shows this message
+            if combined_message != self.current_status or not self.persistent_status:
+                self.set_status(combined_message, persistent=True)
         
     def get_reference_status_indicator(self, hypothesis_id, ref_index):
         """Get status indicator for a specific reference"""
-        if hypothesis_id not in self.reference_status:
-            return " "  # No status available
-        
-        status = self.reference_status[hypothesis_id].get(ref_index, 'pending')
-        if status == 'pending':
-            return " "  # No indicator for pending
-        elif status == 'fetching':
-            try:
-                return "⏳"  # Hourglass for in-progress
-            except (UnicodeEncodeError, curses.error):
-                return "~"  # Fallback for in-progress
-        elif status == 'success':
-            try:
-                return "✓"  # Check mark for success
-            except (UnicodeEncodeError, curses.error):
-                return "+"  # Fallback for success
-        elif status == 'failed':
-            try:
-                return "✗"  # X mark for failure
-            except (UnicodeEncodeError, curses.error):
-                return "X"  # Fallback for failure
-        else:
-            return " "
+        return _REF_STATUS_INDICATORS[self.reference_status.get((hypothesis_id, ref_index), REF_PENDING)]
             
     def update_reference_status(self, hypothesis_id, ref_index, status):
         """Update the status of a specific reference"""
-        if hypothesis_id not in self.reference_status:
-            self.reference_status[hypothesis_id] = {}
-        self.reference_status[hypothesis_id][ref_index] = status
-        # Mark details pane for refresh
-        self.mark_dirty("details")
-        
-        # Force immediate refresh if currently displayed hypothesis matches
-        current_hyp_num = getattr(self, '_current_displayed_hypothesis_id', None)
-        if current_hyp_num == hypothesis_id:
-            try:
-                self.detail_win.refresh()
-            except:
-                pass  # Ignore refresh errors during threading
+        self.reference_status[(hypothesis_id, ref_index)] = status
+        # Only the indicator is stale; the main loop patches it in the details pad
+        # once per frame (see _patch_reference_indicators)
+        if getattr(self, '_current_displayed_hypothesis_id', None) == hypothesis_id:
+            self._stale_ref_indicators.add(ref_index)
+    
+    def _patch_reference_indicators(self):
+        """Redraw the status column of references whose fetch status changed"""
+        # Copy then discard, so indicators marked meanwhile by fetch threads are kept
+        stale = list(self._stale_ref_indicators)
+        self._stale_ref_indicators.difference_update(stale)
+        hyp_id = getattr(self, '_current_displayed_hypothesis_id', None)
+        for ref_index in stale:
+            row = self._ref_indicator_rows.get(ref_index)
+            if row is not None:
+                self.safe_addstr(self.detail_pad, row, 0, self.get_reference_status_indicator(hyp_id, ref_index), curses.A_BOLD)
+        self.dirty_detail_scroll = True
                 
     def add_pending_operation(self, operation_type):
         """Add a pending operation and update status display"""
-        self.pending_operations[operation_type] += 1
+        with self.pending_lock:
+            self.pending_operations[operation_type] += 1
         self.update_pending_status()
         
     def remove_pending_operation(self, operation_type):
         """Remove a pending operation and update status display"""
-        if self.pending_operations[operation_type] > 0:
-            self.pending_operations[operation_type] -= 1
+        with self.pending_lock:
+            if self.pending_operations[operation_type] > 0:
+                self.pending_operations[operation_type] -= 1
         self.update_pending_status()
         
     def update_pending_status(self):
         """Update status bar to show pending operations"""
-        pending_msgs = []
-        
-        if self.pending_operations['generating_new'] > 0:
-            count = self.pending_operations['generating_new']
-            pending_msgs.append(f"Generating {count} new hypothesis{'es' if count > 1 else ''}")
-            
-        if self.pending_operations['fetching_papers'] > 0:
-            count = self.pending_operations['fetching_papers']
-            pending_msgs.append(f"Fetching papers ({count} active)")
-            
-        if self.pending_operations['improving'] > 0:
-            count = self.pending_operations['improving']
-            pending_msgs.append(f"Improving {count} hypothesis{'es' if count > 1 else ''}")
-            
-        if self.pending_operations['saving'] > 0:
-            count = self.pending_operations['saving']
-            pending_msgs.append(f"Saving {count} file{'s' if count > 1 else ''}")
-            
-        if self.pending_operations['loading'] > 0:
-            count = self.pending_operations['loading']
-            pending_msgs.append(f"Loading {count} file{'s' if count > 1 else ''}")
+        pending = dict(self.pending_operations)  # Lock-free snapshot of the counters
+        pending_msgs = [
+            message.format(count=pending[operation_type]) + (singular if pending[operation_type] == 1 else plural)
+            for operation_type, message, singular, plural in _PENDING_STATUS_FORMATS
+            if pending[operation_type] > 0
+        ]
         
         if pending_msgs:
             status_msg = " • ".join(pending_msgs) + "..."
+            if status_msg == self.current_status:
+                return  # Already on screen
             self.draw_status_bar(status_msg)
             self.status_win.refresh()
         
@@ -1703,6 +2838,13 @@ class CursesInterface:
             curses.init_pair(5, curses.COLOR_WHITE, curses.COLOR_BLUE)  # Header
             curses.init_pair(6, curses.COLOR_BLACK, curses.COLOR_WHITE) # Status bar
             curses.init_pair(7, curses.COLOR_MAGENTA, -1)  # Selected item
+        
+        # Attribute combinations used by the draw methods, computed once
+        self.ATTR_HEADER = curses.color_pair(5) | curses.A_BOLD
+        self.ATTR_INFO = curses.color_pair(4)
+        self.ATTR_NOTES = curses.color_pair(5)
+        self.ATTR_IMPROVEMENT = curses.color_pair(4) | curses.A_BOLD
+        self.ATTR_STATUS = curses.color_pair(6)
             
     def create_panes(self):
         """Create all interface panes"""
@@ -1729,61 +2871,40 @@ class CursesInterface:
         self.status_win = curses.newwin(
             self.STATUS_HEIGHT, self.width, status_start_y, 0
         )
-        
-        # Enable scrolling for list and detail panes
+        # Command hint columns only depend on the width (None = doesn't fit)
+        self._cmds_x = max(0, self.width - len(_STATUS_COMMANDS))
+        self._cmds_nav_x = (max(0, self.width - len(_STATUS_COMMANDS_NAV))
+                            if self.STATUS_HEIGHT >= 2 and len(_STATUS_COMMANDS_NAV) < self.width else None)
+        self._cmds_short_x = max(0, self.width - len(_STATUS_COMMANDS_SHORT))
+        
+        # Details content is rendered into a pad and shown through detail_win's
+        # interior; it grows on demand (see _ensure_detail_pad_rows)
+        self.detail_pad = curses.newpad(DETAIL_PAD_ROWS, max(1, self.DETAIL_WIDTH - 3))
+        self._last_detail_fingerprint = None
+        # Wrap widths for details content (pad column 0 is column 2 of the pane):
+        # full-width sections, indented blocks and citations, reference annotations
+        self._detail_content_width = self.DETAIL_WIDTH - 4
+        self._detail_indented_width = self._detail_content_width - 3
+        self._detail_annotation_width = self._detail_content_width - 6
+        
+        # Enable scrolling for the list pane
         self.list_win.scrollok(True)
-        self.detail_win.scrollok(True)
         
     def draw_border(self, window):
-        """Draw clean border using proper box-drawing characters"""
-        height, width = window.getmaxyx()
+        """Draw clean border using the terminal's line-drawing characters.
         
+        box() draws all four sides and corners in one ncurses call and maps to
+        ASCII automatically on terminals without line-drawing support.
+        """
         try:
-            # Try to use Unicode box-drawing characters
-            # Top border
-            window.addch(0, 0, '┌')  # top-left corner
-            for x in range(1, width - 1):
-                window.addch(0, x, '─')  # horizontal line
-            window.addch(0, width - 1, '┐')  # top-right corner
-            
-            # Side borders
-            for y in range(1, height - 1):
-                window.addch(y, 0, '│')  # left vertical line
-                window.addch(y, width - 1, '│')  # right vertical line
-            
-            # Bottom border
-            window.addch(height - 1, 0, '└')  # bottom-left corner
-            for x in range(1, width - 1):
-                window.addch(height - 1, x, '─')  # horizontal line
-            window.addch(height - 1, width - 1, '┘')  # bottom-right corner
-            
-        except (curses.error, UnicodeEncodeError):
-            # Fallback to ASCII characters if Unicode fails
-            try:
-                # Top border
-                window.addch(0, 0, '+')
-                for x in range(1, width - 1):
-                    window.addch(0, x, '-')
-                window.addch(0, width - 1, '+')
-                
-                # Side borders
-                for y in range(1, height - 1):
-                    window.addch(y, 0, '|')
-                    window.addch(y, width - 1, '|')
-                
-                # Bottom border
-                window.addch(height - 1, 0, '+')
-                for x in range(1, width - 1):
-                    window.addch(height - 1, x, '-')
-                window.addch(height - 1, width - 1, '+')
-            except curses.error:
-                # Final fallback - use box() if all else fails
-                window.box()
+            window.box()
+        except curses.error:
+            pass
         
     def draw_header(self, research_goal, model_name):
         """Draw the header pane with research goal and model info"""
         self.header_win.clear()
-        self.header_win.attron(curses.color_pair(5) | curses.A_BOLD)
+        self.header_win.attron(self.ATTR_HEADER)
         
         # Title line
         title = f" WISTERIA v6 - Research Hypothesis Generator"
@@ -1791,15 +2912,17 @@ class CursesInterface:
         title_line = title + " " * max(0, self.width - len(title) - len(model_info)) + model_info
         self.safe_addstr(self.header_win, 0, 0, title_line[:self.width])
         
-        # Separator
-        self.safe_addstr(self.header_win, 1, 0, "-" * (self.width-1))
+        # Separator, written straight into the window without building a string
+        try:
+            self.header_win.hline(1, 0, ord('-') | self.ATTR_HEADER, self.width - 1)
+        except curses.error:
+            pass
         
-        self.header_win.attroff(curses.color_pair(5) | curses.A_BOLD)
+        self.header_win.attroff(self.ATTR_HEADER)
         
         # Research goal (wrapped)
         goal_text = f"Research Goal: {research_goal}"
-        wrapped_goal = self.safe_wrap_text(goal_text, self.width - 2)
-        goal_lines = wrapped_goal.split('\n')
+        goal_lines = self.safe_wrap_lines(goal_text, self.width - 2)
         
         for i, line in enumerate(goal_lines[:2]):  # Max 2 lines for goal
             if i + 2 < self.HEADER_HEIGHT:
@@ -1807,6 +2930,71 @@ class CursesInterface:
         
         # Refresh moved to single refresh cycle
         
+    def invalidate_list_index(self):
+        """Call after hypotheses are added, replaced or rescored"""
+        self.list_data_version += 1
+        self.mark_dirty("list")
+    
+    def index_hypothesis(self, hypothesis):
+        """Add a newly recorded hypothesis (or new version) to the per-number index"""
+        hyp_num = hypothesis.get("hypothesis_number", 0)
+        self._hyp_by_num.setdefault(hyp_num, []).append(hypothesis)
+        latest = self._latest_by_num.get(hyp_num)
+        if latest is None or version_key(hypothesis) > version_key(latest):
+            self._latest_by_num[hyp_num] = hypothesis
+        self.invalidate_list_index()
+    
+    def get_latest_hypothesis_at(self, idx):
+        """Latest version of the idx-th hypothesis in numerical order, or None"""
+        by_num = self._get_list_index()[1]
+        if 0 <= idx < len(by_num):
+            return self._latest_by_num[by_num[idx]]
+        return None
+    
+    def _get_list_index(self):
+        """Return (latest version by number, numbers in numerical order, numbers in score order)"""
+        index_key = (self.list_data_version, self.LIST_WIDTH)
+        if self._list_index_version != index_key:
+            # Formatted rows depend on the same data, plus the pane width
+            self._list_line_cache = {}
+            latest_by_num = self._latest_by_num
+            
+            by_num = sorted(latest_by_num)
+            # Sort by score (descending), then by hypothesis number; -1 for unscored
+            by_score = sorted(
+                by_num,
+                key=lambda n: (-latest_by_num[n].get("hallmark_scores", {}).get("total_score", -1), n)
+            )
+            self._list_index = (latest_by_num, by_num, by_score)
+            self._list_index_version = index_key
+        return self._list_index
+    
+    def _format_list_line(self, hyp_num, latest_version):
+        """Build the hypothesis list row for the latest version of a hypothesis"""
+        version = latest_version.get("version", "1.0")
+        title = latest_version.get("title", "Untitled")
+        hyp_type = latest_version.get("type", "unknown")
+        
+        # Check if there are hallmark scores
+        score_indicator = ""
+        hallmark_scores = latest_version.get("hallmark_scores", {})
+        if hallmark_scores and "total_score" in hallmark_scores:
+            total_score = hallmark_scores["total_score"]
+            score_indicator = f" ({total_score}/25)"
+        
+        # Truncate title to fit (accounting for score display)
+        max_title_len = self.LIST_WIDTH - 15 - len(score_indicator)
+        if len(title) > max_title_len:
+            title = title[:max_title_len-3] + "..."
+        
+        type_indicator = ""
+        if hyp_type == "improvement":
+            type_indicator = " (imp)"
+        elif hyp_type == "new_alternative": 
+            type_indicator = " (alt)"
+            
+        return f"{hyp_num}. [v{version}]{score_indicator} {title}{type_indicator}"
+    
     def draw_hypothesis_list(self, all_hypotheses):
         """Draw the hypothesis list pane"""
         self.list_win.clear()
@@ -1825,84 +3013,104 @@ class CursesInterface:
         self.list_win.addstr(0, title_x, list_title, title_attr)
         
         if not all_hypotheses:
-            self.list_win.addstr(2, 2, "No hypotheses yet", curses.color_pair(4))
+            self.list_win.addstr(2, 2, "No hypotheses yet", self.ATTR_INFO)
             # Refresh moved to single refresh cycle
             return
             
-        # Group hypotheses by number
-        hypothesis_groups = {}
-        for hyp in all_hypotheses:
-            hyp_num = hyp.get("hypothesis_number", 0)
-            if hyp_num not in hypothesis_groups:
-                hypothesis_groups[hyp_num] = []
-            hypothesis_groups[hyp_num].append(hyp)
-        
         # Display hypothesis list
-        y_pos = 2
         list_height = self.list_win.getmaxyx()[0] - 3  # Account for borders
         
         # Sort hypothesis numbers based on current sort mode
-        if self.sort_mode == "score":
-            # Sort by score (descending), then by hypothesis number
-            def get_sort_key(hyp_num):
-                latest_version = max(hypothesis_groups[hyp_num], key=lambda h: h.get("version", "1.0"))
-                hallmark_scores = latest_version.get("hallmark_scores", {})
-                total_score = hallmark_scores.get("total_score", -1)  # -1 for unscored
-                return (-total_score, hyp_num)  # Negative for descending order
-            sorted_hyp_nums = sorted(hypothesis_groups.keys(), key=get_sort_key)
-        else:
-            # Default numerical sorting
-            sorted_hyp_nums = sorted(hypothesis_groups.keys())
-        
-        for hyp_num in sorted_hyp_nums:
-            if y_pos - 2 < self.list_scroll_offset:
-                continue
-            if y_pos >= list_height + self.list_scroll_offset:
-                break
-                
-            hyp_versions = hypothesis_groups[hyp_num]
-            latest_version = max(hyp_versions, key=lambda h: h.get("version", "1.0"))
-            
-            version = latest_version.get("version", "1.0")
-            title = latest_version.get("title", "Untitled")
-            hyp_type = latest_version.get("type", "unknown")
-            
-            # Check if there are hallmark scores
-            score_indicator = ""
-            hallmark_scores = latest_version.get("hallmark_scores", {})
-            if hallmark_scores and "total_score" in hallmark_scores:
-                total_score = hallmark_scores["total_score"]
-                score_indicator = f" ({total_score}/25)"
-            
-            # Truncate title to fit (accounting for score display)
-            max_title_len = self.LIST_WIDTH - 15 - len(score_indicator)
-            if len(title) > max_title_len:
-                title = title[:max_title_len-3] + "..."
-            
-            type_indicator = ""
-            if hyp_type == "improvement":
-                type_indicator = " (imp)"
-            elif hyp_type == "new_alternative": 
-                type_indicator = " (alt)"
-                
-            line_text = f"{hyp_num}. [v{version}]{score_indicator} {title}{type_indicator}"
+        latest_by_num, by_num, by_score = self._get_list_index()
+        sorted_hyp_nums = by_score if self.sort_mode == "score" else by_num
+        
+        # Only the rows inside the viewport are formatted and drawn
+        first = self.list_scroll_offset
+        visible_nums = sorted_hyp_nums[first:first + max(0, list_height - 2)]
+        
+        line_cache = self._list_line_cache
+        for display_y, hyp_num in enumerate(visible_nums, 2):
+            line_text = line_cache.get(hyp_num)
+            if line_text is None:
+                line_text = line_cache[hyp_num] = self._format_list_line(hyp_num, latest_by_num[hyp_num])
             
             # Highlight selected hypothesis
             attr = curses.A_REVERSE if hyp_num - 1 == self.current_hypothesis_idx else 0
             
             try:
-                display_y = y_pos - self.list_scroll_offset
-                if 1 <= display_y < list_height:
-                    self.safe_addstr(self.list_win, display_y, 2, line_text, attr)
+                self.safe_addstr(self.list_win, display_y, 2, line_text, attr)
             except curses.error:
                 pass  # Ignore if line doesn't fit
-                
-            y_pos += 1
             
         # Refresh moved to single refresh cycle
         
+    def _ensure_detail_pad_rows(self, rows):
+        """Grow the details content pad so it holds at least rows lines"""
+        pad_rows, pad_cols = self.detail_pad.getmaxyx()
+        if rows > pad_rows:
+            self.detail_pad.resize(max(rows, pad_rows * 2), pad_cols)
+    
+    def _pad_line(self, y_pos, x, text, attr=0):
+        """Write one line into the details content pad; returns the next row"""
+        self._ensure_detail_pad_rows(y_pos + 1)
+        self.safe_addstr(self.detail_pad, y_pos, x, text, attr)
+        return y_pos + 1
+    
+    def _pad_block(self, y_pos, lines, x, attr=0):
+        """Write wrapped lines into the details content pad; returns the row after the block"""
+        self._ensure_detail_pad_rows(y_pos + len(lines))
+        for row, line in enumerate(lines, y_pos):
+            self.safe_addstr(self.detail_pad, row, x, line, attr)
+        return y_pos + len(lines)
+    
+    def detail_view_rows(self):
+        """Number of content rows visible in the details pane"""
+        return max(0, self.detail_win.getmaxyx()[0] - 4)
+    
+    def queue_detail_refresh(self):
+        """Queue the details frame and the visible slice of its content pad for the next doupdate"""
+        self.detail_win.noutrefresh()
+        win_y, win_x = self.detail_win.getbegyx()
+        win_w = self.detail_win.getmaxyx()[1]
+        view_rows = self.detail_view_rows()
+        if view_rows and win_w > 4:
+            try:
+                self.detail_pad.noutrefresh(
+                    self.detail_scroll_offset, 0,
+                    win_y + 2, win_x + 2,
+                    win_y + 1 + view_rows, win_x + win_w - 2
+                )
+            except curses.error:
+                pass
+    
+    def flush_windows(self, *windows):
+        """Send stdscr and the given panes to the terminal in a single update
+        
+        stdscr is queued first so it never covers a pane; detail_win also
+        brings along the visible slice of the details pad.
+        """
+        self.stdscr.noutrefresh()
+        for window in windows:
+            if window is self.detail_win:
+                self.queue_detail_refresh()
+            else:
+                window.noutrefresh()
+        curses.doupdate()
+    
     def draw_hypothesis_details(self, hypothesis, previous_hypothesis=None):
-        """Draw the hypothesis details pane"""
+        """Draw the hypothesis details pane.
+        
+        The border and title go into detail_win; the content is rendered once
+        into detail_pad, one row per line, and scrolling only moves the pad's
+        viewport (see queue_detail_refresh). Nothing is redrawn when the
+        hypothesis and display options match the last render.
+        """
+        fingerprint = (id(hypothesis), self.show_hallmarks, self.show_references,
+                       self.focus_pane, self.list_data_version)
+        if fingerprint == self._last_detail_fingerprint:
+            return
+        self._last_detail_fingerprint = fingerprint
+        
         self.detail_win.clear()
         # Draw clean border
         self.draw_border(self.detail_win)
@@ -1917,258 +3125,138 @@ class CursesInterface:
         title_x = (self.DETAIL_WIDTH - len(detail_title)) // 2
         self.detail_win.addstr(0, title_x, detail_title, title_attr)
         
+        self.detail_pad.erase()
+        self.detail_content_rows = 0
+        self._ref_indicator_rows = {}
+        self._stale_ref_indicators.clear()  # The render below draws current statuses
+        
         if not hypothesis:
-            self.detail_win.addstr(2, 2, "No hypothesis selected", curses.color_pair(4))
-            # Refresh moved to single refresh cycle
+            self.detail_win.addstr(2, 2, "No hypothesis selected", self.ATTR_INFO)
             return
-            
+        
         # Track currently displayed hypothesis for status updates
         self._current_displayed_hypothesis_id = hypothesis.get('hypothesis_number', 0)
-            
-        # Content area
-        content_width = self.DETAIL_WIDTH - 4
-        y_pos = 2
-        max_y = self.detail_win.getmaxyx()[0] - 2
+        
+        # Content area; wrap widths are set in create_panes
+        content_width = self._detail_content_width
+        y_pos = 0
         
         try:
             # Title
             version = hypothesis.get("version", "1.0")
             hyp_title = f"Title (v{version}): {hypothesis.get('title', 'Untitled')}"
-            wrapped_title = self.safe_wrap_text(hyp_title, content_width)
-            for line in wrapped_title.split('\n'):
-                if y_pos >= max_y:
-                    break
-                if y_pos - 2 >= self.detail_scroll_offset:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, line, curses.A_BOLD)
-                y_pos += 1
+            y_pos = self._pad_block(y_pos, self.safe_wrap_lines(hyp_title, content_width), 0, curses.A_BOLD)
             
             y_pos += 1  # Blank line
             
             # Description
-            if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                display_y = y_pos - self.detail_scroll_offset
-                if 2 <= display_y < max_y:
-                    self.safe_addstr(self.detail_win, display_y, 2, "Description:", curses.A_UNDERLINE)
-            y_pos += 1
-            
+            y_pos = self._pad_line(y_pos, 0, "Description:", curses.A_UNDERLINE)
             description = hypothesis.get('description', 'No description provided.')
-            wrapped_desc = self.safe_wrap_text(description, content_width)
-            for line in wrapped_desc.split('\n'):
-                if y_pos >= max_y + self.detail_scroll_offset + 20:  # Reasonable limit
-                    break
-                if y_pos - 2 >= self.detail_scroll_offset:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, line)
-                y_pos += 1
+            y_pos = self._pad_block(y_pos, self.safe_wrap_lines(description, content_width), 0)
             
             # Experimental Validation Plan
             y_pos += 1
-            if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                display_y = y_pos - self.detail_scroll_offset
-                if 2 <= display_y < max_y:
-                    self.safe_addstr(self.detail_win, display_y, 2, "Experimental Validation Plan:", curses.A_UNDERLINE)
-            y_pos += 1
-            
+            y_pos = self._pad_line(y_pos, 0, "Experimental Validation Plan:", curses.A_UNDERLINE)
             experimental_validation = hypothesis.get('experimental_validation', 'No experimental validation plan provided.')
-            wrapped_validation = self.safe_wrap_text(experimental_validation, content_width)
-            for line in wrapped_validation.split('\n'):
-                if y_pos >= max_y + self.detail_scroll_offset + 20:  # Reasonable limit
-                    break
-                if y_pos - 2 >= self.detail_scroll_offset:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, line)
-                y_pos += 1
+            y_pos = self._pad_block(y_pos, self.safe_wrap_lines(experimental_validation, content_width), 0)
             
             # Theory and Computation section
             theory_computation = hypothesis.get('theory_and_computation', '')
             if theory_computation.strip():
                 y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, "Theory and Computation:", curses.A_UNDERLINE)
-                y_pos += 1
-                
-                wrapped_theory = self.safe_wrap_text(theory_computation, content_width)
-                for line in wrapped_theory.split('\n'):
-                    if y_pos >= max_y + self.detail_scroll_offset + 20:  # Reasonable limit
-                        break
-                    if y_pos - 2 >= self.detail_scroll_offset:
-                        display_y = y_pos - self.detail_scroll_offset
-                        if 2 <= display_y < max_y:
-                            self.safe_addstr(self.detail_win, display_y, 2, line)
-                    y_pos += 1
+                y_pos = self._pad_line(y_pos, 0, "Theory and Computation:", curses.A_UNDERLINE)
+                y_pos = self._pad_block(y_pos, self.safe_wrap_lines(theory_computation, content_width), 0)
             
             # Notes section
             notes = hypothesis.get('notes', '')
+            y_pos += 1
             if notes.strip():
-                y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, "Personal Notes:", curses.A_UNDERLINE)
-                y_pos += 1
-                
-                wrapped_notes = self.safe_wrap_text(notes, content_width)
-                for line in wrapped_notes.split('\n'):
-                    if y_pos >= max_y + self.detail_scroll_offset + 20:  # Reasonable limit
-                        break
-                    if y_pos - 2 >= self.detail_scroll_offset:
-                        display_y = y_pos - self.detail_scroll_offset
-                        if 2 <= display_y < max_y:
-                            self.safe_addstr(self.detail_win, display_y, 2, line, curses.color_pair(5))  # Different color for notes
-                    y_pos += 1
+                y_pos = self._pad_line(y_pos, 0, "Personal Notes:", curses.A_UNDERLINE)
+                # Different color for notes
+                y_pos = self._pad_block(y_pos, self.safe_wrap_lines(notes, content_width), 0, self.ATTR_NOTES)
             else:
-                y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, "[No notes - press 't' to add notes]", curses.color_pair(4))
-                y_pos += 1
+                y_pos = self._pad_line(y_pos, 0, "[No notes - press 't' to add notes]", self.ATTR_INFO)
             
             # Show improvements if this is an improvement
             if hypothesis.get("improvements_made") and hypothesis.get("type") == "improvement":
                 y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset  
-                    if 2 <= display_y < max_y:
-                        self.detail_win.addstr(display_y, 2, "Improvements made:", curses.color_pair(4) | curses.A_BOLD)
-                y_pos += 1
-                
+                y_pos = self._pad_line(y_pos, 0, "Improvements made:", self.ATTR_IMPROVEMENT)
                 improvements = hypothesis.get("improvements_made", "")
-                wrapped_imp = self.safe_wrap_text(improvements, content_width)
-                for line in wrapped_imp.split('\n'):
-                    if y_pos - 2 >= self.detail_scroll_offset:
-                        display_y = y_pos - self.detail_scroll_offset
-                        if 2 <= display_y < max_y:
-                            self.safe_addstr(self.detail_win, display_y, 2, line, curses.color_pair(4))
-                    y_pos += 1
+                y_pos = self._pad_block(y_pos, self.safe_wrap_lines(improvements, content_width), 0, self.ATTR_INFO)
             
             # Hallmarks (if enabled)
+            y_pos += 1
             if self.show_hallmarks:
-                y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.detail_win.addstr(display_y, 2, "Hallmarks Analysis:", curses.A_UNDERLINE)
-                y_pos += 1
+                y_pos = self._pad_line(y_pos, 0, "Hallmarks Analysis:", curses.A_UNDERLINE)
                 
                 hallmarks = hypothesis.get('hallmarks', {})
-                hallmark_names = [
-                    ('testability', '1. Testability (Falsifiability)'),
-                    ('specificity', '2. Specificity and Clarity'),
-                    ('grounded_knowledge', '3. Grounded in Prior Knowledge'),
-                    ('predictive_power', '4. Predictive Power & Novel Insight'),
-                    ('parsimony', '5. Parsimony (Principle of Simplicity)')
-                ]
-                
-                for key, title in hallmark_names:
-                    if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                        display_y = y_pos - self.detail_scroll_offset
-                        if 2 <= display_y < max_y:
-                            self.detail_win.addstr(display_y, 2, title, curses.A_BOLD)
-                    y_pos += 1
-                    
+                for i, (key, title) in enumerate(HALLMARK_TITLES, 1):
+                    y_pos = self._pad_line(y_pos, 0, f"{i}. {title}", curses.A_BOLD)
                     text = hallmarks.get(key, 'No analysis provided.')
-                    wrapped_text = self.safe_wrap_text(text, content_width - 3)
-                    for line in wrapped_text.split('\n'):
-                        if y_pos - 2 >= self.detail_scroll_offset:
-                            display_y = y_pos - self.detail_scroll_offset
-                            if 2 <= display_y < max_y:
-                                self.safe_addstr(self.detail_win, display_y, 5, line)
-                        y_pos += 1
+                    y_pos = self._pad_block(y_pos, self.safe_wrap_lines(text, self._detail_indented_width), 3)
                     y_pos += 1  # Blank line between hallmarks
             else:
-                y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, "[Hallmarks hidden - press 'h' to toggle]", curses.color_pair(4))
-                y_pos += 1
+                y_pos = self._pad_line(y_pos, 0, "[Hallmarks hidden - press 'h' to toggle]", self.ATTR_INFO)
             
             # References (if enabled)
+            y_pos += 1
             if self.show_references:
-                y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.detail_win.addstr(display_y, 2, "Relevant References:", curses.A_UNDERLINE)
-                y_pos += 1
+                y_pos = self._pad_line(y_pos, 0, "Relevant References:", curses.A_UNDERLINE)
                 
                 references = hypothesis.get('references', [])
                 if references:
                     # Get hypothesis ID for status lookup
                     hyp_id = hypothesis.get('hypothesis_number', 0)
                     
-                    for i, ref in enumerate(references, 1):
-                        if isinstance(ref, dict):
-                            citation = ref.get('citation', 'No citation')
-                            annotation = ref.get('annotation', 'No annotation')
-                            
-                            # Get status indicator for this reference
+                    # Pull the fields out of the reference dicts in one pass
+                    # (citation is None for plain string references), then render
+                    ref_rows = [
+                        (i, ref.get('citation', 'No citation'), ref.get('annotation', 'No annotation'))
+                        if isinstance(ref, dict) else (i, None, str(ref))
+                        for i, ref in enumerate(references, 1)
+                    ]
+                    
+                    for i, citation, annotation in ref_rows:
+                        if citation is not None:
+                            # Display citation with status indicator. It is wrapped with a
+                            # placeholder in the status column, so the wrapped lines stay
+                            # cached while only the fetch status changes.
+                            citation_lines = self.safe_wrap_lines(f"# {i}. {citation}", self._detail_indented_width)
                             status_indicator = self.get_reference_status_indicator(hyp_id, i)
-                            
-                            # Display citation with status indicator
-                            citation_text = f"{status_indicator} {i}. {citation}"
-                            wrapped_citation = self.safe_wrap_text(citation_text, content_width - 3)
-                            for line in wrapped_citation.split('\n'):
-                                if y_pos - 2 >= self.detail_scroll_offset:
-                                    display_y = y_pos - self.detail_scroll_offset
-                                    if 2 <= display_y < max_y:
-                                        self.safe_addstr(self.detail_win, display_y, 2, line, curses.A_BOLD)
-                                y_pos += 1
+                            self._ref_indicator_rows[i] = y_pos
+                            y_pos = self._pad_line(y_pos, 0, status_indicator + citation_lines[0][1:], curses.A_BOLD)
+                            y_pos = self._pad_block(y_pos, citation_lines[1:], 0, curses.A_BOLD)
                             
                             # Display annotation
-                            wrapped_annotation = self.safe_wrap_text(annotation, content_width - 6)
-                            for line in wrapped_annotation.split('\n'):
-                                if y_pos - 2 >= self.detail_scroll_offset:
-                                    display_y = y_pos - self.detail_scroll_offset
-                                    if 2 <= display_y < max_y:
-                                        self.safe_addstr(self.detail_win, display_y, 8, line)
-                                y_pos += 1
-                            y_pos += 1  # Blank line between references
+                            y_pos = self._pad_block(y_pos, self.safe_wrap_lines(annotation, self._detail_annotation_width), 6)
                         else:
                             # Handle string references
-                            ref_text = f"{i}. {str(ref)}"
-                            wrapped_ref = self.safe_wrap_text(ref_text, content_width - 3)
-                            for line in wrapped_ref.split('\n'):
-                                if y_pos - 2 >= self.detail_scroll_offset:
-                                    display_y = y_pos - self.detail_scroll_offset
-                                    if 2 <= display_y < max_y:
-                                        self.safe_addstr(self.detail_win, display_y, 5, line)
-                                y_pos += 1
-                            y_pos += 1  # Blank line
+                            y_pos = self._pad_block(y_pos, self.safe_wrap_lines(f"{i}. {annotation}", self._detail_indented_width), 3)
+                        y_pos += 1  # Blank line between references
                 else:
-                    if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                        display_y = y_pos - self.detail_scroll_offset
-                        if 2 <= display_y < max_y:
-                            self.detail_win.addstr(display_y, 5, "None provided", curses.color_pair(4))
-                    y_pos += 1
+                    y_pos = self._pad_line(y_pos, 3, "None provided", self.ATTR_INFO)
             else:
-                y_pos += 1
-                if y_pos - 2 >= self.detail_scroll_offset and y_pos - self.detail_scroll_offset < max_y:
-                    display_y = y_pos - self.detail_scroll_offset
-                    if 2 <= display_y < max_y:
-                        self.safe_addstr(self.detail_win, display_y, 2, "[References hidden - press 'r' to toggle]", curses.color_pair(4))
-                y_pos += 1
-                
+                y_pos = self._pad_line(y_pos, 0, "[References hidden - press 'r' to toggle]", self.ATTR_INFO)
+        
         except curses.error:
             pass  # Ignore if content doesn't fit
-            
-        # Refresh moved to single refresh cycle
         
-    def draw_status_bar(self, status_msg=None):
-        """Draw the status bar with commands"""
+        # Keep the scroll position inside the content
+        self.detail_content_rows = y_pos
+        self.detail_scroll_offset = min(self.detail_scroll_offset, max(0, y_pos - self.detail_view_rows()))
+    
+    def draw_status_bar(self, status_msg=None, persistent=False):
+        """Draw the status bar with commands.
+        
+        Input prompts pass persistent=True so the message doesn't time out
+        (and flicker to "Ready") while the user is typing.
+        """
         self.status_win.clear()
-        self.status_win.attron(curses.color_pair(6))
+        self.status_win.attron(self.ATTR_STATUS)
         
         # Use provided message or get current status
         if status_msg is not None:
-            self.set_status(status_msg)
+            self.set_status(status_msg, persistent=persistent)
             display_status = status_msg
         else:
             display_status = self.get_current_status()
@@ -2178,33 +3266,21 @@ class CursesInterface:
         status_line = f" Status: {display_status} | Strategy: {strategy_status}"
         self.safe_addstr(self.status_win, 0, 0, status_line)
         
-        # Commands - show on two lines if needed
-        commands_line1 = " f=Feedback n=New l=Load x=Save t=Notes s=Select v=View h=Toggle r=Refs a=Papers u=Update b=Browse c=Score w=Strategy p=PDF q=Quit "
-        commands_line2 = " Up/Down=Navigate j/k=Scroll d/u=FastScroll g=Home "
-        
-        # Try to fit both lines, otherwise just show main commands
-        if len(commands_line1) + len(status_line) < self.width:
-            cmd_start_x = max(0, self.width - len(commands_line1))
-            self.safe_addstr(self.status_win, 0, cmd_start_x, commands_line1)
+        # Commands - show on two lines if they fit, otherwise just the main commands
+        # (columns are computed in create_panes)
+        status_len = len(status_line)
+        if status_len < self._cmds_x:
+            self.safe_addstr(self.status_win, 0, self._cmds_x, _STATUS_COMMANDS)
+            if self._cmds_nav_x is not None:
+                self.safe_addstr(self.status_win, 1, self._cmds_nav_x, _STATUS_COMMANDS_NAV)
             
-            # Add scroll commands on second line if there's room
-            if self.STATUS_HEIGHT >= 2 and len(commands_line2) < self.width:
-                cmd2_start_x = max(0, self.width - len(commands_line2))
-                self.safe_addstr(self.status_win, 1, cmd2_start_x, commands_line2)
-        else:
+            # Fill the gap between status and commands
+            self.status_win.hline(0, status_len, ord(' ') | self.ATTR_STATUS, self._cmds_x - status_len)
+        elif status_len < self._cmds_short_x:
             # Shortened version for narrow terminals
-            commands_short = " f=Feedback n=New a=Papers u=Update b=Browse c=Score w=Strategy p=PDF q=Quit j/k=Scroll "
-            cmd_start_x = max(0, self.width - len(commands_short))
-            if cmd_start_x > len(status_line):
-                self.safe_addstr(self.status_win, 0, cmd_start_x, commands_short)
-        
-        # Fill rest of first line if needed
-        if len(commands_line1) + len(status_line) < self.width:
-            remaining = self.width - len(status_line) - len(commands_line1)
-            if remaining > 0:
-                self.status_win.addstr(0, len(status_line), " " * remaining)
+            self.safe_addstr(self.status_win, 0, self._cmds_short_x, _STATUS_COMMANDS_SHORT)
             
-        self.status_win.attroff(curses.color_pair(6))
+        self.status_win.attroff(self.ATTR_STATUS)
         # Refresh moved to single refresh cycle
         
     def mark_dirty(self, component="all"):
@@ -2215,8 +3291,12 @@ class CursesInterface:
             self.dirty_list = True
         if component in ("all", "details"):
             self.dirty_details = True
+        if component == "all":
+            # Other screens may have drawn over the pane
+            self._last_detail_fingerprint = None
         if component in ("all", "status"):
             self.dirty_status = True
+            self.status_event.set()
     
     def check_changes(self, all_hypotheses, current_idx, current_hypothesis):
         """Check what has changed and mark appropriate components dirty"""
@@ -2236,39 +3316,65 @@ class CursesInterface:
             hypothesis_str = str(current_hypothesis)
             if hypothesis_str != self.last_hypothesis_content:
                 self.dirty_details = True
+                self._last_detail_fingerprint = None  # Edited in place
                 self.last_hypothesis_content = hypothesis_str
     
-    def draw_interface_selective(self, research_goal, model_name, all_hypotheses, current_hypothesis, status_msg=None):
-        """Draw only the components that have changed"""
+    def draw_interface_selective(self, research_goal, model_name, all_hypotheses, current_hypothesis, status_msg=None, persistent=False):
+        """Draw only the components that have changed and flush them in one terminal update"""
+        # Idle frames (the main loop polls every 200ms) cost only this check; a
+        # status_msg already on the bar, like an unchanged feedback prompt, counts as idle
+        if not (self.dirty_header or self.dirty_list or self.dirty_details or self.dirty_detail_scroll
+                or self.dirty_status or self._stale_ref_indicators
+                or (status_msg and status_msg != self.current_status)):
+            return
+        
+        # Queue stdscr first so it can never cover a pane in the virtual screen
+        self.stdscr.noutrefresh()
+        
         if self.dirty_header:
             self.draw_header(research_goal, model_name)
-            self.header_win.refresh()
+            self.header_win.noutrefresh()
             self.dirty_header = False
         
         if self.dirty_list:
             self.draw_hypothesis_list(all_hypotheses)
-            self.list_win.refresh()
+            self.list_win.noutrefresh()
             self.dirty_list = False
         
+        if self._stale_ref_indicators:
+            self._patch_reference_indicators()
+        
         if self.dirty_details:
             self.draw_hypothesis_details(current_hypothesis)
-            self.detail_win.refresh()
+            self.queue_detail_refresh()
             self.dirty_details = False
+            self.dirty_detail_scroll = False
+        elif self.dirty_detail_scroll:
+            # Content is already in the pad; just move the viewport
+            self.queue_detail_refresh()
+            self.dirty_detail_scroll = False
         
         if self.dirty_status or status_msg:
             if status_msg:
-                self.draw_status_bar(status_msg)
+                self.draw_status_bar(status_msg, persistent=persistent)
             else:
                 self.draw_status_bar()
-            self.status_win.refresh()
+            self.status_win.noutrefresh()
             self.dirty_status = False
         
+        curses.doupdate()
+        
     def handle_resize(self):
         """Handle terminal resize"""
         self.height, self.width = self.stdscr.getmaxyx()
         self.LIST_WIDTH = int(self.width * 0.35)
         self.DETAIL_WIDTH = self.width - self.LIST_WIDTH - 1
         
+        # Wrapped text for the old widths will not be reused
+        with self._wrap_cache_lock:
+            self._wrap_cache.clear()
+            self._wrappers.clear()
+        
         # Recreate panes with new dimensions
         self.create_panes()
         
@@ -2281,19 +3387,19 @@ class CursesInterface:
         self.mark_dirty("list")
             
     def scroll_detail(self, direction):
-        """Scroll the hypothesis details"""
+        """Scroll the hypothesis details; only the pad viewport moves, nothing is re-rendered"""
         if direction > 0:
-            self.detail_scroll_offset += 1
+            max_offset = max(0, self.detail_content_rows - self.detail_view_rows())
+            self.detail_scroll_offset = min(self.detail_scroll_offset + 1, max_offset)
         else:
             self.detail_scroll_offset = max(0, self.detail_scroll_offset - 1)
-        self.mark_dirty("details")
+        self.dirty_detail_scroll = True
             
     def set_status(self, message, persistent=False, timeout=3.0):
         """Set a status message with optional persistence and timeout"""
         self.current_status = message
-        self.status_timestamp = time.time()
         self.persistent_status = persistent
-        self.status_timeout = timeout
+        self.status_deadline = time.monotonic() + timeout
         self.mark_dirty("status")
         
     def clear_status_on_action(self):
@@ -2303,12 +3409,16 @@ class CursesInterface:
             self.persistent_status = False
             self.mark_dirty("status")
             
+    def status_expires_in(self):
+        """Seconds until the current status message times out (0 once it has), or None if it won't"""
+        if self.persistent_status or self.current_status == "Ready":
+            return None
+        return max(0, self.status_deadline - time.monotonic())
+    
     def get_current_status(self):
         """Get the current status message, handling timeouts"""
-        current_time = time.time()
-        
         # Check if status has timed out (unless it's persistent)
-        if not self.persistent_status and (current_time - self.status_timestamp) > self.status_timeout:
+        if self.status_expires_in() == 0:
             self.current_status = "Ready"
             
         return self.current_status
@@ -2331,8 +3441,9 @@ class CursesInterface:
             # Clean and truncate text
             safe_text = str(text)[:max_len]
             
-            # Remove or replace problematic characters
-            safe_text = safe_text.encode('ascii', 'ignore').decode('ascii')
+            # Drop non-ASCII characters; most lines are plain ASCII and skip the round trip
+            if not safe_text.isascii():
+                safe_text = safe_text.encode('ascii', 'ignore').decode('ascii')
             
             # Add the string
             if attr:
@@ -2353,66 +3464,83 @@ class CursesInterface:
                 pass
             return False
 
-    def safe_wrap_text(self, text, width, max_length=10000):
-        """Safely wrap text with length limits to prevent memory issues"""
+    def safe_wrap_lines(self, text, width, max_length=10000):
+        """Safely wrap text into a list of lines, with length limits to prevent memory issues.
+        
+        Results are cached by (text, width), so an edited field simply misses the
+        cache; callers must not modify the returned list.
+        """
         if not text:
-            return ""
+            return [""]
         
         # Limit text length to prevent memory issues
         safe_text = str(text)[:max_length]
         
+        # Fast path: a single printable line that already fits wraps to itself
+        # (no tabs/newlines to normalise, no trailing space for textwrap to drop)
+        if len(safe_text) <= width and safe_text.isprintable() and not safe_text.endswith(' '):
+            return [safe_text]
+        
+        key = (safe_text, width)
+        with self._wrap_cache_lock:
+            wrapped = self._wrap_cache.get(key)
+            if wrapped is not None:
+                self._wrap_cache.move_to_end(key)
+                return wrapped
+        
+        wrappers = self._wrappers.get(width)
+        if wrappers is None:
+            wrappers = self._wrappers[width] = (
+                textwrap.TextWrapper(width),
+                re.compile(r'\S{%d,}' % (width + 1)) if width > 0 else None
+            )
+        wrapper, long_word_re = wrappers
+        
+        # Cut over-long words (URLs, identifiers) into line-sized pieces in one
+        # forward pass; textwrap re-slices the rest of a long word for every line
+        wrap_text = safe_text
+        if long_word_re is not None and long_word_re.search(safe_text):
+            wrap_text = long_word_re.sub(
+                lambda m: ' '.join(m.group()[i:i + width] for i in range(0, len(m.group()), width)),
+                safe_text
+            )
+        
         try:
-            return textwrap.fill(safe_text, width)
+            wrapped = wrapper.wrap(wrap_text) or [""]
         except (MemoryError, OverflowError):
             # Fallback: return truncated text without wrapping
-            return safe_text[:width]
+            return [safe_text[:width]]
+        
+        with self._wrap_cache_lock:
+            self._wrap_cache[key] = wrapped
+            if len(self._wrap_cache) > WRAP_CACHE_SIZE:
+                self._wrap_cache.popitem(last=False)
+        return wrapped
 
 # ---------------------------------------------------------------------
 # PDF Generation Functions
 # ---------------------------------------------------------------------
 
-def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
-    """
-    Generate a nicely formatted PDF document for a hypothesis.
+# Timestamp format used in generated PDFs
+PDF_TIMESTAMP_FORMAT = "%B %d, %Y at %I:%M %p"
+
+@functools.lru_cache(maxsize=None)
+def _get_pdf_styles():
+    """Paragraph styles for generate_hypothesis_pdf, built on first use"""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.colors import HexColor
     
-    Args:
-        hypothesis (dict): The hypothesis data
-        research_goal (str): The research goal
-        output_filename (str, optional): Custom output filename
-        
-    Returns:
-        str: Path to generated PDF file, or None if failed
-    """
-    if not PDF_AVAILABLE:
-        return None
-        
-    try:
-        # Generate filename if not provided
-        if not output_filename:
-            safe_title = "".join(c for c in hypothesis.get('title', 'hypothesis') if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_title = safe_title.replace(' ', '_')[:50]  # Limit length
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"hypothesis_{safe_title}_{timestamp}.pdf"
-        
-        # Create the PDF document
-        doc = SimpleDocTemplate(output_filename, pagesize=letter,
-                              rightMargin=72, leftMargin=72,
-                              topMargin=72, bottomMargin=18)
-        
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Define custom styles
-        title_style = ParagraphStyle(
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=18,
             spaceAfter=30,
             textColor=HexColor('#2E4057'),
             alignment=1  # Center alignment
-        )
-        
-        heading_style = ParagraphStyle(
+        ),
+        'heading': ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=14,
@@ -2423,25 +3551,116 @@ def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
             borderColor=HexColor('#BDC3C7'),
             borderPadding=5,
             backColor=HexColor('#ECF0F1')
-        )
-        
-        body_style = ParagraphStyle(
+        ),
+        'body': ParagraphStyle(
             'CustomBody',
             parent=styles['Normal'],
             fontSize=11,
             spaceAfter=12,
             leading=14,
             alignment=0  # Left alignment
-        )
-        
-        reference_style = ParagraphStyle(
+        ),
+        'reference': ParagraphStyle(
             'ReferenceStyle',
             parent=styles['Normal'],
             fontSize=10,
             spaceAfter=8,
             leftIndent=20,
             leading=12
-        )
+        ),
+        'notes': ParagraphStyle(
+            'NotesStyle',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=12,
+            leftIndent=10,
+            rightIndent=10,
+            leading=14,
+            backColor=HexColor('#FFF9E6'),
+            borderWidth=1,
+            borderColor=HexColor('#E6CC00'),
+            borderPadding=8
+        ),
+        'feedback': ParagraphStyle(
+            'FeedbackStyle',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceAfter=12,
+            leftIndent=15,
+            rightIndent=15,
+            leading=13,
+            backColor=HexColor('#F8F9FA'),
+            borderWidth=1,
+            borderColor=HexColor('#DEE2E6'),
+            borderPadding=8
+        ),
+        'feedback_meta': ParagraphStyle(
+            'FeedbackMetaStyle',
+            parent=styles['Normal'],
+            fontSize=9,
+            spaceAfter=8,
+            leftIndent=15,
+            textColor=HexColor('#6C757D')
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=HexColor('#7F8C8D'),
+            alignment=1  # Center alignment
+        ),
+    }
+
+def _format_pdf_timestamp(timestamp):
+    """Format an ISO timestamp for the PDF, or return it unchanged if it doesn't parse"""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return dt.strftime(PDF_TIMESTAMP_FORMAT)
+    except (AttributeError, ValueError):
+        return timestamp
+
+def _pdf_paragraph(text, style):
+    """Paragraph for plain text; &, < and > are escaped so ReportLab's markup parser leaves it alone"""
+    from reportlab.platypus import Paragraph
+    return Paragraph(xml_escape(str(text)), style)
+
+def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
+    """
+    Generate a nicely formatted PDF document for a hypothesis.
+    
+    Args:
+        hypothesis (dict): The hypothesis data
+        research_goal (str): The research goal
+        output_filename (str, optional): Custom output filename
+        
+    Returns:
+        str: Path to generated PDF file, or None if failed
+    """
+    if not PDF_AVAILABLE:
+        return None
+        
+    try:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
+        # Generate filename if not provided
+        if not output_filename:
+            safe_title = "".join(c for c in hypothesis.get('title', 'hypothesis') if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_title = safe_title.replace(' ', '_')[:50]  # Limit length
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_filename = f"hypothesis_{safe_title}_{timestamp}.pdf"
+        
+        # Create the PDF document
+        doc = SimpleDocTemplate(output_filename, pagesize=letter,
+                              rightMargin=72, leftMargin=72,
+                              topMargin=72, bottomMargin=18)
+        
+        # Styles are built once per process
+        pdf_styles = _get_pdf_styles()
+        title_style = pdf_styles['title']
+        heading_style = pdf_styles['heading']
+        body_style = pdf_styles['body']
+        reference_style = pdf_styles['reference']
         
         # Build the story (content)
         story = []
@@ -2455,101 +3674,62 @@ def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
         hyp_type = hypothesis.get("type", "original")
         timestamp = hypothesis.get("generation_timestamp", "Unknown")
         if timestamp != "Unknown":
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                timestamp = dt.strftime("%B %d, %Y at %I:%M %p")
-            except:
-                pass
+            timestamp = _format_pdf_timestamp(timestamp)
         
-        story.append(Paragraph(f"<b>Version:</b> {version} ({hyp_type})", body_style))
-        story.append(Paragraph(f"<b>Generated:</b> {timestamp}", body_style))
+        story.append(Paragraph(f"<b>Version:</b> {xml_escape(str(version))} ({xml_escape(str(hyp_type))})", body_style))
+        story.append(Paragraph(f"<b>Generated:</b> {xml_escape(str(timestamp))}", body_style))
         story.append(Spacer(1, 20))
         
         # Research Goal
         story.append(Paragraph("Research Goal", heading_style))
-        story.append(Paragraph(research_goal, body_style))
+        story.append(_pdf_paragraph(research_goal, body_style))
         story.append(Spacer(1, 20))
         
         # Hypothesis Title
         story.append(Paragraph("Hypothesis", heading_style))
         hyp_title = hypothesis.get('title', 'Untitled Hypothesis')
-        story.append(Paragraph(f"<b>{hyp_title}</b>", body_style))
+        story.append(Paragraph(f"<b>{xml_escape(str(hyp_title))}</b>", body_style))
         story.append(Spacer(1, 15))
         
         # Description
         story.append(Paragraph("Description", heading_style))
         description = hypothesis.get('description', 'No description provided.')
-        story.append(Paragraph(description, body_style))
+        story.append(_pdf_paragraph(description, body_style))
         story.append(Spacer(1, 20))
         
         # Experimental Validation Plan
         story.append(Paragraph("Experimental Validation Plan", heading_style))
         validation = hypothesis.get('experimental_validation', 'No experimental validation plan provided.')
-        story.append(Paragraph(validation, body_style))
+        story.append(_pdf_paragraph(validation, body_style))
         story.append(Spacer(1, 20))
         
         # Theory and Computation
         theory_computation = hypothesis.get('theory_and_computation', '')
         if theory_computation.strip():
             story.append(Paragraph("Theory and Computation", heading_style))
-            story.append(Paragraph(theory_computation, body_style))
+            story.append(_pdf_paragraph(theory_computation, body_style))
             story.append(Spacer(1, 20))
         
         # Personal Notes
         notes = hypothesis.get('notes', '')
         if notes.strip():
-            notes_style = ParagraphStyle(
-                'NotesStyle',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=12,
-                leftIndent=10,
-                rightIndent=10,
-                leading=14,
-                backColor=HexColor('#FFF9E6'),
-                borderWidth=1,
-                borderColor=HexColor('#E6CC00'),
-                borderPadding=8
-            )
-            
             story.append(Paragraph("Personal Notes", heading_style))
-            story.append(Paragraph(notes, notes_style))
+            story.append(_pdf_paragraph(notes, pdf_styles['notes']))
             story.append(Spacer(1, 20))
         
         # Improvements (if any)
         if hypothesis.get("improvements_made") and hypothesis.get("type") == "improvement":
             story.append(Paragraph("Improvements Made", heading_style))
             improvements = hypothesis.get("improvements_made", "")
-            story.append(Paragraph(improvements, body_style))
+            story.append(_pdf_paragraph(improvements, body_style))
             story.append(Spacer(1, 20))
         
         # Feedback History
         feedback_history = hypothesis.get("feedback_history", [])
         if feedback_history:
             story.append(Paragraph("Feedback History", heading_style))
-            
-            feedback_style = ParagraphStyle(
-                'FeedbackStyle',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=12,
-                leftIndent=15,
-                rightIndent=15,
-                leading=13,
-                backColor=HexColor('#F8F9FA'),
-                borderWidth=1,
-                borderColor=HexColor('#DEE2E6'),
-                borderPadding=8
-            )
-            
-            feedback_meta_style = ParagraphStyle(
-                'FeedbackMetaStyle',
-                parent=styles['Normal'],
-                fontSize=9,
-                spaceAfter=8,
-                leftIndent=15,
-                textColor=HexColor('#6C757D')
-            )
+            feedback_style = pdf_styles['feedback']
+            feedback_meta_style = pdf_styles['feedback_meta']
             
             for i, feedback_entry in enumerate(feedback_history, 1):
                 feedback_text = feedback_entry.get("feedback", "No feedback text")
@@ -2557,19 +3737,14 @@ def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
                 version_before = feedback_entry.get("version_before", "Unknown")
                 version_after = feedback_entry.get("version_after", "Unknown")
                 
-                # Format timestamp
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    formatted_time = dt.strftime("%B %d, %Y at %I:%M %p")
-                except:
-                    formatted_time = timestamp
+                formatted_time = _format_pdf_timestamp(timestamp)
                 
                 # Add feedback entry
                 story.append(Paragraph(f"<b>Feedback #{i}</b>", feedback_meta_style))
-                story.append(Paragraph(f"Provided: {formatted_time}", feedback_meta_style))
-                story.append(Paragraph(f"Version updated: {version_before} → {version_after}", feedback_meta_style))
+                story.append(_pdf_paragraph(f"Provided: {formatted_time}", feedback_meta_style))
+                story.append(_pdf_paragraph(f"Version updated: {version_before} → {version_after}", feedback_meta_style))
                 story.append(Spacer(1, 6))
-                story.append(Paragraph(feedback_text, feedback_style))
+                story.append(_pdf_paragraph(feedback_text, feedback_style))
                 story.append(Spacer(1, 15))
             
             story.append(Spacer(1, 20))
@@ -2578,18 +3753,10 @@ def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
         story.append(Paragraph("Hallmarks Analysis", heading_style))
         hallmarks = hypothesis.get('hallmarks', {})
         
-        hallmark_names = [
-            ('testability', 'Testability (Falsifiability)'),
-            ('specificity', 'Specificity and Clarity'),
-            ('grounded_knowledge', 'Grounded in Prior Knowledge'),
-            ('predictive_power', 'Predictive Power & Novel Insight'),
-            ('parsimony', 'Parsimony (Principle of Simplicity)')
-        ]
-        
-        for key, title in hallmark_names:
-            story.append(Paragraph(f"<b>{title}</b>", body_style))
+        for key, title in HALLMARK_TITLES:
+            story.append(Paragraph(f"<b>{xml_escape(title)}</b>", body_style))
             text = hallmarks.get(key, 'No analysis provided.')
-            story.append(Paragraph(text, body_style))
+            story.append(_pdf_paragraph(text, body_style))
             story.append(Spacer(1, 12))
         
         story.append(Spacer(1, 20))
@@ -2604,24 +3771,18 @@ def generate_hypothesis_pdf(hypothesis, research_goal, output_filename=None):
                     citation = ref.get('citation', 'No citation')
                     annotation = ref.get('annotation', 'No annotation')
                     
-                    story.append(Paragraph(f"<b>{i}. {citation}</b>", reference_style))
-                    story.append(Paragraph(annotation, reference_style))
+                    story.append(Paragraph(f"<b>{i}. {xml_escape(str(citation))}</b>", reference_style))
+                    story.append(_pdf_paragraph(annotation, reference_style))
                     story.append(Spacer(1, 8))
                 else:
-                    story.append(Paragraph(f"{i}. {str(ref)}", reference_style))
+                    story.append(_pdf_paragraph(f"{i}. {ref}", reference_style))
                     story.append(Spacer(1, 8))
         else:
             story.append(Paragraph("No references provided.", body_style))
         
         # Footer
         story.append(Spacer(1, 30))
-        footer_style = ParagraphStyle(
-            'Footer',
-            parent=styles['Normal'],
-            fontSize=9,
-            textColor=HexColor('#7F8C8D'),
-            alignment=1  # Center alignment
-        )
+        footer_style = pdf_styles['footer']
         story.append(Paragraph("Generated by Wisteria Research Hypothesis Generator v6.0", footer_style))
         story.append(Paragraph(f"Document created on {datetime.now().strftime('%B %d, %Y')}", footer_style))
         
@@ -2647,6 +3808,65 @@ class Colors:
     BOLD = '\033[1m'
     RESET = '\033[0m'   # Reset to default
 
+@functools.lru_cache(maxsize=256)
+def _diff_word_opcodes(old_text, new_text):
+    """Word-level SequenceMatcher opcodes for a pair of texts, cached across calls"""
+    old_words = old_text.split()
+    new_words = new_text.split()
+    
+    # Improvements usually change a few words in the middle, so match the common
+    # prefix and suffix directly and only run SequenceMatcher on what's between
+    shortest = min(len(old_words), len(new_words))
+    prefix = 0
+    while prefix < shortest and old_words[prefix] == new_words[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < shortest - prefix and old_words[-1 - suffix] == new_words[-1 - suffix]:
+        suffix += 1
+    old_end = len(old_words) - suffix
+    new_end = len(new_words) - suffix
+    
+    opcodes = []
+    if prefix:
+        opcodes.append(('equal', 0, prefix, 0, prefix))
+    if prefix < old_end or prefix < new_end:
+        differ = difflib.SequenceMatcher(None, old_words[prefix:old_end], new_words[prefix:new_end], autojunk=False)
+        for tag, i1, i2, j1, j2 in differ.get_opcodes():
+            opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(('equal', old_end, len(old_words), new_end, len(new_words)))
+    return tuple(opcodes)
+
+def diff_text_segments(old_text, new_text):
+    """
+    Word-level diff of two texts, as segments of the new text.
+    
+    Args:
+        old_text (str): Original text
+        new_text (str): New/improved text
+        
+    Returns:
+        list: (tag, text) tuples in order, tag being 'equal', 'insert' or 'replace';
+              deleted words are not part of the new text and are left out
+    """
+    # The opcodes are cached, so diffing the same pair again is cheap
+    new_words = new_text.split()
+    return [
+        (tag, ' '.join(new_words[j1:j2]))
+        for tag, i1, i2, j1, j2 in _diff_word_opcodes(old_text, new_text)
+        if tag != 'delete' and j2 > j1
+    ]
+
+# Terminal color for each kind of changed diff segment: added text green, changed text yellow
+_ANSI_SEGMENT_COLORS = {'insert': Colors.GREEN, 'replace': Colors.YELLOW}
+
+def render_ansi_segments(segments):
+    """Join diff segments into one string, coloring inserted and changed text for the terminal"""
+    return ' '.join(
+        text if tag == 'equal' else _ANSI_SEGMENT_COLORS[tag] + text + Colors.RESET
+        for tag, text in segments
+    )
+
 def highlight_text_changes(old_text, new_text):
     """
     Compare two texts and return the new text with color-coded changes.
@@ -2661,31 +3881,7 @@ def highlight_text_changes(old_text, new_text):
     if not old_text or not new_text:
         return new_text
     
-    # Split into words for better diff granularity
-    old_words = old_text.split()
-    new_words = new_text.split()
-    
-    # Generate diff
-    differ = difflib.SequenceMatcher(None, old_words, new_words)
-    
-    result = []
-    for tag, i1, i2, j1, j2 in differ.get_opcodes():
-        if tag == 'equal':
-            # Unchanged text
-            result.extend(new_words[j1:j2])
-        elif tag == 'delete':
-            # Text was removed (don't show in new version)
-            continue
-        elif tag == 'insert':
-            # Text was added
-            added_text = ' '.join(new_words[j1:j2])
-            result.append(f"{Colors.GREEN}{added_text}{Colors.RESET}")
-        elif tag == 'replace':
-            # Text was changed
-            changed_text = ' '.join(new_words[j1:j2])
-            result.append(f"{Colors.YELLOW}{changed_text}{Colors.RESET}")
-    
-    return ' '.join(result)
+    return render_ansi_segments(diff_text_segments(old_text, new_text))
 
 def compare_hypothesis_sections(old_hypothesis, new_hypothesis):
     """
@@ -2726,7 +3922,7 @@ def compare_hypothesis_sections(old_hypothesis, new_hypothesis):
     new_hallmarks = new_hypothesis.get('hallmarks', {})
     result['hallmarks_highlighted'] = {}
     
-    for key in ['testability', 'specificity', 'grounded_knowledge', 'predictive_power', 'parsimony']:
+    for key, _ in HALLMARK_TITLES:
         old_text = old_hallmarks.get(key, '')
         new_text = new_hallmarks.get(key, '')
         if old_text != new_text:
@@ -2791,10 +3987,17 @@ def compare_hypothesis_sections(old_hypothesis, new_hypothesis):
     
     return result
 
+# Reasoning models (o3, o4-mini) reject the temperature parameter
+_REASONING_MODELS = frozenset({"o3", "o4-mini", "o4mini"})
+
+# Models whose endpoints accept response_format={"type": "json_object"}; a
+# server entry can override this with supports_json_mode: true/false
+_JSON_MODE_MODELS = frozenset({"gpt-4o", "gpt-4.1", "gpt-4-turbo", "gpt-3.5-turbo", "o3", "o4-mini"})
+
 def load_model_config(model_shortname, config_path=None):
     """
     Load model configuration from the model_servers.yaml file.
-    Returns a dictionary with api_key, api_base, and model_name.
+    Returns a dictionary with api_key, api_base, model_name, skip_temperature, and json_mode.
     """
     if not model_shortname or not model_shortname.strip():
         print("Error: Model shortname cannot be empty")
@@ -2825,10 +4028,13 @@ def load_model_config(model_shortname, config_path=None):
                         print(f"Error: Environment variable {env_var} not set")
                         sys.exit(1)
                 
+                model_name = server['openai_model']
                 return {
                     'api_key': api_key,
                     'api_base': server['openai_api_base'],
-                    'model_name': server['openai_model']
+                    'model_name': model_name,
+                    'skip_temperature': any(name in model_name.lower() for name in _REASONING_MODELS),
+                    'json_mode': server.get('supports_json_mode', any(name in model_name.lower() for name in _JSON_MODE_MODELS))
                 }
                 
         # If not found
@@ -2843,45 +4049,16 @@ def load_model_config(model_shortname, config_path=None):
         print(f"Error loading model configuration: {e}")
         sys.exit(1)
 
-@backoff.on_exception(
-    backoff.expo,
-    (Exception),
-    max_tries=5,
-    giveup=lambda e: "Invalid authentication" in str(e),
-    max_time=300
-)
-def generate_hypotheses(research_goal, config, num_hypotheses=5, strategy_manager=None):
+# System prompts hold all static instructions so every request shares the same
+# prefix (which providers can serve from their prompt cache); the user message
+# carries only the per-request fields
+GENERATE_SYSTEM_PROMPT = (
+    "You are an expert research scientist capable of generating creative, novel, and scientifically rigorous hypotheses. "
+    "You excel at identifying unexplored research directions and formulating testable predictions that advance scientific understanding. "
+    "Your hypotheses are grounded in existing knowledge while pushing the boundaries of current understanding."
     """
-    Generate scientific hypotheses based on a research goal.
-    Returns a list of hypothesis objects.
-    
-    This function uses exponential backoff to handle rate limits and transient errors.
-    It will retry up to 5 times with increasing delays between attempts or until max_time is reached.
-    
-    Args:
-        research_goal (str): The research goal or question
-        config (dict): Configuration for the model API
-        num_hypotheses (int): Number of hypotheses to generate
-        strategy_manager (HypothesisStrategyManager): Optional strategy manager for enhanced generation
-    """
-    # Configure the OpenAI client
-    api_key = config['api_key']
-    api_base = config['api_base']
-    model_name = config['model_name']
-    
-    # System prompt for hypothesis generation
-    system_message = (
-        "You are an expert research scientist capable of generating creative, novel, and scientifically rigorous hypotheses. "
-        "You excel at identifying unexplored research directions and formulating testable predictions that advance scientific understanding. "
-        "Your hypotheses are grounded in existing knowledge while pushing the boundaries of current understanding."
-    )
-    
-    # User prompt with detailed instructions
-    user_message = f"""
-Based on the following research goal, generate {num_hypotheses} creative and novel scientific hypotheses. Each hypothesis should be original, testable, and provide new insights into the research area.
 
-RESEARCH GOAL:
-{research_goal}
+You will be given a research goal and asked for a number of hypotheses. Each hypothesis should be original, testable, and provide new insights into the research area.
 
 For each hypothesis, provide:
 1. TITLE: A concise, descriptive title for the hypothesis
@@ -2908,113 +4085,286 @@ The Five Hallmarks of a Strong Scientific Hypothesis:
 5. **Parsimony (The Principle of Simplicity)**
    Among competing explanations, it employs the fewest necessary assumptions while still accounting for the phenomena, maximizing interpretability and generality.
 
-Please format your response as a JSON array where each hypothesis is an object with the following structure:
-{{
+Respond with ONLY a JSON object with a single key "hypotheses" whose value is an array of the requested number of hypotheses, each an object with the following structure:
+{
   "title": "Hypothesis title",
   "description": "Detailed paragraph description",
   "experimental_validation": "Comprehensive experimental validation plan including specific methods, controls, measurements, timeline, and expected outcomes",
   "theory_and_computation": "Detailed description of theoretical frameworks, computational models, simulations, mathematical analyses, or computational approaches that could be developed to explore, predict, or validate this hypothesis",
-  "hallmarks": {{
+  "hallmarks": {
     "testability": "Paragraph explaining how this hypothesis satisfies testability/falsifiability",
     "specificity": "Paragraph explaining how this hypothesis satisfies specificity and clarity",
     "grounded_knowledge": "Paragraph explaining how this hypothesis is grounded in prior knowledge",
     "predictive_power": "Paragraph explaining the predictive power and novel insights",
     "parsimony": "Paragraph explaining how this hypothesis follows the principle of simplicity"
-  }},
+  },
   "references": [
-    {{
+    {
       "citation": "Author, A. (Year). Title of paper. Journal Name, Volume(Issue), pages.",
       "annotation": "Brief explanation of how this reference supports or relates to the hypothesis"
-    }}
+    }
   ]
-}}
+}
+
+Keep each hallmark paragraph to 80 words or fewer.
+
+Ensure each hypothesis is substantively different from the others and explores unique aspects or approaches to the research goal."""
+)
+
+IMPROVE_SYSTEM_PROMPT = (
+    "You are an expert research scientist who excels at refining and improving scientific hypotheses based on feedback. "
+    "You take existing hypotheses and user feedback to create enhanced versions that address the concerns and suggestions "
+    "while maintaining scientific rigor and novelty."
+    """
+
+You will be given the original research goal, the current hypothesis, and user feedback. Improve the hypothesis to address the feedback while maintaining scientific quality.
+
+Provide an improved version of the hypothesis that:
+1. Addresses the specific concerns and suggestions in the user feedback
+2. Maintains or enhances scientific rigor and testability
+3. Keeps the core innovative insights while making requested improvements
+4. Ensures the hypothesis remains relevant to the original research goal
+5. Includes relevant scientific references that support the improved hypothesis (3-5 references minimum)
+
+Respond with ONLY a JSON object with the following structure:
+{
+  "title": "Improved hypothesis title",
+  "description": "Detailed paragraph description incorporating the feedback",
+  "experimental_validation": "Comprehensive experimental validation plan including specific methods, controls, measurements, timeline, and expected outcomes",
+  "theory_and_computation": "Detailed description of theoretical frameworks, computational models, simulations, mathematical analyses, or computational approaches that could be developed to explore, predict, or validate this improved hypothesis",
+  "hallmarks": {
+    "testability": "Paragraph explaining how this improved hypothesis satisfies testability/falsifiability",
+    "specificity": "Paragraph explaining how this improved hypothesis satisfies specificity and clarity",
+    "grounded_knowledge": "Paragraph explaining how this improved hypothesis is grounded in prior knowledge",
+    "predictive_power": "Paragraph explaining the predictive power and novel insights",
+    "parsimony": "Paragraph explaining how this improved hypothesis follows the principle of simplicity"
+  },
+  "references": [
+    {
+      "citation": "Author, A. (Year). Title of paper. Journal Name, Volume(Issue), pages.",
+      "annotation": "Brief explanation of how this reference supports or relates to the hypothesis"
+    }
+  ],
+  "improvements_made": "Brief explanation of what specific changes were made based on the user feedback"
+}
 
-Ensure each hypothesis is substantively different from the others and explores unique aspects or approaches to the research goal.
+Keep each hallmark paragraph to 80 words or fewer."""
+)
+
+def _generation_request(research_goal, config, num_hypotheses=5, strategy_manager=None):
+    """Chat completion parameters asking the model for num_hypotheses new hypotheses"""
+    model_name = config['model_name']
+    
+    # Only the goal, count and strategy vary; the instructions are in the system prompt
+    user_message = f"""RESEARCH GOAL:
+{research_goal}
+
+Generate {num_hypotheses} creative and novel scientific hypotheses for this research goal.
 
 {strategy_manager.get_strategy_prompt_additions() if strategy_manager else ""}
 """
     
+    params = {
+        "model": model_name,
+        "messages": [
+            {"role": "system", "content": GENERATE_SYSTEM_PROMPT},
+            {"role": "user", "content": user_message},
+        ]
+    }
+    
+    # Add temperature only for models that support it (flag set in load_model_config)
+    if not config['skip_temperature']:
+        params["temperature"] = 0.7  # Higher temperature for creativity
+    
+    # Constrain the output to valid JSON where the endpoint supports it
+    if config['json_mode']:
+        params["response_format"] = {"type": "json_object"}
+    
+    return params
+
+def _find_hypothesis_array(text):
+    """Decode the first JSON array of hypothesis objects in text surrounded by prose; None if there isn't one.
+    
+    Each '[' is tried in turn with raw_decode, so brackets in the prose or inside
+    strings are skipped; arrays whose items aren't objects with a title (e.g. a
+    lone hypothesis's references) don't count.
+    """
+    text = clean_json_string(text)
+    decoder = json.JSONDecoder()
+    start = text.find('[')
+    while start != -1:
+        try:
+            data, _ = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if data and all(isinstance(item, dict) and "title" in item for item in data):
+                return data
+        start = text.find('[', start + 1)
+    return None
+
+def _parse_generated_hypotheses(generated_text):
+    """Parse a generation response into a list of hypotheses; unparseable output becomes one error entry"""
     try:
-        # Add a small random delay to avoid overloading the API
-        jitter = random.uniform(0.1, 1.0)
-        time.sleep(jitter)
-        
-        # Create a new client instance
-        import openai as openai_module
-        client = openai_module.OpenAI(
-            api_key=api_key,
-            base_url=api_base,
-            timeout=180.0  # 3 minute timeout for longer generation
-        )
-        
-        # Check if we need to skip temperature (for reasoning models like o3 and o4mini)
-        skip_temperature = any(name in model_name.lower() for name in ["o3", "o4-mini", "o4mini"])
-        
-        # Prepare parameters
-        params = {
-            "model": model_name,
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message},
-            ]
-        }
-        
-        # Add temperature only for models that support it
-        if not skip_temperature:
-            params["temperature"] = 0.7  # Higher temperature for creativity
-        
-        # Call the API with the prepared parameters
-        response = client.chat.completions.create(**params)
+        # Normally exactly the {"hypotheses": [...]} object
+        try:
+            data = parse_llm_json(generated_text)
+        except json.JSONDecodeError:
+            # Prose around it: look for the array first (it may also be the older bare
+            # [{...}, {...}] format), since the first balanced object would only be
+            # its first hypothesis; then fall back to a lone hypothesis object
+            data = _find_hypothesis_array(generated_text)
+            if data is None:
+                data = parse_llm_json_object(generated_text)
+        
+        if isinstance(data, dict):
+            # A lone hypothesis object is accepted in place of the wrapper
+            data = data.get("hypotheses", [data])
+        if not isinstance(data, list):
+            data = [data]
+        return [h for h in data if isinstance(h, dict)]
+            
+    except json.JSONDecodeError as je:
+        print(f"Error parsing JSON response from model: {je}")
+        print(f"Raw response: {generated_text[:500]}...")
+        # Return an error structure
+        return [{
+            "title": "Error: Could not parse model response",
+            "description": f"The model returned a response that could not be parsed as JSON: {str(je)}",
+            "hallmarks": {
+                "testability": "N/A",
+                "specificity": "N/A", 
+                "grounded_knowledge": "N/A",
+                "predictive_power": "N/A",
+                "parsimony": "N/A"
+            },
+            "references": [],
+            "error": True,
+            "raw_response": generated_text
+        }]
+
+@backoff.on_exception(
+    backoff.expo,
+    (Exception),
+    max_tries=5,
+    giveup=lambda e: "Invalid authentication" in str(e),
+    max_time=300
+)
+def generate_hypotheses(research_goal, config, num_hypotheses=5, strategy_manager=None):
+    """
+    Generate scientific hypotheses based on a research goal.
+    Returns a list of hypothesis objects.
+    
+    This function uses exponential backoff to handle rate limits and transient errors.
+    It will retry up to 5 times with increasing delays between attempts or until max_time is reached.
+    
+    Args:
+        research_goal (str): The research goal or question
+        config (dict): Configuration for the model API
+        num_hypotheses (int): Number of hypotheses to generate
+        strategy_manager (HypothesisStrategyManager): Optional strategy manager for enhanced generation
+    """
+    try:
+        # Shared client for this endpoint, 3 minute timeout for longer generation
+        client = _get_openai_client(config, timeout=180.0)
+        params = _generation_request(research_goal, config, num_hypotheses, strategy_manager)
         
-        # Handle the response based on the OpenAI client version
-        if hasattr(response, 'choices'):
-            # New OpenAI client
-            generated_text = response.choices[0].message.content.strip()
-        else:
-            # Legacy dict-style response
-            generated_text = response["choices"][0]["message"]["content"].strip()
+        # Call the API with the prepared parameters (or reuse a cached response),
+        # holding back only if the endpoint has reported its rate limit as used up
+        generated_text = chat_completion_text(client, config, **params)
         
-        # Try to parse the JSON response
-        try:
-            # Extract JSON from the response (handle cases where model adds extra text)
-            json_start = generated_text.find('[')
-            json_end = generated_text.rfind(']') + 1
-            if json_start != -1 and json_end != 0:
-                json_text = generated_text[json_start:json_end]
-                # Clean control characters before parsing
-                json_text = clean_json_string(json_text)
-                hypotheses = json.loads(json_text)
-                return hypotheses
-            else:
-                # Fallback: try to parse the entire response as JSON
-                cleaned_text = clean_json_string(generated_text)
-                hypotheses = json.loads(cleaned_text)
-                return hypotheses
-                
-        except json.JSONDecodeError as je:
-            print(f"Error parsing JSON response from model: {je}")
-            print(f"Raw response: {generated_text[:500]}...")
-            # Return an error structure
-            return [{
-                "title": "Error: Could not parse model response",
-                "description": f"The model returned a response that could not be parsed as JSON: {str(je)}",
-                "hallmarks": {
-                    "testability": "N/A",
-                    "specificity": "N/A", 
-                    "grounded_knowledge": "N/A",
-                    "predictive_power": "N/A",
-                    "parsimony": "N/A"
-                },
-                "references": [],
-                "error": True,
-                "raw_response": generated_text
-            }]
+        return _parse_generated_hypotheses(generated_text)
             
     except Exception as e:
         # Propagate the exception to trigger backoff
         print(f"Error in generate_hypotheses (will retry): {str(e)}")
         raise
 
+# Seconds between status checks while waiting on a --batch generation
+BATCH_POLL_INTERVAL = 60
+
+def generate_hypotheses_batch(research_goal, config, num_hypotheses=5, poll_interval=BATCH_POLL_INTERVAL):
+    """
+    Generate hypotheses offline through the provider's Batch API.
+    
+    Submits one single-hypothesis request per hypothesis (the same requests the
+    interactive session fans out), waits for the batch to finish and parses the
+    results. Batches cost about half as much as real-time calls but can take up
+    to 24 hours, so this is only used for non-interactive runs (--batch).
+    
+    Args:
+        research_goal (str): The research goal or question
+        config (dict): Configuration for the model API
+        num_hypotheses (int): Number of hypotheses to generate
+        poll_interval (float): Seconds between batch status checks
+        
+    Returns:
+        list: Generated hypotheses in request order, or an empty list if the batch failed
+    """
+    client = _get_openai_client(config)
+    
+    # One JSONL line per request; custom_id carries the position for reordering
+    lines = []
+    for i in range(num_hypotheses):
+        lines.append(json.dumps({
+            "custom_id": f"hypothesis-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _generation_request(research_goal, config, num_hypotheses=1)
+        }))
+    batch_input = ("\n".join(lines) + "\n").encode("utf-8")
+    
+    try:
+        input_file = client.files.create(file=("wisteria_batch.jsonl", batch_input), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {num_hypotheses} request{'s' if num_hypotheses != 1 else ''}")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts:
+                print(f"Batch {batch.id}: {batch.status} ({counts.completed}/{counts.total} completed)")
+            else:
+                print(f"Batch {batch.id}: {batch.status}")
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            print(f"Batch {batch.id} ended with status '{batch.status}'")
+            return []
+        
+        output_text = client.files.content(batch.output_file_id).text
+    except Exception as e:
+        print(f"Error running generation batch: {e}")
+        return []
+    
+    # Output lines come back in completion order; a bad line only loses its own request
+    results = {}
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                print(f"Error in {record.get('custom_id')}: {record.get('error') or response.get('status_code')}")
+                continue
+            generated_text = response["body"]["choices"][0]["message"]["content"].strip()
+            index = int(record["custom_id"].rsplit("-", 1)[1])
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+            print(f"Skipping malformed batch output line: {e}")
+            continue
+        
+        # Only take the first hypothesis, as the interactive fan-out does
+        hypotheses = _parse_generated_hypotheses(generated_text)
+        if hypotheses and not hypotheses[0].get("error"):
+            results[index] = hypotheses[0]
+    
+    return [results[i] for i in sorted(results)]
+
 def display_hypotheses(hypotheses):
     """
     Display hypotheses in a formatted way to the console.
@@ -3121,15 +4471,7 @@ def display_single_hypothesis(hypothesis, hypothesis_number, previous_hypothesis
         print(f"\nHallmarks Analysis:")
         
         # Display each hallmark with highlighting if available
-        hallmark_names = [
-            ('testability', 'Testability (Falsifiability)'),
-            ('specificity', 'Specificity and Clarity'),
-            ('grounded_knowledge', 'Grounded in Prior Knowledge'),
-            ('predictive_power', 'Predictive Power & Novel Insight'),
-            ('parsimony', 'Parsimony (Principle of Simplicity)')
-        ]
-        
-        for i, (key, title) in enumerate(hallmark_names, 1):
+        for i, (key, title) in enumerate(HALLMARK_TITLES, 1):
             print(f"\n{i}. {title}:")
             text = highlighted_hallmarks.get(key, hallmarks.get(key, 'No analysis provided.'))
             print(f"   {text}")
@@ -3299,23 +4641,10 @@ def improve_hypothesis(research_goal, current_hypothesis, user_feedback, config,
     Returns:
         dict: Improved hypothesis object
     """
-    # Configure the OpenAI client
-    api_key = config['api_key']
-    api_base = config['api_base']
     model_name = config['model_name']
     
-    # System prompt for hypothesis improvement
-    system_message = (
-        "You are an expert research scientist who excels at refining and improving scientific hypotheses based on feedback. "
-        "You take existing hypotheses and user feedback to create enhanced versions that address the concerns and suggestions "
-        "while maintaining scientific rigor and novelty."
-    )
-    
-    # User prompt with detailed instructions
-    user_message = f"""
-Based on the original research goal, current hypothesis, and user feedback provided below, please improve the hypothesis to address the feedback while maintaining scientific quality.
-
-ORIGINAL RESEARCH GOAL:
+    # Only the goal, hypothesis and feedback vary; the instructions are in the system prompt
+    user_message = f"""ORIGINAL RESEARCH GOAL:
 {research_goal}
 
 CURRENT HYPOTHESIS:
@@ -3326,106 +4655,44 @@ Experimental Validation: {current_hypothesis.get('experimental_validation', 'No
 USER FEEDBACK:
 {user_feedback}
 
-Please provide an improved version of this hypothesis that:
-1. Addresses the specific concerns and suggestions in the user feedback
-2. Maintains or enhances scientific rigor and testability
-3. Keeps the core innovative insights while making requested improvements
-4. Ensures the hypothesis remains relevant to the original research goal
-5. Includes relevant scientific references that support the improved hypothesis (3-5 references minimum)
-
-Please format your response as a JSON object with the following structure:
-{{
-  "title": "Improved hypothesis title",
-  "description": "Detailed paragraph description incorporating the feedback",
-  "experimental_validation": "Comprehensive experimental validation plan including specific methods, controls, measurements, timeline, and expected outcomes",
-  "theory_and_computation": "Detailed description of theoretical frameworks, computational models, simulations, mathematical analyses, or computational approaches that could be developed to explore, predict, or validate this improved hypothesis",
-  "hallmarks": {{
-    "testability": "Paragraph explaining how this improved hypothesis satisfies testability/falsifiability",
-    "specificity": "Paragraph explaining how this improved hypothesis satisfies specificity and clarity", 
-    "grounded_knowledge": "Paragraph explaining how this improved hypothesis is grounded in prior knowledge",
-    "predictive_power": "Paragraph explaining the predictive power and novel insights",
-    "parsimony": "Paragraph explaining how this improved hypothesis follows the principle of simplicity"
-  }},
-  "references": [
-    {{
-      "citation": "Author, A. (Year). Title of paper. Journal Name, Volume(Issue), pages.",
-      "annotation": "Brief explanation of how this reference supports or relates to the hypothesis"
-    }}
-  ],
-  "improvements_made": "Brief explanation of what specific changes were made based on the user feedback"
-}}
-
 {strategy_manager.get_strategy_prompt_additions() if strategy_manager else ""}
 """
     
     try:
-        # Add a small random delay to avoid overloading the API
-        jitter = random.uniform(0.1, 1.0)
-        time.sleep(jitter)
-        
-        # Create a new client instance
-        import openai as openai_module
-        client = openai_module.OpenAI(
-            api_key=api_key,
-            base_url=api_base,
-            timeout=180.0  # 3 minute timeout for longer generation
-        )
-        
-        # Check if we need to skip temperature (for reasoning models like o3 and o4mini)
-        skip_temperature = any(name in model_name.lower() for name in ["o3", "o4-mini", "o4mini"])
+        # Shared client for this endpoint, 3 minute timeout for longer generation
+        client = _get_openai_client(config, timeout=180.0)
         
         # Prepare parameters
         params = {
             "model": model_name,
             "messages": [
-                {"role": "system", "content": system_message},
+                {"role": "system", "content": IMPROVE_SYSTEM_PROMPT},
                 {"role": "user", "content": user_message},
             ]
         }
         
-        # Add temperature only for models that support it
-        if not skip_temperature:
+        # Add temperature only for models that support it (flag set in load_model_config)
+        if not config['skip_temperature']:
             params["temperature"] = 0.7  # Higher temperature for creativity
         
-        # Call the API with the prepared parameters
-        response = client.chat.completions.create(**params)
+        # Constrain the output to valid JSON where the endpoint supports it
+        if config['json_mode']:
+            params["response_format"] = {"type": "json_object"}
         
-        # Handle the response based on the OpenAI client version
-        if hasattr(response, 'choices'):
-            # New OpenAI client
-            generated_text = response.choices[0].message.content.strip()
-        else:
-            # Legacy dict-style response
-            generated_text = response["choices"][0]["message"]["content"].strip()
+        # Call the API with the prepared parameters (or reuse a cached response),
+        # holding back only if the endpoint has reported its rate limit as used up
+        generated_text = chat_completion_text(client, config, **params)
         
-        # Try to parse the JSON response
+        # Try to parse the JSON response (the model may add text around it)
         try:
-            # Extract JSON from the response (handle cases where model adds extra text)
-            json_start = generated_text.find('{')
-            json_end = generated_text.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_text = generated_text[json_start:json_end]
-                # Clean control characters before parsing
-                json_text = clean_json_string(json_text)
-                improved_hypothesis = json.loads(json_text)
-                # Initialize feedback history if not present
-                if "feedback_history" not in improved_hypothesis:
-                    improved_hypothesis["feedback_history"] = []
-                # Initialize notes if not present
-                if "notes" not in improved_hypothesis:
-                    improved_hypothesis["notes"] = ""
-                return improved_hypothesis
-            else:
-                # Fallback: try to parse the entire response as JSON
-                cleaned_text = clean_json_string(generated_text)
-                improved_hypothesis = json.loads(cleaned_text)
-                # Initialize feedback history if not present
-                if "feedback_history" not in improved_hypothesis:
-                    improved_hypothesis["feedback_history"] = []
-                # Initialize notes if not present
-                if "notes" not in improved_hypothesis:
-                    improved_hypothesis["notes"] = ""
-                return improved_hypothesis
+            improved_hypothesis = parse_llm_json_object(generated_text)
+            # Initialize feedback history if not present
+            if "feedback_history" not in improved_hypothesis:
+                improved_hypothesis["feedback_history"] = []
+            # Initialize notes if not present
+            if "notes" not in improved_hypothesis:
+                improved_hypothesis["notes"] = ""
+            return improved_hypothesis
                 
         except json.JSONDecodeError as je:
             print(f"Error parsing JSON response from model: {je}")
@@ -3472,9 +4739,6 @@ def revise_hypothesis(research_goal, current_hypothesis, config):
     Returns:
         dict: Revised hypothesis object
     """
-    # Configure the OpenAI client
-    api_key = config['api_key']
-    api_base = config['api_base']
     model_name = config['model_name']
     
     # System prompt for hypothesis revision
@@ -3559,20 +4823,8 @@ Please format your response as a JSON object with the following structure:
 """
     
     try:
-        # Add a small random delay to avoid overloading the API
-        jitter = random.uniform(0.1, 1.0)
-        time.sleep(jitter)
-        
-        # Create a new client instance
-        import openai as openai_module
-        client = openai_module.OpenAI(
-            api_key=api_key,
-            base_url=api_base,
-            timeout=180.0  # 3 minute timeout for longer generation
-        )
-        
-        # Check if we need to skip temperature (for reasoning models like o3 and o4mini)
-        skip_temperature = any(name in model_name.lower() for name in ["o3", "o4-mini", "o4mini"])
+        # Shared client for this endpoint, 3 minute timeout for longer generation
+        client = _get_openai_client(config, timeout=180.0)
         
         # Prepare parameters
         params = {
@@ -3583,49 +4835,28 @@ Please format your response as a JSON object with the following structure:
             ]
         }
         
-        # Add temperature only for models that support it
-        if not skip_temperature:
+        # Add temperature only for models that support it (flag set in load_model_config)
+        if not config['skip_temperature']:
             params["temperature"] = 0.7  # Higher temperature for creativity
         
-        # Call the API with the prepared parameters
-        response = client.chat.completions.create(**params)
+        # Constrain the output to valid JSON where the endpoint supports it
+        if config['json_mode']:
+            params["response_format"] = {"type": "json_object"}
         
-        # Handle the response based on the OpenAI client version
-        if hasattr(response, 'choices'):
-            # New OpenAI client
-            generated_text = response.choices[0].message.content.strip()
-        else:
-            # Legacy dict-style response
-            generated_text = response["choices"][0]["message"]["content"].strip()
+        # Call the API with the prepared parameters (or reuse a cached response),
+        # holding back only if the endpoint has reported its rate limit as used up
+        generated_text = chat_completion_text(client, config, **params)
         
-        # Try to parse the JSON response
+        # Try to parse the JSON response (the model may add text around it)
         try:
-            # Extract JSON from the response (handle cases where model adds extra text)
-            json_start = generated_text.find('{')
-            json_end = generated_text.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_text = generated_text[json_start:json_end]
-                # Clean control characters before parsing
-                json_text = clean_json_string(json_text)
-                revised_hypothesis = json.loads(json_text)
-                # Initialize feedback history if not present
-                if "feedback_history" not in revised_hypothesis:
-                    revised_hypothesis["feedback_history"] = []
-                # Initialize notes if not present
-                if "notes" not in revised_hypothesis:
-                    revised_hypothesis["notes"] = ""
-                return revised_hypothesis
-            else:
-                # Fallback: try to parse the entire response as JSON
-                cleaned_text = clean_json_string(generated_text)
-                revised_hypothesis = json.loads(cleaned_text)
-                # Initialize feedback history if not present
-                if "feedback_history" not in revised_hypothesis:
-                    revised_hypothesis["feedback_history"] = []
-                # Initialize notes if not present
-                if "notes" not in revised_hypothesis:
-                    revised_hypothesis["notes"] = ""
-                return revised_hypothesis
+            revised_hypothesis = parse_llm_json_object(generated_text)
+            # Initialize feedback history if not present
+            if "feedback_history" not in revised_hypothesis:
+                revised_hypothesis["feedback_history"] = []
+            # Initialize notes if not present
+            if "notes" not in revised_hypothesis:
+                revised_hypothesis["notes"] = ""
+            return revised_hypothesis
                 
         except json.JSONDecodeError as je:
             print(f"Error parsing JSON response from model: {je}")
@@ -3672,9 +4903,6 @@ def generate_new_hypothesis(research_goal, previous_hypotheses, config, strategy
     Returns:
         dict: New hypothesis object
     """
-    # Configure the OpenAI client
-    api_key = config['api_key']
-    api_base = config['api_base']
     model_name = config['model_name']
     
     # System prompt for new hypothesis generation
@@ -3737,20 +4965,8 @@ Ensure this hypothesis explores a unique angle that has not been covered by the
 """
     
     try:
-        # Add a small random delay to avoid overloading the API
-        jitter = random.uniform(0.1, 1.0)
-        time.sleep(jitter)
-        
-        # Create a new client instance
-        import openai as openai_module
-        client = openai_module.OpenAI(
-            api_key=api_key,
-            base_url=api_base,
-            timeout=180.0  # 3 minute timeout for longer generation
-        )
-        
-        # Check if we need to skip temperature (for reasoning models like o3 and o4mini)
-        skip_temperature = any(name in model_name.lower() for name in ["o3", "o4-mini", "o4mini"])
+        # Shared client for this endpoint, 3 minute timeout for longer generation
+        client = _get_openai_client(config, timeout=180.0)
         
         # Prepare parameters
         params = {
@@ -3761,49 +4977,28 @@ Ensure this hypothesis explores a unique angle that has not been covered by the
             ]
         }
         
-        # Add temperature only for models that support it
-        if not skip_temperature:
+        # Add temperature only for models that support it (flag set in load_model_config)
+        if not config['skip_temperature']:
             params["temperature"] = 0.8  # Higher temperature for more creativity
         
-        # Call the API with the prepared parameters
-        response = client.chat.completions.create(**params)
+        # Constrain the output to valid JSON where the endpoint supports it
+        if config['json_mode']:
+            params["response_format"] = {"type": "json_object"}
         
-        # Handle the response based on the OpenAI client version
-        if hasattr(response, 'choices'):
-            # New OpenAI client
-            generated_text = response.choices[0].message.content.strip()
-        else:
-            # Legacy dict-style response
-            generated_text = response["choices"][0]["message"]["content"].strip()
+        # Call the API with the prepared parameters (or reuse a cached response),
+        # holding back only if the endpoint has reported its rate limit as used up
+        generated_text = chat_completion_text(client, config, **params)
         
-        # Try to parse the JSON response
+        # Try to parse the JSON response (the model may add text around it)
         try:
-            # Extract JSON from the response (handle cases where model adds extra text)
-            json_start = generated_text.find('{')
-            json_end = generated_text.rfind('}') + 1
-            if json_start != -1 and json_end != 0:
-                json_text = generated_text[json_start:json_end]
-                # Clean control characters before parsing
-                json_text = clean_json_string(json_text)
-                new_hypothesis = json.loads(json_text)
-                # Initialize feedback history for new hypotheses
-                if "feedback_history" not in new_hypothesis:
-                    new_hypothesis["feedback_history"] = []
-                # Initialize notes for new hypotheses
-                if "notes" not in new_hypothesis:
-                    new_hypothesis["notes"] = ""
-                return new_hypothesis
-            else:
-                # Fallback: try to parse the entire response as JSON
-                cleaned_text = clean_json_string(generated_text)
-                new_hypothesis = json.loads(cleaned_text)
-                # Initialize feedback history for new hypotheses
-                if "feedback_history" not in new_hypothesis:
-                    new_hypothesis["feedback_history"] = []
-                # Initialize notes for new hypotheses
-                if "notes" not in new_hypothesis:
-                    new_hypothesis["notes"] = ""
-                return new_hypothesis
+            new_hypothesis = parse_llm_json_object(generated_text)
+            # Initialize feedback history for new hypotheses
+            if "feedback_history" not in new_hypothesis:
+                new_hypothesis["feedback_history"] = []
+            # Initialize notes for new hypotheses
+            if "notes" not in new_hypothesis:
+                new_hypothesis["notes"] = ""
+            return new_hypothesis
                 
         except json.JSONDecodeError as je:
             print(f"Error parsing JSON response from model: {je}")
@@ -3846,22 +5041,142 @@ def save_hypotheses_to_json(hypotheses, output_file, metadata):
     with open(output_file, "w", encoding="utf-8") as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
 
+class SessionJournal:
+    """Append-only JSONL journal of hypotheses accepted during a session.
+
+    Each hypothesis is written and flushed as soon as it is added, so saving
+    costs O(new hypothesis) rather than O(session) and an interrupted session
+    can be recovered. The first line of a new journal holds the session
+    metadata; a consolidated, pretty-printed JSON file is written on quit or
+    with the 'x' command.
+    
+    Each journal belongs to one session: a journal left at the same path by
+    an earlier run is renamed aside rather than appended to, so its entries
+    can't leak into this session's recovery.
+    """
+    def __init__(self, path, metadata=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self._rotate_existing(path)
+        self.file = open(path, "w", encoding="utf-8")
+        if metadata is not None:
+            self.file.write(self._encode({"metadata": metadata}))
+            self.file.flush()
+
+    @staticmethod
+    def _rotate_existing(path):
+        """Rename a non-empty journal from an earlier run to <name>.<timestamp><ext>"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        if stat.st_size == 0:
+            return
+        root, ext = os.path.splitext(path)
+        stamp = datetime.fromtimestamp(stat.st_mtime).strftime("%Y%m%d_%H%M%S")
+        rotated = f"{root}.{stamp}{ext}"
+        try:
+            os.replace(path, rotated)
+            print(f"Moved previous session journal to {rotated}")
+        except OSError as e:
+            print(f"Error moving previous session journal {path}: {e}")
+
+    @staticmethod
+    def _encode(obj):
+        """Serialize one compact JSON line, using orjson when it is installed"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE).decode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    def append(self, hypothesis):
+        """Write a single hypothesis as one JSON line.
+        
+        Also used after a hypothesis is edited in place: on read, a later line
+        with the same hypothesis_number and version replaces the earlier one.
+        """
+        line = self._encode(hypothesis)
+        with self.lock:
+            if self.file.closed:
+                return
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self):
+        """Close the journal file"""
+        with self.lock:
+            self.file.close()
+
+    def discard(self):
+        """Close and delete the journal once a full save has succeeded"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def read(path):
+        """Read a journal line by line, skipping a truncated final line
+        
+        Repeated entries for the same hypothesis_number and version are
+        merged, last writer wins, keeping the position of the first one.
+        
+        Returns:
+            tuple: (metadata, hypotheses)
+        """
+        metadata = {}
+        hypotheses = []
+        positions = {}  # (hypothesis_number, version) -> index in hypotheses
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = _json_loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if "metadata" in entry and len(entry) == 1:
+                        metadata = entry["metadata"]
+                        continue
+                    key = (entry.get("hypothesis_number"), entry.get("version"))
+                    if key[0] is not None and key in positions:
+                        hypotheses[positions[key]] = entry
+                    else:
+                        positions[key] = len(hypotheses)
+                        hypotheses.append(entry)
+        except FileNotFoundError:
+            pass
+        return metadata, hypotheses
+
+    @staticmethod
+    def load(path):
+        """Read hypotheses back from a journal"""
+        return SessionJournal.read(path)[1]
+
 def load_session_from_json(filename):
     """
-    Load a previous session from a JSON file.
+    Load a previous session from a JSON file or a .jsonl session journal.
     
     Args:
-        filename (str): Path to the JSON file
+        filename (str): Path to the JSON or JSONL file
         
     Returns:
         tuple: (research_goal, all_hypotheses, metadata) or (None, None, None) if error
     """
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        metadata = data.get("metadata", {})
-        hypotheses = data.get("hypotheses", [])
+        if filename.endswith(".jsonl"):
+            if not os.path.exists(filename):
+                raise FileNotFoundError(filename)
+            metadata, hypotheses = SessionJournal.read(filename)
+        else:
+            # orjson parses UTF-8 bytes directly, skipping the text decode
+            with open(filename, "rb") as f:
+                data = _json_loads(f.read())
+            
+            metadata = data.get("metadata", {})
+            hypotheses = data.get("hypotheses", [])
         research_goal = metadata.get("research_goal", "")
         
         # Ensure all loaded hypotheses have feedback_history and notes fields
@@ -3923,7 +5238,7 @@ def view_hypothesis_titles(all_hypotheses):
     for hyp_num in sorted(hypothesis_groups.keys()):
         hyp_versions = hypothesis_groups[hyp_num]
         # Get the latest version
-        latest_version = max(hyp_versions, key=lambda h: h.get("version", "1.0"))
+        latest_version = max(hyp_versions, key=version_key)
         
         version = latest_version.get("version", "1.0")
         title = latest_version.get("title", "Untitled")
@@ -3969,7 +5284,7 @@ def select_hypothesis(all_hypotheses):
     
     for hyp_num in available_numbers:
         hyp_versions = hypothesis_groups[hyp_num]
-        latest_version = max(hyp_versions, key=lambda h: h.get("version", "1.0"))
+        latest_version = max(hyp_versions, key=version_key)
         
         version = latest_version.get("version", "1.0")
         title = latest_version.get("title", "Untitled")
@@ -4009,11 +5324,17 @@ def parse_arguments():
     parser.add_argument('--resume', help='Resume from a previous session JSON file')
     parser.add_argument('--num-hypotheses', type=int, default=1, 
                        help='Number of initial hypotheses to generate (default: 1)')
+    parser.add_argument('--batch', action='store_true',
+                       help='Generate the initial hypotheses through the provider Batch API (lower cost, may take hours) and save them without starting the interface')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the model response cache (~/.wisteria/llm_cache.sqlite)')
+    parser.add_argument('--cache-nondeterministic', action='store_true',
+                       help='Also cache sampled (temperature > 0) responses; needed for generation and improvement calls to be cached at all, so identical re-runs replay them')
     parser.add_argument('--test-feedback', action='store_true',
                        help='Run feedback tracking test and generate sample PDF')
     return parser.parse_args()
 
-def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypotheses=None, num_initial_hypotheses=1):
+def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypotheses=None, num_initial_hypotheses=1, journal=None):
     """
     Run a curses-based interactive hypothesis generation and refinement session.
     
@@ -4022,10 +5343,23 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
         research_goal (str): The research goal or question
         model_config (dict): Configuration for the model API
         initial_hypotheses (list, optional): Previously loaded hypotheses to continue from
+        journal (SessionJournal, optional): Journal that receives each hypothesis as it is added
         
     Returns:
         list: All hypotheses generated during the session (including refinements)
     """
+    def record_hypothesis(hypothesis):
+        """Add a hypothesis to the session and append it to the journal"""
+        all_hypotheses.append(hypothesis)
+        interface.index_hypothesis(hypothesis)
+        if journal:
+            journal.append(hypothesis)
+    
+    def journal_update(hypothesis):
+        """Re-journal a hypothesis edited in place (scores, notes, feedback history)"""
+        if journal:
+            journal.append(hypothesis)
+    
     # Initialize curses interface
     interface = CursesInterface(stdscr)
     
@@ -4033,23 +5367,17 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
     interface.draw_header(research_goal, model_config['model_name'])
     interface.header_win.refresh()  # Force refresh for startup
     interface.draw_status_bar("Initializing Wisteria interface...")
-    interface.status_win.refresh()  # Force refresh for startup
-    stdscr.refresh()
+    interface.flush_windows(interface.status_win)  # Force refresh for startup
     
     # Setup initial data
     if initial_hypotheses:
-        all_hypotheses = initial_hypotheses.copy()
+        all_hypotheses = []
+        for hyp in initial_hypotheses:
+            record_hypothesis(hyp)
         hypothesis_counter = max([h.get("hypothesis_number", 0) for h in all_hypotheses] + [0])
         # Rebuild version tracker
         version_tracker = {}
-        hypothesis_groups = {}
-        for hyp in all_hypotheses:
-            hyp_num = hyp.get("hypothesis_number", 0)
-            if hyp_num not in hypothesis_groups:
-                hypothesis_groups[hyp_num] = []
-            hypothesis_groups[hyp_num].append(hyp)
-        
-        for hyp_num, hyp_versions in hypothesis_groups.items():
+        for hyp_num, hyp_versions in interface._hyp_by_num.items():
             max_version = 0
             for hyp in hyp_versions:
                 version_str = hyp.get("version", "1.0")
@@ -4068,8 +5396,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
         
         # Show loading status for resumed session
         interface.draw_status_bar("Loading resumed session... Press any key when ready.")
-        interface.status_win.refresh()  # Force refresh for startup
-        stdscr.refresh()
+        interface.flush_windows(interface.status_win)  # Force refresh for startup
         
     else:
         all_hypotheses = []
@@ -4078,8 +5405,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
         
         # Show preparation status
         interface.draw_status_bar(f"Preparing to generate {num_initial_hypotheses} hypothesis{'es' if num_initial_hypotheses > 1 else ''}...")
-        interface.status_win.refresh()  # Force refresh for startup
-        stdscr.refresh()
+        interface.flush_windows(interface.status_win)  # Force refresh for startup
         
         # Generate initial hypotheses with progress display
         if num_initial_hypotheses == 1:
@@ -4109,8 +5435,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                     anim_char = animation_chars[animation_counter % len(animation_chars)]
                     working_msg = f"Generating initial hypothesis {anim_char} Working..."
                     interface.draw_status_bar(working_msg)
-                    interface.status_win.refresh()
-                    interface.stdscr.refresh()
+                    interface.flush_windows(interface.status_win)
                     time.sleep(0.3)  # Update animation every 300ms
                     animation_counter += 1
                 
@@ -4135,89 +5460,68 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                 stdscr.getch()
                 return []
         else:
-            # Generate hypotheses one by one to show progress
+            # Generate all hypotheses concurrently, showing progress as they complete
             initial_hypotheses = []
+            animation_chars = ['|', '/', '-', '\\']
+            completed_count = 0
+            generation_complete = False
+            generation_results = []
             
-            for i in range(num_initial_hypotheses):
-                # Update progress display with visual progress bar
-                progress_percent = (i / num_initial_hypotheses) * 100
+            def count_completed(done_count, total):
+                nonlocal completed_count
+                completed_count = done_count
+            
+            def generate_batch_with_progress():
+                nonlocal generation_complete, generation_results
+                try:
+                    generation_results = batch_chat_completions(
+                        [(generate_hypotheses, (research_goal, model_config), {"num_hypotheses": 1})
+                         for _ in range(num_initial_hypotheses)],
+                        on_complete=count_completed
+                    )
+                finally:
+                    generation_complete = True
+            
+            # Start generation in background thread
+            generation_thread = threading.Thread(target=generate_batch_with_progress)
+            generation_thread.start()
+            
+            # Animate progress while generation is running
+            animation_counter = 0
+            while not generation_complete:
+                done = completed_count
+                progress_percent = (done / num_initial_hypotheses) * 100
                 bar_length = 20
-                filled_length = int(bar_length * i // num_initial_hypotheses)
+                filled_length = int(bar_length * done // num_initial_hypotheses)
                 bar = '█' * filled_length + '░' * (bar_length - filled_length)
-                progress_msg = f"Generating hypothesis {i+1}/{num_initial_hypotheses} [{bar}] {progress_percent:.0f}%"
-                interface.draw_status_bar(progress_msg)
-                interface.stdscr.refresh()
-                
-                try:
-                    # Show animated "working" status during generation
-                    animation_chars = ['|', '/', '-', '\\']
-                    generation_complete = False
-                    generated_hypothesis = None
-                    generation_error = None
-                    
-                    def generate_with_progress():
-                        nonlocal generation_complete, generated_hypothesis, generation_error
-                        try:
-                            generated_hypothesis = generate_hypotheses(research_goal, model_config, num_hypotheses=1)
-                        except Exception as e:
-                            generation_error = e
-                        finally:
-                            generation_complete = True
-                    
-                    # Start generation in background thread
-                    generation_thread = threading.Thread(target=generate_with_progress)
-                    generation_thread.start()
-                    
-                    # Animate progress while generation is running
-                    animation_counter = 0
-                    while not generation_complete:
-                        anim_char = animation_chars[animation_counter % len(animation_chars)]
-                        working_msg = f"Generating hypothesis {i+1}/{num_initial_hypotheses} [{bar}] {anim_char} Working..."
-                        interface.draw_status_bar(working_msg)
-                        interface.status_win.refresh()
-                        interface.stdscr.refresh()
-                        time.sleep(0.3)  # Update animation every 300ms
-                        animation_counter += 1
-                    
-                    # Wait for thread to complete
-                    generation_thread.join()
-                    
-                    # Handle results
-                    if generation_error:
-                        raise generation_error
-                    
-                    single_hypothesis = generated_hypothesis
-                    
-                    if single_hypothesis and not single_hypothesis[0].get("error"):
-                        # Only take the first hypothesis from the list to avoid duplicates
-                        initial_hypotheses.append(single_hypothesis[0])
-                        # Show completion for this hypothesis
-                        completed_msg = f"Hypothesis {i+1}/{num_initial_hypotheses} completed! [{bar}]"
-                        interface.draw_status_bar(completed_msg)
-                        interface.stdscr.refresh()
-                        time.sleep(0.5)  # Brief pause to show completion
-                    elif single_hypothesis:
-                        # Log error but continue with other hypotheses
-                        error_msg = f"Error in hypothesis {i+1}: {single_hypothesis[0].get('error', 'Unknown error')}"
-                        interface.draw_status_bar(error_msg)
-                        interface.status_win.refresh()
-                        interface.stdscr.refresh()
-                        time.sleep(1)
-                    else:
-                        # Show error but continue with others
-                        error_msg = f"Error generating hypothesis {i+1}, continuing..."
-                        interface.draw_status_bar(error_msg)
-                        interface.status_win.refresh()
-                        interface.stdscr.refresh()
-                        time.sleep(1)  # Brief pause to show error
-                        
-                except Exception as e:
+                anim_char = animation_chars[animation_counter % len(animation_chars)]
+                working_msg = f"Generating hypotheses {done}/{num_initial_hypotheses} [{bar}] {progress_percent:.0f}% {anim_char} Working..."
+                interface.draw_status_bar(working_msg)
+                interface.flush_windows(interface.status_win)
+                time.sleep(0.3)  # Update animation every 300ms
+                animation_counter += 1
+            
+            # Wait for thread to complete
+            generation_thread.join()
+            
+            # Handle results in submission order
+            for i, single_hypothesis in enumerate(generation_results):
+                if isinstance(single_hypothesis, Exception):
                     # Show error but continue with others
-                    error_msg = f"Error on hypothesis {i+1}: {str(e)[:30]}"
-                    interface.draw_status_bar(error_msg)
-                    interface.status_win.refresh()
-                    interface.stdscr.refresh()
-                    time.sleep(1)  # Brief pause to show error
+                    error_msg = f"Error on hypothesis {i+1}: {str(single_hypothesis)[:30]}"
+                elif single_hypothesis and not single_hypothesis[0].get("error"):
+                    # Only take the first hypothesis from the list to avoid duplicates
+                    initial_hypotheses.append(single_hypothesis[0])
+                    continue
+                elif single_hypothesis:
+                    # Log error but continue with other hypotheses
+                    error_msg = f"Error in hypothesis {i+1}: {single_hypothesis[0].get('error', 'Unknown error')}"
+                else:
+                    error_msg = f"Error generating hypothesis {i+1}, continuing..."
+                
+                interface.draw_status_bar(error_msg)
+                interface.flush_windows(interface.status_win)
+                time.sleep(1)  # Brief pause to show error
         
         # Check if we got any valid hypotheses
         if not initial_hypotheses or all(h.get("error") for h in initial_hypotheses):
@@ -4249,7 +5553,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                 hypothesis["version"] = "1.0"
                 hypothesis["type"] = "original"
                 hypothesis["generation_timestamp"] = datetime.now().isoformat()
-                all_hypotheses.append(hypothesis)
+                record_hypothesis(hypothesis)
         
         if not all_hypotheses:
             interface.draw_status_bar("No valid hypotheses to display")
@@ -4305,17 +5609,12 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
         interface.draw_status_bar("Ready to explore - press any key for commands")
         
         # Refresh all windows
-        interface.header_win.refresh()
-        interface.list_win.refresh()
-        interface.detail_win.refresh()
-        interface.status_win.refresh()
-        stdscr.refresh()
+        interface.flush_windows(interface.header_win, interface.list_win, interface.detail_win, interface.status_win)
         
     except Exception as e:
         # If initial draw fails, show error but continue
         interface.draw_status_bar(f"Display error: {str(e)[:50]}")
-        interface.status_win.refresh()
-        stdscr.refresh()
+        interface.flush_windows(interface.status_win)
         time.sleep(3)  # Give time to see the error
     
     while True:
@@ -4328,21 +5627,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
             
             # Get current hypothesis
             if all_hypotheses and 0 <= interface.current_hypothesis_idx < len(all_hypotheses):
-                # Group hypotheses and get latest version of selected hypothesis
-                hypothesis_groups = {}
-                for hyp in all_hypotheses:
-                    hyp_num = hyp.get("hypothesis_number", 0)
-                    if hyp_num not in hypothesis_groups:
-                        hypothesis_groups[hyp_num] = []
-                    hypothesis_groups[hyp_num].append(hyp)
-                
-                sorted_nums = sorted(hypothesis_groups.keys())
-                if interface.current_hypothesis_idx < len(sorted_nums):
-                    selected_num = sorted_nums[interface.current_hypothesis_idx]
-                    hyp_versions = hypothesis_groups[selected_num]
-                    current_hypothesis = max(hyp_versions, key=lambda h: h.get("version", "1.0"))
-                else:
-                    current_hypothesis = None
+                # Latest version of the selected hypothesis, from the interface's index
+                current_hypothesis = interface.get_latest_hypothesis_at(interface.current_hypothesis_idx)
             else:
                 current_hypothesis = None
             
@@ -4353,14 +5639,11 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
             if waiting_for_feedback:
                 interface.draw_interface_selective(research_goal, model_config['model_name'], 
                                                  all_hypotheses, current_hypothesis, 
-                                                 f"Enter feedback: {feedback_input}")
+                                                 f"Enter feedback: {feedback_input}", persistent=True)
             else:
                 interface.draw_interface_selective(research_goal, model_config['model_name'], 
                                                  all_hypotheses, current_hypothesis)
             
-            # Single refresh for all windows
-            stdscr.refresh()
-            
             # Handle input
             try:
                 key = stdscr.getch()
@@ -4385,8 +5668,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             
                                             if improved_hypothesis.get("error"):
                                                 interface.draw_status_bar("Error improving hypothesis")
-                                                interface.status_win.refresh()
-                                                stdscr.refresh()
+                                                interface.flush_windows(interface.status_win)
                                             else:
                                                 # Add improved hypothesis
                                                 nonlocal hypothesis_counter, version_tracker
@@ -4408,12 +5690,13 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 }
                                                 feedback_history.append(feedback_entry)
                                                 improved_hypothesis["feedback_history"] = feedback_history
+                                                journal_update(current_hypothesis)
                                                 
                                                 # Copy notes from current hypothesis
                                                 improved_hypothesis["notes"] = current_hypothesis.get("notes", "")
                                                 
                                                 improved_hypothesis["generation_timestamp"] = datetime.now().isoformat()
-                                                all_hypotheses.append(improved_hypothesis)
+                                                record_hypothesis(improved_hypothesis)
                                                 interface.draw_status_bar("Hypothesis improved!")
                                                 interface.status_win.refresh()
                                                 # Force refresh of all panes to show updated hypothesis
@@ -4421,34 +5704,30 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 interface.dirty_details = True
                                                 interface.draw_hypothesis_list(all_hypotheses)
                                                 interface.draw_hypothesis_details(improved_hypothesis)
-                                                interface.list_win.refresh()
-                                                interface.detail_win.refresh()
-                                                stdscr.refresh()
+                                                interface.flush_windows(interface.list_win, interface.detail_win)
                                         else:
                                             # Task failed
                                             error_msg = str(task.error)[:50] if task.error else "Unknown error"
                                             interface.draw_status_bar(f"Error: {error_msg}")
-                                            interface.status_win.refresh()
-                                            stdscr.refresh()
+                                            interface.flush_windows(interface.status_win)
                                     except Exception as e:
                                         interface.draw_status_bar(f"Error: {str(e)[:50]}")
-                                        interface.status_win.refresh()
-                                        stdscr.refresh()
+                                        interface.flush_windows(interface.status_win)
                                 
                                 # Submit task to queue
-                                interface.task_queue.submit_task(
+                                interface.submit_generation(
                                     "Improve Hypothesis",
                                     improve_task,
-                                    priority=TaskPriority.HIGH,
                                     callback=improve_callback
                                 )
+                                # Replaces the persistent feedback prompt
+                                interface.set_status("Improving hypothesis...")
                                 
                                 feedback_input = ""
                             else:
                                 waiting_for_feedback = False
                                 interface.draw_status_bar("Feedback cancelled")
-                                interface.status_win.refresh()
-                                stdscr.refresh()
+                                interface.flush_windows(interface.status_win)
                                 feedback_input = ""
                                 
                         elif key == 27:  # ESC key
@@ -4465,8 +5744,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                         if key == ord('q') or key == ord('Q'):
                             # Debug: confirm q command is reached
                             interface.draw_status_bar("Quitting application...")
-                            interface.status_win.refresh()
-                            stdscr.refresh()
+                            interface.flush_windows(interface.status_win)
                             time.sleep(1)
                             break
                         elif key == curses.KEY_HOME or key == ord('g') or key == ord('G'):
@@ -4478,7 +5756,9 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             interface.current_hypothesis_idx = 0
                             interface.show_hallmarks = True
                             interface.show_references = True
-                            interface.mark_dirty("all")
+                            # Header is unchanged; set_status marks the status bar
+                            interface.mark_dirty("list")
+                            interface.mark_dirty("details")
                             interface.set_status("Returned to main display (Home)")
                             stdscr.refresh()
                         elif key == ord('f') or key == ord('F'):
@@ -4486,13 +5766,11 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             if current_hypothesis:
                                 waiting_for_feedback = True
                                 feedback_input = ""
-                                interface.draw_status_bar("Enter feedback (Enter to submit, ESC to cancel)")
-                                interface.status_win.refresh()
-                                stdscr.refresh()
+                                interface.draw_status_bar("Enter feedback (Enter to submit, ESC to cancel)", persistent=True)
+                                interface.flush_windows(interface.status_win)
                             else:
                                 interface.draw_status_bar("No hypothesis selected")
-                                interface.status_win.refresh()
-                                stdscr.refresh()
+                                interface.flush_windows(interface.status_win)
                         elif key == ord('n') or key == ord('N'):
                             interface.clear_status_on_action()
                             
@@ -4507,8 +5785,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         
                                         if new_hypothesis.get("error"):
                                             interface.draw_status_bar("Error generating new hypothesis")
-                                            interface.status_win.refresh()
-                                            stdscr.refresh()
+                                            interface.flush_windows(interface.status_win)
                                         else:
                                             nonlocal hypothesis_counter, version_tracker
                                             hypothesis_counter += 1
@@ -4517,7 +5794,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             new_hypothesis["version"] = "1.0"
                                             new_hypothesis["type"] = "new_alternative"
                                             new_hypothesis["generation_timestamp"] = datetime.now().isoformat()
-                                            all_hypotheses.append(new_hypothesis)
+                                            record_hypothesis(new_hypothesis)
                                             interface.current_hypothesis_idx = hypothesis_counter - 1
                                             
                                             interface.draw_status_bar("New hypothesis generated!")
@@ -4527,25 +5804,20 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             interface.dirty_details = True
                                             interface.draw_hypothesis_list(all_hypotheses)
                                             interface.draw_hypothesis_details(new_hypothesis)
-                                            interface.list_win.refresh()
-                                            interface.detail_win.refresh()
-                                            stdscr.refresh()
+                                            interface.flush_windows(interface.list_win, interface.detail_win)
                                     else:
                                         # Task failed
                                         error_msg = str(task.error)[:50] if task.error else "Unknown error"
                                         interface.draw_status_bar(f"Error: {error_msg}")
-                                        interface.status_win.refresh()
-                                        stdscr.refresh()
+                                        interface.flush_windows(interface.status_win)
                                 except Exception as e:
                                     interface.draw_status_bar(f"Error: {str(e)[:50]}")
-                                    interface.status_win.refresh()
-                                    stdscr.refresh()
+                                    interface.flush_windows(interface.status_win)
                             
                             # Submit task to queue
-                            interface.task_queue.submit_task(
+                            interface.submit_generation(
                                 "Generate New Hypothesis",
                                 generate_task,
-                                priority=TaskPriority.MEDIUM,
                                 callback=generate_callback
                             )
                                 
@@ -4558,8 +5830,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             # Force redraw of details pane to show/hide hallmarks
                             interface.dirty_details = True
                             interface.draw_hypothesis_details(current_hypothesis)
-                            interface.detail_win.refresh()
-                            stdscr.refresh()
+                            interface.flush_windows(interface.detail_win)
                             
                         elif key == ord('r') or key == ord('R'):
                             interface.clear_status_on_action()
@@ -4570,8 +5841,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             # Force redraw of details pane to show/hide references
                             interface.dirty_details = True
                             interface.draw_hypothesis_details(current_hypothesis)
-                            interface.detail_win.refresh()
-                            stdscr.refresh()
+                            interface.flush_windows(interface.detail_win)
                             
                         elif key == ord('u') or key == ord('U'):
                             # Update hypothesis with abstracts
@@ -4579,7 +5849,10 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             if current_hypothesis:
                                 # Update hypothesis using TaskQueue
                                 def update_task():
-                                    return update_hypothesis_with_abstracts(current_hypothesis, model_config)
+                                    return update_hypothesis_with_abstracts(
+                                        current_hypothesis, model_config,
+                                        on_progress=lambda n: interface.set_status(f"Updating hypothesis... {n} chunks received")
+                                    )
                                 
                                 def update_callback(task):
                                     try:
@@ -4593,9 +5866,6 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 nonlocal hypothesis_counter, version_tracker
                                                 hypothesis_number = current_hypothesis["hypothesis_number"]
                                                 
-                                                # The update function already increments the version
-                                                all_hypotheses.append(updated_hypothesis)
-                                                
                                                 # Update version tracker
                                                 current_version = updated_hypothesis.get('version', '1.1')
                                                 try:
@@ -4611,6 +5881,9 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 updated_hypothesis["type"] = "improvement"
                                                 updated_hypothesis["original_hypothesis_id"] = hypothesis_number
                                                 
+                                                # The update function already increments the version
+                                                record_hypothesis(updated_hypothesis)
+                                                
                                                 interface.set_status(f"Hypothesis updated with {updated_hypothesis.get('abstracts_used', 0)} abstracts!")
                                                 
                                                 # Force refresh of all panes
@@ -4618,9 +5891,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 interface.dirty_details = True
                                                 interface.draw_hypothesis_list(all_hypotheses)
                                                 interface.draw_hypothesis_details(updated_hypothesis)
-                                                interface.list_win.refresh()
-                                                interface.detail_win.refresh()
-                                                stdscr.refresh()
+                                                interface.flush_windows(interface.list_win, interface.detail_win)
                                         else:
                                             # Task failed
                                             error_msg = str(task.error)[:50] if task.error else "Unknown error"
@@ -4629,10 +5900,9 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         interface.set_status(f"Update error: {str(e)[:50]}")
                                 
                                 # Submit task to queue
-                                interface.task_queue.submit_task(
+                                interface.submit_generation(
                                     "Update with Abstracts",
                                     update_task,
-                                    priority=TaskPriority.HIGH,
                                     callback=update_callback
                                 )
                             else:
@@ -4644,7 +5914,10 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             if current_hypothesis:
                                 # Score hypothesis using TaskQueue
                                 def score_task():
-                                    return score_hypothesis_hallmarks(current_hypothesis, model_config)
+                                    return score_hypothesis_hallmarks(
+                                        current_hypothesis, model_config,
+                                        on_progress=lambda n: interface.set_status(f"Scoring hypothesis... {n} chunks received")
+                                    )
                                 
                                 def score_callback(task):
                                     try:
@@ -4662,6 +5935,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 for hyp in all_hypotheses:
                                                     if hyp.get("hypothesis_number") == hyp_num:
                                                         hyp["hallmark_scores"] = scoring_result
+                                                        journal_update(hyp)
+                                                interface.invalidate_list_index()
                                                 
                                                 # Display the results briefly
                                                 interface.set_status(f"Hallmarks scored! Total: {total_score}/25")
@@ -4671,9 +5946,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                 interface.dirty_details = True
                                                 interface.draw_hypothesis_list(all_hypotheses)
                                                 interface.draw_hypothesis_details(current_hypothesis)
-                                                interface.list_win.refresh()
-                                                interface.detail_win.refresh()
-                                                stdscr.refresh()
+                                                interface.flush_windows(interface.list_win, interface.detail_win)
                                         else:
                                             # Task failed
                                             error_msg = str(task.error)[:50] if task.error else "Unknown error"
@@ -4682,10 +5955,9 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         interface.set_status(f"Scoring error: {str(e)[:50]}")
                                 
                                 # Submit task to queue
-                                interface.task_queue.submit_task(
+                                interface.submit_scoring(
                                     "Score Hypothesis",
                                     score_task,
-                                    priority=TaskPriority.MEDIUM,
                                     callback=score_callback
                                 )
                             else:
@@ -4697,19 +5969,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             if not all_hypotheses:
                                 interface.set_status("No hypotheses available for batch scoring")
                             else:
-                                # Get unique hypothesis numbers
-                                hypothesis_groups = {}
-                                for hyp in all_hypotheses:
-                                    hyp_num = hyp.get("hypothesis_number", 0)
-                                    if hyp_num not in hypothesis_groups:
-                                        hypothesis_groups[hyp_num] = []
-                                    hypothesis_groups[hyp_num].append(hyp)
-                                
                                 # Get latest version of each hypothesis for scoring
-                                hypotheses_to_score = []
-                                for hyp_num, hyp_versions in hypothesis_groups.items():
-                                    latest_version = max(hyp_versions, key=lambda h: h.get("version", "1.0"))
-                                    hypotheses_to_score.append(latest_version)
+                                hypotheses_to_score = list(interface._latest_by_num.values())
                                 
                                 # Show progress operation
                                 operation_id = f"batch_score_{time.time()}"
@@ -4722,19 +5983,25 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         scored_count = 0
                                         total_count = len(hypotheses_to_score)
                                         
-                                        for i, hyp_to_score in enumerate(hypotheses_to_score):
-                                            # Update progress
-                                            interface.update_progress_operation(operation_id, i + 1, f"Scoring hypothesis {i+1}/{total_count}")
-                                            
-                                            scoring_result = score_hypothesis_hallmarks(hyp_to_score, model_config)
-                                            
-                                            if "error" not in scoring_result:
+                                        def report_progress(done_count, total):
+                                            interface.update_progress_operation(operation_id, done_count, f"Scored {done_count}/{total} hypotheses")
+                                        
+                                        scoring_results = batch_chat_completions(
+                                            [(score_hypothesis_hallmarks, (hyp_to_score, model_config), {})
+                                             for hyp_to_score in hypotheses_to_score],
+                                            on_complete=report_progress
+                                        )
+                                        
+                                        for hyp_to_score, scoring_result in zip(hypotheses_to_score, scoring_results):
+                                            if isinstance(scoring_result, dict) and "error" not in scoring_result:
                                                 # Store scoring results in all versions of this hypothesis
                                                 hyp_num = hyp_to_score.get("hypothesis_number", 0)
                                                 for hyp in all_hypotheses:
                                                     if hyp.get("hypothesis_number") == hyp_num:
                                                         hyp["hallmark_scores"] = scoring_result
+                                                        journal_update(hyp)
                                                 scored_count += 1
+                                        interface.invalidate_list_index()
                                         
                                         interface.remove_progress_operation(operation_id)
                                         interface.set_status(f"Batch scoring complete! Scored {scored_count}/{total_count} hypotheses")
@@ -4745,9 +6012,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         interface.draw_hypothesis_list(all_hypotheses)
                                         if current_hypothesis:
                                             interface.draw_hypothesis_details(current_hypothesis)
-                                        interface.list_win.refresh()
-                                        interface.detail_win.refresh()
-                                        stdscr.refresh()
+                                        interface.flush_windows(interface.list_win, interface.detail_win)
                                         
                                     except Exception as e:
                                         interface.remove_progress_operation(operation_id)
@@ -4781,7 +6046,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                 model_name = model_config.get('model_name', 'unknown_model')
                                 session_name = f"papers_{model_name}_{timestamp}"
                                 
-                                # Fetch papers using TaskQueue
+                                # Fetch papers using TaskQueue's I/O pool, so a long fetch never
+                                # holds one of the three workers that scoring and generation use
                                 def fetch_task():
                                     return fetch_papers_for_hypothesis(current_hypothesis, session_name, interface)
                                 
@@ -4810,29 +6076,25 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         
                                         # Force a refresh to show the result
                                         interface.draw_status_bar()
-                                        interface.status_win.refresh()
-                                        stdscr.refresh()
+                                        interface.flush_windows(interface.status_win)
                                     except Exception as e:
                                         interface.set_status(f"Error: {str(e)[:50]}")
                                         interface.draw_status_bar()
-                                        interface.status_win.refresh()
-                                        stdscr.refresh()
+                                        interface.flush_windows(interface.status_win)
                                 
                                 # Submit task to queue
-                                interface.task_queue.submit_task(
+                                interface.submit_background_fetch(
                                     "Fetch Papers",
                                     fetch_task,
-                                    priority=TaskPriority.LOW,
                                     callback=fetch_callback
                                 )
                             else:
                                 interface.draw_status_bar("No hypothesis selected")
-                                interface.status_win.refresh()
-                                stdscr.refresh()
+                                interface.flush_windows(interface.status_win)
                             
                         elif key == ord('l') or key == ord('L'):
                             # Load session - prompt for filename
-                            interface.draw_status_bar("Enter filename to load (ESC to cancel):")
+                            interface.draw_status_bar("Enter filename to load (ESC to cancel):", persistent=True)
                             stdscr.refresh()
                             
                             # Get filename input
@@ -4860,7 +6122,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                                     # Ensure feedback_history is present
                                                     if "feedback_history" not in hyp:
                                                         hyp["feedback_history"] = []
-                                                    all_hypotheses.append(hyp)
+                                                    record_hypothesis(hyp)
                                             
                                             # Update research goal if it was loaded
                                             if loaded_goal and loaded_goal.strip():
@@ -4869,14 +6131,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             # Rebuild hypothesis counter and version tracker
                                             hypothesis_counter = max([h.get("hypothesis_number", 0) for h in all_hypotheses] + [0])
                                             version_tracker = {}
-                                            hypothesis_groups = {}
-                                            for hyp in all_hypotheses:
-                                                hyp_num = hyp.get("hypothesis_number", 0)
-                                                if hyp_num not in hypothesis_groups:
-                                                    hypothesis_groups[hyp_num] = []
-                                                hypothesis_groups[hyp_num].append(hyp)
-                                            
-                                            for hyp_num, hyp_versions in hypothesis_groups.items():
+                                            for hyp_num, hyp_versions in interface._hyp_by_num.items():
                                                 max_version = 0
                                                 for hyp in hyp_versions:
                                                     version_str = hyp.get("version", "1.0")
@@ -4903,16 +6158,16 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                 elif key_load == curses.KEY_BACKSPACE or key_load == 127 or key_load == 8:
                                     if filename_input:
                                         filename_input = filename_input[:-1]
-                                        interface.draw_status_bar(f"Enter filename: {filename_input}")
+                                        interface.draw_status_bar(f"Enter filename: {filename_input}", persistent=True)
                                         stdscr.refresh()
                                 elif 32 <= key_load <= 126:  # Printable characters
                                     filename_input += chr(key_load)
-                                    interface.draw_status_bar(f"Enter filename: {filename_input}")
+                                    interface.draw_status_bar(f"Enter filename: {filename_input}", persistent=True)
                                     stdscr.refresh()
                             
                         elif key == ord('x') or key == ord('X'):
                             # Save session - prompt for filename
-                            interface.draw_status_bar("Enter filename to save (ESC to cancel):")
+                            interface.draw_status_bar("Enter filename to save (ESC to cancel):", persistent=True)
                             stdscr.refresh()
                             
                             # Get filename input
@@ -4969,11 +6224,11 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                 elif key_save == curses.KEY_BACKSPACE or key_save == 127 or key_save == 8:
                                     if filename_input:
                                         filename_input = filename_input[:-1]
-                                        interface.draw_status_bar(f"Enter filename: {filename_input}")
+                                        interface.draw_status_bar(f"Enter filename: {filename_input}", persistent=True)
                                         stdscr.refresh()
                                 elif 32 <= key_save <= 126:  # Printable characters
                                     filename_input += chr(key_save)
-                                    interface.draw_status_bar(f"Enter filename: {filename_input}")
+                                    interface.draw_status_bar(f"Enter filename: {filename_input}", persistent=True)
                                     stdscr.refresh()
                             
                         elif key == ord('t') or key == ord('T'):
@@ -4981,7 +6236,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             interface.clear_status_on_action()
                             if current_hypothesis:
                                 current_notes = current_hypothesis.get("notes", "")
-                                interface.draw_status_bar("Enter notes (Enter to save, ESC to cancel):")
+                                interface.draw_status_bar("Enter notes (Enter to save, ESC to cancel):", persistent=True)
                                 stdscr.refresh()
                                 
                                 # Get notes input
@@ -4991,9 +6246,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                 while notes_editing:
                                     # Show current input
                                     display_input = notes_input if len(notes_input) <= 60 else "..." + notes_input[-57:]
-                                    interface.draw_status_bar(f"Notes: {display_input}")
-                                    interface.status_win.refresh()
-                                    stdscr.refresh()
+                                    interface.draw_status_bar(f"Notes: {display_input}", persistent=True)
+                                    interface.flush_windows(interface.status_win)
                                     
                                     key_notes = stdscr.getch()
                                     if key_notes == 27:  # ESC
@@ -5005,10 +6259,10 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         for hyp in all_hypotheses:
                                             if hyp.get("hypothesis_number") == hyp_num:
                                                 hyp["notes"] = notes_input.strip()
+                                                journal_update(hyp)
                                         
                                         interface.draw_status_bar(f"Notes saved for hypothesis #{hyp_num}")
-                                        interface.status_win.refresh()
-                                        stdscr.refresh()
+                                        interface.flush_windows(interface.status_win)
                                         notes_editing = False
                                     elif key_notes == curses.KEY_BACKSPACE or key_notes == 127 or key_notes == 8:
                                         if notes_input:
@@ -5017,8 +6271,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                         notes_input += chr(key_notes)
                             else:
                                 interface.draw_status_bar("No hypothesis selected for notes")
-                                interface.status_win.refresh()
-                                stdscr.refresh()
+                                interface.flush_windows(interface.status_win)
                             
                         elif key == ord('s') or key == ord('S'):
                             # Select hypothesis - prompt for hypothesis number
@@ -5026,13 +6279,9 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                 interface.set_status("No hypotheses available to select")
                             else:
                                 # Get available hypothesis numbers
-                                hypothesis_groups = {}
-                                for hyp in all_hypotheses:
-                                    hyp_num = hyp.get("hypothesis_number", 0)
-                                    hypothesis_groups[hyp_num] = True
-                                available_numbers = sorted(hypothesis_groups.keys())
+                                available_numbers = sorted(interface._hyp_by_num)
                                 
-                                interface.draw_status_bar(f"Enter hypothesis number ({min(available_numbers)}-{max(available_numbers)}, ESC to cancel):")
+                                interface.draw_status_bar(f"Enter hypothesis number ({min(available_numbers)}-{max(available_numbers)}, ESC to cancel):", persistent=True)
                                 stdscr.refresh()
                                 
                                 # Get hypothesis number input
@@ -5049,15 +6298,6 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             try:
                                                 selected_num = int(number_input.strip())
                                                 if selected_num in available_numbers:
-                                                    # Find the latest version of the selected hypothesis
-                                                    hypothesis_groups = {}
-                                                    for hyp in all_hypotheses:
-                                                        hyp_num = hyp.get("hypothesis_number", 0)
-                                                        if hyp_num not in hypothesis_groups:
-                                                            hypothesis_groups[hyp_num] = []
-                                                        hypothesis_groups[hyp_num].append(hyp)
-                                                    
-                                                    latest_version = max(hypothesis_groups[selected_num], key=lambda h: h.get("version", "1.0"))
                                                     interface.current_hypothesis_idx = selected_num - 1
                                                     interface.detail_scroll_offset = 0  # Reset scroll
                                                     interface.set_status(f"Selected hypothesis #{selected_num} for review/refinement")
@@ -5071,11 +6311,11 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                     elif key_select == curses.KEY_BACKSPACE or key_select == 127 or key_select == 8:
                                         if number_input:
                                             number_input = number_input[:-1]
-                                            interface.draw_status_bar(f"Enter hypothesis number: {number_input}")
+                                            interface.draw_status_bar(f"Enter hypothesis number: {number_input}", persistent=True)
                                             stdscr.refresh()
                                     elif ord('0') <= key_select <= ord('9'):  # Only allow digits
                                         number_input += chr(key_select)
-                                        interface.draw_status_bar(f"Enter hypothesis number: {number_input}")
+                                        interface.draw_status_bar(f"Enter hypothesis number: {number_input}", persistent=True)
                                         stdscr.refresh()
                                         
                         elif key == ord('o') or key == ord('O'):
@@ -5086,8 +6326,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             # Force refresh of hypothesis list
                             interface.dirty_list = True
                             interface.draw_hypothesis_list(all_hypotheses)
-                            interface.list_win.refresh()
-                            stdscr.refresh()
+                            interface.flush_windows(interface.list_win)
                             
                         elif key == ord('1'):
                             # Sort hypothesis list by numerical order (default)
@@ -5097,8 +6336,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             # Force refresh of hypothesis list
                             interface.dirty_list = True
                             interface.draw_hypothesis_list(all_hypotheses)
-                            interface.list_win.refresh()
-                            stdscr.refresh()
+                            interface.flush_windows(interface.list_win)
                             
                         elif key == ord('g') or key == ord('G'):
                             # Generate revised hypothesis version from current one
@@ -5142,11 +6380,12 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             }
                                             feedback_history.append(revision_entry)
                                             revised_hypothesis["feedback_history"] = feedback_history
+                                            journal_update(current_hypothesis)
                                             
                                             # Copy notes from current hypothesis
                                             revised_hypothesis["notes"] = current_hypothesis.get("notes", "")
                                             
-                                            all_hypotheses.append(revised_hypothesis)
+                                            record_hypothesis(revised_hypothesis)
                                             interface.set_status("Revised hypothesis generated!")
                                             
                                             # Force refresh of all panes to show revised hypothesis
@@ -5154,9 +6393,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                             interface.dirty_details = True
                                             interface.draw_hypothesis_list(all_hypotheses)
                                             interface.draw_hypothesis_details(revised_hypothesis)
-                                            interface.list_win.refresh()
-                                            interface.detail_win.refresh()
-                                            stdscr.refresh()
+                                            interface.flush_windows(interface.list_win, interface.detail_win)
                                             
                                     except Exception as e:
                                         interface.remove_progress_operation(operation_id)
@@ -5174,13 +6411,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                             if not all_hypotheses:
                                 interface.set_status("No hypotheses available to view")
                             else:
-                                # Group hypotheses by number
-                                hypothesis_groups = {}
-                                for hyp in all_hypotheses:
-                                    hyp_num = hyp.get("hypothesis_number", 0)
-                                    if hyp_num not in hypothesis_groups:
-                                        hypothesis_groups[hyp_num] = []
-                                    hypothesis_groups[hyp_num].append(hyp)
+                                # Latest version per hypothesis number
+                                latest_by_num = interface._latest_by_num
                                 
                                 # Create a temporary view mode
                                 view_mode = True
@@ -5200,15 +6432,14 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                     y_pos = 4
                                     line_count = 0
                                     
-                                    for hyp_num in sorted(hypothesis_groups.keys()):
+                                    for hyp_num in sorted(latest_by_num):
                                         if line_count < view_scroll:
                                             line_count += 1
                                             continue
                                         if y_pos >= interface.height - 3:
                                             break
                                             
-                                        hyp_versions = hypothesis_groups[hyp_num]
-                                        latest_version = max(hyp_versions, key=lambda h: h.get("version", "1.0"))
+                                        latest_version = latest_by_num[hyp_num]
                                         
                                         version = latest_version.get("version", "1.0")
                                         title = latest_version.get("title", "Untitled")
@@ -5232,7 +6463,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                     
                                     # Footer
                                     if y_pos < interface.height - 1:
-                                        total_hypotheses = len(hypothesis_groups)
+                                        total_hypotheses = len(latest_by_num)
                                         footer = f"Showing {min(line_count, max_display_lines)} of {total_hypotheses} hypotheses"
                                         interface.safe_addstr(stdscr, interface.height - 2, 2, footer)
                                     
@@ -5243,6 +6474,8 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                                     if key_view != -1:  # Any key pressed
                                         view_mode = False
                                 
+                                # The titles view drew over every pane
+                                interface.mark_dirty("all")
                                 interface.set_status("Returned from hypothesis titles view")
                             
                         elif key == curses.KEY_UP:
@@ -5256,11 +6489,7 @@ def curses_hypothesis_session(stdscr, research_goal, model_config, initial_hypot
                         elif key == curses.KEY_DOWN:
                             interface.clear_status_on_action()
                             # Count unique hypotheses
-                            hypothesis_groups = {}
-                            for hyp in all_hypotheses:
-                                hyp_num = hyp.get("hypothesis_number", 0)
-                                hypothesis_groups[hyp_num] = True
-                            max_idx = len(hypothesis_groups) - 1
+                            max_idx = len(interface._hyp_by_num) - 1
                             
                             if interface.current_hypothesis_idx < max_idx:
                                 interface.current_hypothesis_idx += 1
@@ -5436,6 +6665,51 @@ def test_feedback_tracking():
 # Main function
 # ---------------------------------------------------------------------
 
+def run_batch_generation(research_goal, model_config, args, goal_source):
+    """Generate the initial hypotheses through the Batch API and save them without the curses interface"""
+    print(f"\nSubmitting {args.num_hypotheses} hypothesis request{'s' if args.num_hypotheses != 1 else ''} as a batch using {args.model}...")
+    print("Batches complete within 24 hours; this will wait and poll until the results are ready.")
+    
+    start_time = time.time()
+    hypotheses = generate_hypotheses_batch(research_goal, model_config, args.num_hypotheses)
+    if not hypotheses:
+        print("No hypotheses were generated. Exiting.")
+        sys.exit(1)
+    
+    for i, hypothesis in enumerate(hypotheses, 1):
+        hypothesis["hypothesis_number"] = i
+        hypothesis["version"] = "1.0"
+        hypothesis["type"] = "original"
+        hypothesis["generation_timestamp"] = datetime.now().isoformat()
+    
+    if not args.output:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"hypotheses_batch_{args.model}_{timestamp}.json"
+    else:
+        output_file = args.output
+    
+    metadata = {
+        "session_type": "batch",
+        "research_goal_source": goal_source,
+        "research_goal": research_goal,
+        "model": args.model,
+        "model_name": model_config['model_name'],
+        "num_unique_hypotheses": len(hypotheses),
+        "total_hypothesis_versions": len(hypotheses),
+        "timestamp": datetime.now().isoformat(),
+        "session_time_seconds": time.time() - start_time,
+        "hypothesis_types": {
+            "original": len(hypotheses),
+            "improvements": 0,
+            "new_alternatives": 0
+        }
+    }
+    save_hypotheses_to_json(hypotheses, output_file, metadata)
+    
+    print(f"\nGenerated {len(hypotheses)}/{args.num_hypotheses} hypotheses")
+    print(f"Saved to: {output_file}")
+    print(f"Continue refining them with: --resume {output_file} --model {args.model}")
+
 def main():
     args = parse_arguments()
     
@@ -5451,6 +6725,7 @@ def main():
     
     # Load model config
     model_config = load_model_config(args.model, args.config)
+    configure_llm_cache(enabled=not args.no_cache, nondeterministic=args.cache_nondeterministic)
     
     print(f"Wisteria Research Hypothesis Generator v6.0 - Curses Multi-Pane Interface")
     print(f"Using model: {args.model} ({model_config['model_name']})")
@@ -5492,6 +6767,13 @@ def main():
     print(f"\nResearch Goal:")
     print(f"{research_goal}")
     
+    if args.batch:
+        if initial_hypotheses:
+            print("Error: --batch cannot be combined with --resume")
+            sys.exit(1)
+        run_batch_generation(research_goal, model_config, args, goal_source)
+        return
+    
     # Show generation message if not resuming
     if not initial_hypotheses:
         if args.num_hypotheses == 1:
@@ -5499,17 +6781,38 @@ def main():
             print("This may take a moment depending on the model and complexity...")
         else:
             print(f"\nGenerating {args.num_hypotheses} initial hypotheses using {args.model}...")
-            print("Each hypothesis will be generated individually to show progress...")
+            print("Hypotheses will be generated concurrently with progress shown as each completes...")
             print("This may take several minutes depending on the model and complexity...")
     
+    # Prepare output file
+    if not args.output:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_file = f"hypotheses_interactive_{args.model}_{timestamp}.json"
+    else:
+        output_file = args.output
+    
+    # Journal each hypothesis as it is produced so an interrupted session can be recovered
+    journal = SessionJournal(
+        os.path.splitext(output_file)[0] + ".jsonl",
+        metadata={
+            "session_type": "interactive",
+            "research_goal": research_goal,
+            "model": args.model,
+            "model_name": model_config['model_name'],
+            "timestamp": datetime.now().isoformat()
+        }
+    )
+    
     # Run curses session
     start_time = time.time()
     try:
-        all_hypotheses = curses.wrapper(curses_hypothesis_session, research_goal, model_config, initial_hypotheses, args.num_hypotheses)
+        all_hypotheses = curses.wrapper(curses_hypothesis_session, research_goal, model_config, initial_hypotheses, args.num_hypotheses, journal)
     except KeyboardInterrupt:
         print("\n\nSession interrupted by user. Saving current hypotheses...")
-        all_hypotheses = []
+        journal.close()
+        all_hypotheses = SessionJournal.load(journal.path)
     except Exception as e:
+        journal.close()
         print(f"Failed to run curses session: {e}")
         print(f"This might be due to terminal size or encoding issues.")
         print(f"Try running in a larger terminal window or check your terminal settings.")
@@ -5519,16 +6822,10 @@ def main():
     session_time = time.time() - start_time
     
     if not all_hypotheses:
+        journal.discard()
         print("No hypotheses were generated. Exiting.")
         sys.exit(0)
     
-    # Prepare output file
-    if not args.output:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"hypotheses_interactive_{args.model}_{timestamp}.json"
-    else:
-        output_file = args.output
-    
     # Count unique hypotheses (not counting improvements of the same hypothesis)
     unique_hypothesis_numbers = set()
     for hyp in all_hypotheses:
@@ -5552,8 +6849,9 @@ def main():
         }
     }
     
-    # Save to JSON file
+    # Save to JSON file; the journal is only needed until the full save succeeds
     save_hypotheses_to_json(all_hypotheses, output_file, metadata)
+    journal.discard()
     
     print(f"\nSession completed in {session_time:.2f} seconds")
     print(f"Generated {len(unique_hypothesis_numbers)} unique hypotheses with {len(all_hypotheses)} total versions")